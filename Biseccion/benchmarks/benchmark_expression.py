@@ -0,0 +1,100 @@
+"""
+Benchmark de evaluación de expresiones: función original (eval del texto y
+diccionario de nombres en cada llamada) contra la función compilada una sola
+vez de BiseccionSolver.create_function_from_expression y su versión
+vectorizada con NumPy (func.vectorized, todos los puntos en una llamada)
+
+Uso (desde la carpeta Biseccion):
+    python benchmarks/benchmark_expression.py
+    python benchmarks/benchmark_expression.py --evaluations 200000 --vectorized-evaluations 10000000
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from solver.biseccion import BiseccionSolver  # noqa: E402
+from solver.expression import MATH_NAMESPACE, normalize_expression  # noqa: E402
+
+
+EXPRESSIONS = [
+    "x^3 - 2*x - 5",
+    "exp(-x) - x",
+    "cos(x) - x",
+    "x*sen(x) - ln(x + 2) + sqrt(x^2 + 1)",
+]
+
+
+def legacy_function(expression: str):
+    """Función original: analiza el texto y arma el namespace en cada evaluación"""
+    expression = normalize_expression(expression)
+
+    def func(x):
+        if x is None:
+            raise ValueError("El valor de x no puede ser None")
+        if not isinstance(x, (int, float)):
+            x = float(x)
+        if not math.isfinite(x):
+            raise ValueError(f"El valor de x debe ser finito, recibido: {x}")
+        namespace = {'x': float(x), **MATH_NAMESPACE}
+        if not expression or not expression.strip():
+            raise ValueError("La expresión no puede estar vacía")
+        result = eval(expression, {"__builtins__": {}}, namespace)
+        if not isinstance(result, (int, float)):
+            result = float(result)
+        if not math.isfinite(result):
+            raise ValueError(f"La función retornó un valor no finito: {result} para x = {x}")
+        return float(result)
+
+    return func
+
+
+def evaluations_per_second(func, evaluations: int) -> float:
+    """Evalúa la función en `evaluations` puntos de [0.1, 3] y retorna evaluaciones por segundo"""
+    points = [0.1 + 2.9 * k / evaluations for k in range(evaluations)]
+    start = time.perf_counter()
+    for x in points:
+        func(x)
+    return evaluations / (time.perf_counter() - start)
+
+
+def vectorized_evaluations_per_second(func, evaluations: int) -> float:
+    """Evalúa func.vectorized en los mismos puntos con una sola llamada"""
+    points = np.linspace(0.1, 3.0, evaluations, endpoint=False)
+    start = time.perf_counter()
+    func.vectorized(points)
+    return evaluations / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--evaluations", type=int, default=100000)
+    parser.add_argument("--vectorized-evaluations", type=int, default=1000000,
+                        help="puntos evaluados en una sola llamada por la versión vectorizada")
+    args = parser.parse_args()
+
+    solver = BiseccionSolver()
+    print(f"{'expresión':<40} {'original (eval/s)':>18} {'compilada (eval/s)':>19} {'aceleración':>12} "
+          f"{'numpy (eval/s)':>16} {'aceleración':>12}")
+    for expression in EXPRESSIONS:
+        legacy = legacy_function(expression)
+        compiled = solver.create_function_from_expression(expression)
+        # Las tres versiones deben dar el mismo valor
+        assert legacy(1.3) == compiled(1.3)
+        assert math.isclose(compiled.vectorized([1.3])[0][0], compiled(1.3), rel_tol=1e-12)
+
+        before = evaluations_per_second(legacy, args.evaluations)
+        after = evaluations_per_second(compiled, args.evaluations)
+        vectorized = vectorized_evaluations_per_second(compiled, args.vectorized_evaluations)
+        print(f"{expression:<40} {before:>18,.0f} {after:>19,.0f} {after / before:>11.1f}x "
+              f"{vectorized:>16,.0f} {vectorized / before:>11.0f}x")
+
+
+if __name__ == "__main__":
+    main()
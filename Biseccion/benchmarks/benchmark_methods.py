@@ -0,0 +1,53 @@
+"""
+Benchmark de métodos de intervalo: evaluaciones de f que necesitan bisección,
+Brent, Illinois e ITP para llegar a la misma tolerancia
+
+Uso (desde la carpeta Biseccion):
+    python benchmarks/benchmark_methods.py
+    python benchmarks/benchmark_methods.py --tolerance 1e-4
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from solver.bracketing import METHODS  # noqa: E402
+
+
+# (expresión, xl, xu)
+CASES = [
+    ("x^3 - 2*x - 5", 2.0, 3.0),
+    ("exp(-x) - x", 0.0, 1.0),
+    ("cos(x) - x", 0.0, 1.0),
+    ("log(x) - 1", 1.0, 4.0),
+    ("x^10 - 1", 0.0, 1.3),
+    ("tanh(x - 0.3)", -5.0, 10.0),
+    ("exp(x) - 1e6", 0.0, 20.0),
+    ("(x - 1)^3", 0.0, 3.0),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tolerance", type=float, default=0.000001, help="tolerancia relativa en porcentaje")
+    args = parser.parse_args()
+
+    print(f"{'expresión':<18}" + "".join(f"{name:>12}" for name in METHODS) + "   (evaluaciones de f)")
+    totals = dict.fromkeys(METHODS, 0)
+    for expression, xl, xu in CASES:
+        row = f"{expression:<18}"
+        for name, solver_class in METHODS.items():
+            solver = solver_class()
+            solver.tolerance = args.tolerance
+            result = solver.solve(solver.create_function_from_expression(expression), xl, xu)
+            totals[name] += result['function_evaluations']
+            mark = "" if result['converged'] else "*"
+            row += f"{str(result['function_evaluations']) + mark:>12}"
+        print(row)
+    print(f"{'total':<18}" + "".join(f"{totals[name]:>12}" for name in METHODS))
+
+
+if __name__ == "__main__":
+    main()
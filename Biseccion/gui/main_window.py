@@ -9,6 +9,7 @@ from .components import (
     IntervalInputPanel, VisualizationPanel
 )
 from solver.biseccion import BiseccionSolver
+from solver.bracketing import METHODS
 
 
 class BiseccionApp(ctk.CTk):
@@ -186,6 +187,27 @@ class BiseccionApp(ctk.CTk):
         )
         config_title.pack(pady=(15, 20))
 
+        # Selección del método de intervalo
+        method_frame = ctk.CTkFrame(solver_config_frame)
+        method_frame.pack(fill="x", padx=15, pady=10)
+
+        # Etiqueta para el método
+        ctk.CTkLabel(
+            method_frame,
+            text="Método:",
+            font=ctk.CTkFont(size=12, weight="bold")
+        ).pack(pady=(10, 5))
+
+        # Menú con los métodos disponibles (todos conservan el intervalo con cambio de signo)
+        self.method_var = tk.StringVar(value="Bisección")
+        self.method_menu = ctk.CTkOptionMenu(
+            method_frame,
+            variable=self.method_var,
+            values=list(METHODS),
+            width=160
+        )
+        self.method_menu.pack(pady=(0, 10))
+
         # Configuración de tolerancia
         tol_frame = ctk.CTkFrame(solver_config_frame)
         tol_frame.pack(fill="x", padx=15, pady=10)
@@ -404,6 +426,8 @@ class BiseccionApp(ctk.CTk):
 
             # Configurar parámetros del solver
             try:
+                # Crear el solver del método seleccionado
+                self.solver = METHODS[self.method_var.get()]()
                 # Configurar tolerancia
                 self.solver.tolerance = float(self.tolerance_var.get())
                 # Configurar máximo número de iteraciones
@@ -454,7 +478,11 @@ class BiseccionApp(ctk.CTk):
                     if result_step.get('converged'):
                         root = result_step.get('solution')
                         iterations = result_step.get('iterations')
-                        self.update_status(f"Ecuación resuelta: raíz ≈ {root:.6f} en {iterations} iteraciones")
+                        evaluations = result_step.get('function_evaluations')
+                        self.update_status(
+                            f"Ecuación resuelta: raíz ≈ {root:.6f} en {iterations} iteraciones "
+                            f"({evaluations} evaluaciones de f)"
+                        )
                     else:
                         self.update_status("Proceso completado (convergencia no alcanzada)", is_warning=True)
                 else:
@@ -1,10 +1,16 @@
 import numpy as np
 import math
-from typing import List, Dict, Callable
+from typing import List, Dict, Callable, Optional, Tuple
+
+from solver.expression import compile_scalar, compile_vectorized, normalize_expression
 
 
 class BiseccionSolver:
 
+    # Nombre y descripción del método (para la explicación paso a paso)
+    METHOD_TITLE = 'Método de Bisección'
+    METHOD_DESCRIPTION = 'El método divide el intervalo por la mitad y selecciona el subintervalo que contiene la raíz'
+
     def __init__(self):
         # Historial de todas las iteraciones del proceso
         self.iteration_history = []
@@ -31,6 +37,18 @@ class BiseccionSolver:
         except TypeError:
             raise ValueError("Error en evaluación de función en extremos del intervalo")
 
+        # Los extremos deben estar definidos (sus valores se reutilizan en todas las iteraciones)
+        try:
+            if not math.isfinite(f_xl):
+                raise ValueError(f"La función no está definida en xl = {xl}")
+        except Exception as e:
+            raise ValueError(f"Error evaluando función en xl = {xl}: {str(e)}")
+        try:
+            if not math.isfinite(f_xu):
+                raise ValueError(f"La función no está definida en xu = {xu}")
+        except Exception as e:
+            raise ValueError(f"Error evaluando función en xu = {xu}: {str(e)}")
+
         # Limpiar historiales de iteraciones anteriores
         self.iteration_history = []
         self.error_history = []
@@ -39,33 +57,28 @@ class BiseccionSolver:
         xl_curr = xl
         xu_curr = xu
         xr_prev = None
+        # Evaluaciones de la función (dos extremos + un punto nuevo por iteración)
+        evaluations = 2
+        # Último punto evaluado (x, f(x)), para los métodos que lo usan
+        last = None
+        self._start(xl, xu, f_xl, f_xu)
 
         # Ejecutar iteraciones de bisección
         for iteration in range(self.max_iterations):
-            # Calcular punto medio
-            xr = (xl_curr + xu_curr) / 2.0
+            # Calcular el nuevo punto (el punto medio en bisección)
+            xr = self._trial_point(iteration, xl_curr, xu_curr, f_xl, f_xu, last)
 
-            # Evaluar función en los puntos con validación
+            # Evaluar función solo en el punto nuevo: f(xl) y f(xu) ya se conocen
+            evaluations += 1
             try:
-                f_xl = func(xl_curr)
-                if not math.isfinite(f_xl):
-                    raise ValueError(f"La función no está definida en xl = {xl_curr}")
-            except Exception as e:
-                raise ValueError(f"Error evaluando función en xl = {xl_curr}: {str(e)}")
-            
-            try:
-                f_xu = func(xu_curr)
-                if not math.isfinite(f_xu):
-                    raise ValueError(f"La función no está definida en xu = {xu_curr}")
-            except Exception as e:
-                raise ValueError(f"Error evaluando función en xu = {xu_curr}: {str(e)}")
-            
-            try:
-                f_xr = func(xr)
-                if not math.isfinite(f_xr):
-                    raise ValueError(f"La función no está definida en xr = {xr}")
-            except Exception as e:
-                raise ValueError(f"Error evaluando función en xr = {xr}: {str(e)}")
+                f_xr = self._evaluate(func, xr)
+            except ValueError:
+                # f no está definida en xr (por ejemplo un polo): evaluar el punto medio del
+                # intervalo o, si xr ya era el punto medio, el de la mitad superior
+                midpoint = (xl_curr + xu_curr) / 2.0
+                xr = midpoint if xr != midpoint else (midpoint + xu_curr) / 2.0
+                evaluations += 1
+                f_xr = self._evaluate(func, xr)
 
             # Calcular error relativo si no es la primera iteración
             error = 0.0
@@ -116,7 +129,8 @@ class BiseccionSolver:
                     'converged': True,
                     'final_error': error,
                     'history': self.iteration_history,
-                    'errors': self.error_history
+                    'errors': self.error_history,
+                    'function_evaluations': evaluations
                 }
 
             # También verificar si f(xr) está muy cerca de cero
@@ -128,24 +142,29 @@ class BiseccionSolver:
                     'converged': True,
                     'final_error': error,
                     'history': self.iteration_history,
-                    'errors': self.error_history
+                    'errors': self.error_history,
+                    'function_evaluations': evaluations
                 }
 
             # Determinar nuevo intervalo basado en el signo del producto
+            # El punto medio pasa a ser un extremo y conserva su valor f(xr)
             if f_xl_times_f_xr < 0:
                 # La raíz está en [xl, xr]
                 xu_curr = xr
+                f_xu = f_xr
                 iteration_data['new_interval'] = 'xl a xr'
             else:
                 # La raíz está en [xr, xu]
                 xl_curr = xr
+                f_xl = f_xr
                 iteration_data['new_interval'] = 'xr a xu'
 
             # Guardar xr actual como xr previo para próxima iteración
             xr_prev = xr
+            last = (xr, f_xr)
 
-        # Si no convergió en max_iterations, retornar último resultado
-        final_xr = (xl_curr + xu_curr) / 2.0
+        # Si no convergió en max_iterations, retornar el siguiente punto del método
+        final_xr = self._trial_point(self.max_iterations, xl_curr, xu_curr, f_xl, f_xu, last)
         # Calcular error final de manera segura
         final_error = 0.0
         if (xr_prev is not None and final_xr != 0 and 
@@ -161,91 +180,86 @@ class BiseccionSolver:
             'converged': False,
             'final_error': final_error,
             'history': self.iteration_history,
-            'errors': self.error_history
+            'errors': self.error_history,
+            'function_evaluations': evaluations
         }
 
+    @staticmethod
+    def _evaluate(func: Callable[[float], float], xr: float) -> float:
+        """Evalúa f(xr); cualquier error o valor no finito se reporta como ValueError"""
+        try:
+            f_xr = func(xr)
+            if not math.isfinite(f_xr):
+                raise ValueError(f"La función no está definida en xr = {xr}")
+        except Exception as e:
+            raise ValueError(f"Error evaluando función en xr = {xr}: {str(e)}")
+        return f_xr
+
+    def _start(self, xl: float, xu: float, f_xl: float, f_xu: float) -> None:
+        """Prepara el estado del método antes de iterar (la bisección no guarda estado)"""
+
+    def _next_point(self, iteration: int, xl: float, xu: float, f_xl: float, f_xu: float,
+                    last: Optional[Tuple[float, float]]) -> float:
+        """Punto que se evalúa en la iteración: el punto medio del intervalo actual"""
+        return (xl + xu) / 2.0
+
+    def _trial_point(self, iteration: int, xl: float, xu: float, f_xl: float, f_xu: float,
+                     last: Optional[Tuple[float, float]]) -> float:
+        """Punto propuesto por el método; si no queda dentro de (xl, xu) se usa el punto medio"""
+        xr = self._next_point(iteration, xl, xu, f_xl, f_xu, last)
+        if not (math.isfinite(xr) and xl < xr < xu):
+            xr = (xl + xu) / 2.0
+        return xr
+
     def create_function_from_expression(self, expression: str) -> Callable[[float], float]:
-        # Normalizar la expresión de forma segura
-        # Reemplazos ordenados por prioridad para evitar conflictos
-        replacements = {
-            '^': '**',
-            'sen(': 'sin(',
-            'cos(': 'cos(',
-            'tan(': 'tan(',
-            'ln(': 'log(',
-            'log10(': 'log10(',
-            'sqrt(': 'sqrt(',
-            'exp(': 'exp(',
-        }
-        for src, dst in replacements.items():
-            expression = expression.replace(src, dst)
+        # Normalizar la expresión y compilarla una sola vez (AST validado, nombres fijos)
+        expression = normalize_expression(expression)
+        compiled = compile_scalar(expression)
 
         def func(x):
             """Función generada dinámicamente"""
-            # Validar que x sea un número válido
-            if x is None:
-                raise ValueError("El valor de x no puede ser None")
-            if not isinstance(x, (int, float)):
-                try:
-                    x = float(x)
-                except:
-                    raise ValueError(f"El valor de x debe ser numérico, recibido: {type(x)}")
+            # Validar que x sea un número válido (los float pasan sin conversión)
+            if type(x) is not float:
+                if x is None:
+                    raise ValueError("El valor de x no puede ser None")
+                if not isinstance(x, (int, float)):
+                    try:
+                        x = float(x)
+                    except:
+                        raise ValueError(f"El valor de x debe ser numérico, recibido: {type(x)}")
+                x = float(x)
             if not math.isfinite(x):
                 raise ValueError(f"El valor de x debe ser finito, recibido: {x}")
-            
-            # Namespace con funciones matemáticas y variables
-            namespace = {
-                'x': float(x),
-                'sin': math.sin,
-                'cos': math.cos,
-                'tan': math.tan,
-                'log': math.log,
-                'log10': math.log10,
-                'sqrt': math.sqrt,
-                'exp': math.exp,
-                'pi': math.pi,
-                'e': math.e,
-                'abs': abs,
-                'pow': pow,
-                'asin': math.asin,
-                'acos': math.acos,
-                'atan': math.atan,
-                'sinh': math.sinh,
-                'cosh': math.cosh,
-                'tanh': math.tanh,
-            }
-            
+
             try:
-                # Validar que la expresión no esté vacía
-                if not expression or not expression.strip():
-                    raise ValueError("La expresión no puede estar vacía")
-                
-                result = eval(expression, {"__builtins__": {}}, namespace)
-                
-                # Verificar que el resultado sea un número válido
+                result = compiled(x)
+            except ZeroDivisionError:
+                raise ValueError(f"División por cero en x = {x}. Verifica la función para evitar divisiones por cero.")
+            except ValueError as ve:
+                # Re-lanzar errores de ValueError (por ejemplo, dominio de math)
+                raise ve
+            except Exception as e:
+                raise ValueError(f"Error evaluando función en x = {x}: {str(e)}\nExpresión: '{expression}'")
+
+            # Verificar que el resultado sea un número válido
+            if type(result) is not float:
                 if result is None:
                     raise ValueError(f"La función retornó None para x = {x}. Verifica la expresión: '{expression}'")
-                
                 if not isinstance(result, (int, float)):
                     # Intentar convertir a float (por ejemplo numpy.float64)
                     try:
                         result = float(result)
                     except Exception:
                         raise ValueError(f"La función retornó un tipo inválido: {type(result)} para x = {x}")
-                
-                if not math.isfinite(result):
-                    raise ValueError(f"La función retornó un valor no finito: {result} para x = {x}")
-                
-                return float(result)
-                
-            except ZeroDivisionError:
-                raise ValueError(f"División por cero en x = {x}. Verifica la función para evitar divisiones por cero.")
-            except ValueError as ve:
-                # Re-lanzar errores de ValueError ya manejados
-                raise ve
-            except Exception as e:
-                raise ValueError(f"Error evaluando función en x = {x}: {str(e)}\nExpresión: '{expression}'")
-        
+                result = float(result)
+
+            if not math.isfinite(result):
+                raise ValueError(f"La función retornó un valor no finito: {result} para x = {x}")
+
+            return result
+
+        # Versión vectorizada (NumPy) de la misma expresión: func.vectorized(xs) -> (ys, válidos)
+        func.vectorized = compile_vectorized(expression)
         return func
 
     def validate_function_and_interval(self, func: Callable[[float], float], xl: float, xu: float) -> Dict:
@@ -321,7 +335,7 @@ class BiseccionSolver:
                     'f_xu': validation.get('f_xu')
                 }]
 
-            # Resolver usando bisección (con manejo explícito de TypeError)
+            # Resolver con el método del solver (con manejo explícito de TypeError)
             # Ejecutar solución (si algo falla, se propagará como ValueError por las validaciones previas)
             result = self.solve(func, xl, xu)
             steps = []
@@ -341,8 +355,8 @@ class BiseccionSolver:
             # Explicar el método
             steps.append({
                 'type': 'method',
-                'title': 'Método de Bisección',
-                'content': 'El método divide el intervalo por la mitad y selecciona el subintervalo que contiene la raíz'
+                'title': self.METHOD_TITLE,
+                'content': self.METHOD_DESCRIPTION
             })
 
             # Generar pasos para las iteraciones (máximo 20 para evitar sobrecarga)
@@ -370,6 +384,8 @@ class BiseccionSolver:
                 'solution': result['solution'],
                 'iterations': result['iterations'],
                 'final_error': result['final_error'],
+                'function_evaluations': result['function_evaluations'],
+                'method': self.METHOD_TITLE,
                 'expression': func_expression
             })
 
@@ -384,26 +400,39 @@ class BiseccionSolver:
 
     def evaluate_at_points(self, func_expression: str, points: List[float]) -> Dict:
         """
-        Evalúa la función en una lista de puntos para verificación
+        Evalúa la función en una lista de puntos para verificación (todos en una sola llamada vectorizada)
         """
         try:
             func = self.create_function_from_expression(func_expression)
-            evaluations = []
-            
-            for x in points:
-                try:
-                    y = func(x)
-                    evaluations.append({
-                        'x': x,
-                        'y': y,
-                        'valid': math.isfinite(y)
-                    })
-                except:
-                    evaluations.append({
-                        'x': x,
-                        'y': None,
-                        'valid': False
-                    })
+            try:
+                xs = np.asarray(points, dtype=float)
+            except (TypeError, ValueError):
+                xs = None
+
+            if xs is not None and xs.ndim == 1:
+                ys, valid = func.vectorized(xs)
+                evaluations = [{
+                    'x': x,
+                    'y': y if ok else None,
+                    'valid': ok
+                } for x, y, ok in zip(points, ys.tolist(), valid.tolist())]
+            else:
+                # Puntos no numéricos: evaluar uno a uno para marcar solo los inválidos
+                evaluations = []
+                for x in points:
+                    try:
+                        y = func(x)
+                        evaluations.append({
+                            'x': x,
+                            'y': y,
+                            'valid': math.isfinite(y)
+                        })
+                    except:
+                        evaluations.append({
+                            'x': x,
+                            'y': None,
+                            'valid': False
+                        })
             
             return {
                 'success': True,
@@ -0,0 +1,191 @@
+import math
+import sys
+from typing import Optional, Tuple
+
+from solver.biseccion import BiseccionSolver
+
+
+class IllinoisSolver(BiseccionSolver):
+    """
+    Regula falsi modificada (Illinois)
+
+    Evalúa la intersección de la recta entre (xl, f(xl)) y (xu, f(xu)) con el
+    eje x. Si un mismo extremo se conserva dos iteraciones seguidas, su valor
+    de f se divide a la mitad en la interpolación, lo que evita que la regula
+    falsi se estanque en un extremo y da convergencia superlineal.
+    """
+
+    METHOD_TITLE = 'Método de Illinois (regula falsi modificada)'
+    METHOD_DESCRIPTION = ('Interpola una recta entre los extremos del intervalo y evalúa su cruce con el eje x; '
+                          'si un extremo se conserva dos veces seguidas, su f se divide a la mitad')
+
+    def _start(self, xl: float, xu: float, f_xl: float, f_xu: float) -> None:
+        # Valores de f de (xl, xu) usados en la interpolación (pueden estar divididos a la mitad)
+        self._weighted = [f_xl, f_xu]
+        # Extremo conservado en la iteración anterior (0: xl, 1: xu, None: ninguno)
+        self._kept = None
+
+    def _next_point(self, iteration: int, xl: float, xu: float, f_xl: float, f_xu: float,
+                    last: Optional[Tuple[float, float]]) -> float:
+        if last is not None:
+            # El último punto evaluado reemplazó a uno de los extremos
+            replaced = 0 if last[0] == xl else 1
+            kept = 1 - replaced
+            self._weighted[replaced] = last[1]
+            if self._kept == kept:
+                self._weighted[kept] /= 2.0
+            self._kept = kept
+
+        w_xl, w_xu = self._weighted
+        return (xl * w_xu - xu * w_xl) / (w_xu - w_xl)
+
+
+class BrentSolver(BiseccionSolver):
+    """
+    Método de Brent (zeroin)
+
+    Combina interpolación cuadrática inversa, secante y bisección: acepta el
+    paso interpolado solo si cae dentro del intervalo y reduce el paso de forma
+    suficiente; si no, hace un paso de bisección. Converge superlinealmente en
+    funciones suaves.
+
+    En raíces múltiples (como (x - 1)^3) la interpolación solo acorta el
+    intervalo de a poco y el zeroin clásico puede necesitar varias veces las
+    evaluaciones de la bisección. Como salvaguarda, si el intervalo no se
+    redujo a la mitad en las últimas `bisection_window` iteraciones, se fuerza
+    un paso de bisección: reducir el intervalo a la mitad nunca cuesta más de
+    bisection_window + 1 iteraciones.
+    """
+
+    METHOD_TITLE = 'Método de Brent'
+    METHOD_DESCRIPTION = ('Combina interpolación cuadrática inversa, secante y bisección: usa el paso interpolado '
+                          'cuando es seguro y la bisección en caso contrario')
+
+    def __init__(self):
+        super().__init__()
+        # Iteraciones en las que el intervalo debe reducirse a la mitad antes de forzar una bisección
+        self.bisection_window = 2
+
+    def _start(self, xl: float, xu: float, f_xl: float, f_xu: float) -> None:
+        # b: mejor estimación, c: contrapunto (f de signo opuesto), a: estimación anterior
+        self._a, self._fa = xl, f_xl
+        self._b, self._fb = xu, f_xu
+        self._c, self._fc = xl, f_xl
+        # Paso actual y paso anterior (para decidir si se acepta la interpolación)
+        self._d = self._e = xu - xl
+        # Ancho del intervalo al inicio de cada iteración (para la salvaguarda de bisección)
+        self._widths = []
+
+    def _next_point(self, iteration: int, xl: float, xu: float, f_xl: float, f_xu: float,
+                    last: Optional[Tuple[float, float]]) -> float:
+        if last is not None:
+            self._b, self._fb = last
+        a, fa, b, fb, c, fc = self._a, self._fa, self._b, self._fb, self._c, self._fc
+        d, e = self._d, self._e
+
+        # Mantener c con signo opuesto a b
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        # b debe ser el punto con |f| menor
+        if abs(fc) < abs(fb):
+            a, fa = b, fb
+            b, fb = c, fc
+            c, fc = a, fa
+
+        tol = self._step_tolerance(b)
+        m = 0.5 * (c - b)
+        # Salvaguarda: el intervalo no se redujo a la mitad en las últimas iteraciones
+        self._widths.append(xu - xl)
+        stalled = (len(self._widths) > self.bisection_window
+                   and self._widths[-1] > 0.5 * self._widths[-1 - self.bisection_window])
+        if stalled:
+            d = e = m
+        elif abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secante
+                p = 2.0 * m * s
+                q = 1.0 - s
+            else:
+                # Interpolación cuadrática inversa
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            # Aceptar la interpolación solo si cae dentro del intervalo y el paso se reduce
+            if 2.0 * p < 3.0 * m * q - abs(tol * q) and p < abs(0.5 * e * q):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+
+        self._a, self._fa, self._b, self._fb, self._c, self._fc = b, fb, b, fb, c, fc
+        self._d, self._e = d, e
+        # Paso mínimo de tol hacia c para que el intervalo siempre se reduzca
+        return b + (d if abs(d) > tol else math.copysign(tol, m))
+
+    def _step_tolerance(self, x: float) -> float:
+        """Paso mínimo: la mitad de la tolerancia relativa del solver más el error de redondeo"""
+        return 2.0 * sys.float_info.epsilon * abs(x) + 0.5 * self.tolerance / 100 * abs(x)
+
+
+class ITPSolver(BiseccionSolver):
+    """
+    Método ITP (interpolar, truncar, proyectar) de Oliveira y Takahashi
+
+    Parte del punto de la regula falsi, lo trunca hacia el punto medio y lo
+    proyecta a una vecindad del punto medio cuyo radio se reduce con cada
+    iteración. Así converge superlinealmente en funciones suaves y el
+    intervalo llega al ancho de la tolerancia (2 epsilon) en a lo sumo n0
+    iteraciones más que con la bisección.
+    """
+
+    METHOD_TITLE = 'Método ITP (interpolar, truncar, proyectar)'
+    METHOD_DESCRIPTION = ('Toma el punto de la regula falsi, lo trunca hacia el punto medio y lo proyecta a una '
+                          'vecindad del punto medio que garantiza el peor caso de la bisección')
+
+    def __init__(self):
+        super().__init__()
+        # Truncamiento: delta = kappa1 / (xu0 - xl0) * (xu - xl) ^ kappa2
+        self.kappa1 = 0.2
+        self.kappa2 = 2.0
+        # Iteraciones extra permitidas sobre las de la bisección
+        self.n0 = 1
+
+    def _start(self, xl: float, xu: float, f_xl: float, f_xu: float) -> None:
+        width = xu - xl
+        # Tolerancia absoluta equivalente a la tolerancia relativa del solver (acotada por la precisión)
+        self._epsilon = max(0.5 * self.tolerance / 100 * max(abs(xl), abs(xu)), width * 2.0 ** -60)
+        self._kappa1 = self.kappa1 / width
+        self._n_max = max(0, math.ceil(math.log2(width / (2.0 * self._epsilon)))) + self.n0
+
+    def _next_point(self, iteration: int, xl: float, xu: float, f_xl: float, f_xu: float,
+                    last: Optional[Tuple[float, float]]) -> float:
+        width = xu - xl
+        x_half = 0.5 * (xl + xu)
+        # Radio alrededor del punto medio que conserva la cota de iteraciones
+        r = max(self._epsilon * 2.0 ** (self._n_max - iteration) - 0.5 * width, 0.0)
+        delta = self._kappa1 * width ** self.kappa2
+
+        # Interpolar (regula falsi)
+        x_f = (xl * f_xu - xu * f_xl) / (f_xu - f_xl)
+        sigma = math.copysign(1.0, x_half - x_f)
+        # Truncar hacia el punto medio
+        x_t = x_f + sigma * delta if delta <= abs(x_half - x_f) else x_half
+        # Proyectar a la vecindad del punto medio
+        return x_t if abs(x_t - x_half) <= r else x_half - sigma * r
+
+
+# Métodos de intervalo disponibles, por nombre
+METHODS = {
+    'Bisección': BiseccionSolver,
+    'Brent': BrentSolver,
+    'Illinois': IllinoisSolver,
+    'ITP': ITPSolver,
+}
@@ -0,0 +1,154 @@
+import ast
+import math
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+
+
+# Reemplazos de notación, ordenados por prioridad para evitar conflictos
+REPLACEMENTS = {
+    '^': '**',
+    'sen(': 'sin(',
+    'cos(': 'cos(',
+    'tan(': 'tan(',
+    'ln(': 'log(',
+    'log10(': 'log10(',
+    'sqrt(': 'sqrt(',
+    'exp(': 'exp(',
+}
+
+# Funciones y constantes disponibles en las expresiones (espacio de nombres fijo)
+MATH_NAMESPACE = {
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'log': math.log,
+    'log10': math.log10,
+    'sqrt': math.sqrt,
+    'exp': math.exp,
+    'pi': math.pi,
+    'e': math.e,
+    'abs': abs,
+    'pow': pow,
+    'asin': math.asin,
+    'acos': math.acos,
+    'atan': math.atan,
+    'sinh': math.sinh,
+    'cosh': math.cosh,
+    'tanh': math.tanh,
+}
+
+
+def _numpy_log(x, base=None):
+    """log(x) o log(x, base) como math.log (el segundo argumento de np.log es `out`, no la base)"""
+    return np.log(x) if base is None else np.log(x) / np.log(base)
+
+
+# Mismos nombres como ufuncs de NumPy, para evaluar arreglos completos de x
+NUMPY_NAMESPACE = {
+    'sin': np.sin,
+    'cos': np.cos,
+    'tan': np.tan,
+    'log': _numpy_log,
+    'log10': np.log10,
+    'sqrt': np.sqrt,
+    'exp': np.exp,
+    'pi': math.pi,
+    'e': math.e,
+    'abs': np.abs,
+    'pow': np.float_power,
+    'asin': np.arcsin,
+    'acos': np.arccos,
+    'atan': np.arctan,
+    'sinh': np.sinh,
+    'cosh': np.cosh,
+    'tanh': np.tanh,
+}
+
+
+def normalize_expression(expression: str) -> str:
+    """Convierte la notación del usuario (^, sen, ln) a sintaxis de Python"""
+    for src, dst in REPLACEMENTS.items():
+        expression = expression.replace(src, dst)
+    return expression
+
+
+def parse_expression(expression: str) -> ast.Expression:
+    """
+    Analiza la expresión una sola vez y valida su AST
+
+    Solo se permiten la variable x y los nombres de MATH_NAMESPACE, sin acceso
+    a atributos, así que la expresión no puede salir del espacio de nombres.
+    """
+    if not expression or not expression.strip():
+        raise ValueError("La expresión no puede estar vacía")
+    try:
+        tree = ast.parse(expression.strip(), mode='eval')
+    except SyntaxError:
+        raise ValueError(f"Sintaxis inválida en la expresión: '{expression}'")
+
+    allowed = set(MATH_NAMESPACE) | {'x'}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Attribute):
+            raise ValueError(f"No se permite acceder a atributos en la expresión: '{expression}'")
+        if isinstance(node, ast.Name) and node.id not in allowed:
+            raise ValueError(f"Nombre no permitido en la expresión: '{node.id}'")
+    return tree
+
+
+def _compile_lambda(expression: str, namespace: Dict) -> Callable:
+    """Envuelve la expresión validada en `lambda x: ...` y la compila contra el namespace dado"""
+    tree = parse_expression(expression)
+    arguments = ast.arguments(posonlyargs=[], args=[ast.arg(arg='x')], kwonlyargs=[],
+                              kw_defaults=[], defaults=[])
+    wrapper = ast.Expression(body=ast.Lambda(args=arguments, body=tree.body))
+    code = compile(ast.fix_missing_locations(wrapper), '<expresion>', 'eval')
+    return eval(code, {'__builtins__': {}, **namespace})
+
+
+def compile_scalar(expression: str) -> Callable[[float], object]:
+    """
+    Compila la expresión en una función f(x) de Python con math.*
+
+    La expresión se compila una sola vez, así que cada evaluación es una
+    llamada directa sin volver a analizar el texto ni construir un
+    diccionario de nombres.
+    """
+    return _compile_lambda(expression, MATH_NAMESPACE)
+
+
+def compile_vectorized(expression: str) -> Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]:
+    """
+    Compila la expresión en una función que evalúa un arreglo completo de x con NumPy
+
+    La función retornada recibe un arreglo (o lista) de x y retorna (y, valid):
+    y tiene la forma de x y valid marca los puntos donde f(x) existe y es finita.
+    Los puntos inválidos (dominio, división por cero, desbordamiento) quedan en
+    valid = False en lugar de lanzar excepciones. Si la expresión no admite un
+    arreglo completo (por ejemplo `x if x > 0 else -1`), se evalúa punto por
+    punto con la versión escalar.
+    """
+    function = _compile_lambda(expression, NUMPY_NAMESPACE)
+    scalar = compile_scalar(expression)
+
+    def evaluate_point(value: float) -> float:
+        try:
+            return float(scalar(value))
+        except (ArithmeticError, TypeError, ValueError):
+            return math.nan
+
+    def evaluate(x) -> Tuple[np.ndarray, np.ndarray]:
+        x = np.asarray(x, dtype=float)
+        try:
+            with np.errstate(all='ignore'):
+                y = np.asarray(function(x), dtype=float)
+        except (ArithmeticError, TypeError, ValueError):
+            # La expresión no se puede aplicar al arreglo completo (condicionales de
+            # Python, 1/0 constante...): evaluar cada punto para marcar solo los inválidos
+            y = np.array([evaluate_point(value) for value in x.ravel().tolist()]).reshape(x.shape)
+        if y.shape != x.shape:
+            # Expresiones constantes en x retornan un escalar
+            y = np.broadcast_to(y, x.shape).copy()
+        return y, np.isfinite(y)
+
+    return evaluate
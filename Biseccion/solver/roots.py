@@ -0,0 +1,232 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from solver.biseccion import BiseccionSolver
+from solver.bracketing import METHODS
+
+
+class RootFinder:
+    """
+    Búsqueda de todas las raíces de f(x) en un dominio amplio
+
+    1. Muestrea f en una malla uniforme con la versión vectorizada de la
+       expresión y la refina de forma adaptativa donde la curvatura indica que
+       puede haber raíces escondidas (un extremo local cuya parábola cruza el
+       eje sin cambio de signo en la muestra) o varias raíces en una celda.
+    2. Cada par de muestras consecutivas con cambio de signo es un intervalo
+       que se resuelve con un método de intervalo (Brent por defecto); los
+       intervalos se resuelven en paralelo en un pool de procesos.
+    3. Las raíces se ordenan y se eliminan duplicados. Los cambios de signo
+       que resultan ser discontinuidades (polos como 1/x, donde |f| crece en
+       lugar de anularse) se reportan aparte.
+
+    Las raíces de multiplicidad par (sin cambio de signo) solo se detectan si
+    alguna muestra cae exactamente en ellas.
+    """
+
+    def __init__(self, method: str = 'Brent'):
+        # Método de intervalo para resolver cada cambio de signo (ver solver.bracketing.METHODS)
+        self.method = method
+        # Tolerancia (en porcentaje) y máximo de iteraciones de cada solución
+        self.tolerance = 0.000001
+        self.max_iterations = 100
+        # Puntos de la malla uniforme inicial
+        self.initial_points = 1000
+        # Máximo de niveles de refinamiento adaptativo (cada nivel divide las celdas marcadas a la mitad)
+        self.max_depth = 12
+        # Procesos del pool (None: uno por cpu); con 1 se resuelve en el proceso actual
+        self.max_workers = None
+        # Con menos intervalos que este umbral se resuelve en el proceso actual
+        self.parallel_threshold = 16
+        # Distancia (relativa al ancho del dominio) por debajo de la cual dos raíces son la misma
+        self.duplicate_tolerance = 1e-10
+
+    def find_roots(self, func_expression: str, xl: float, xu: float) -> Dict:
+        """
+        Encuentra todas las raíces de f(x) = func_expression en [xl, xu]
+
+        Returns:
+            Dict con 'roots' (ordenadas, sin duplicados), 'details' (por raíz:
+            root, f_root, converged, iterations, function_evaluations,
+            final_error, bracket), 'discontinuities', 'failures' y el total
+            de evaluaciones de f (muestreo + soluciones)
+        """
+        if xl >= xu:
+            raise ValueError("El límite inferior debe ser menor que el superior")
+        if self.method not in METHODS:
+            raise ValueError(f"Método desconocido: '{self.method}'. Disponibles: {', '.join(METHODS)}")
+        if self.initial_points < 2:
+            raise ValueError("Se necesitan al menos 2 puntos de muestreo")
+
+        func = BiseccionSolver().create_function_from_expression(func_expression)
+        xs, ys, valid, sample_evaluations = self._sample(func.vectorized, xl, xu)
+
+        # Muestras que son raíces exactas y celdas con cambio de signo estricto
+        exact = np.nonzero(valid & (ys == 0))[0]
+        changes = np.nonzero(valid[:-1] & valid[1:] & (ys[:-1] * ys[1:] < 0))[0]
+        tasks = [(func_expression, self.method, self.tolerance, self.max_iterations,
+                  float(xs[i]), float(xs[i + 1])) for i in changes]
+        results, workers = self._solve_brackets(tasks)
+
+        details = [{
+            'root': float(xs[i]),
+            'f_root': 0.0,
+            'converged': True,
+            'iterations': 0,
+            'function_evaluations': 0,
+            'final_error': 0.0,
+            'bracket': (float(xs[i]), float(xs[i])),
+        } for i in exact]
+        discontinuities = []
+        failures = []
+        solve_evaluations = 0
+        for i, result in zip(changes, results):
+            if 'error' in result:
+                failures.append(result)
+                continue
+            solve_evaluations += result['function_evaluations']
+            # En un polo |f| crece al acercarse al cambio de signo: supera a los dos extremos
+            if abs(result['f_root']) > max(abs(ys[i]), abs(ys[i + 1])):
+                discontinuities.append(result)
+            else:
+                details.append(result)
+
+        details = self._deduplicate(sorted(details, key=lambda d: d['root']), (xu - xl) * self.duplicate_tolerance)
+        return {
+            'roots': [d['root'] for d in details],
+            'details': details,
+            'discontinuities': sorted(discontinuities, key=lambda d: d['root']),
+            'failures': failures,
+            'brackets': len(tasks),
+            'samples': len(xs),
+            'sample_evaluations': sample_evaluations,
+            'function_evaluations': sample_evaluations + solve_evaluations,
+            'workers': workers,
+            'method': self.method
+        }
+
+    def _sample(self, vectorized: Callable, xl: float, xu: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+        """Muestreo uniforme y refinamiento adaptativo; retorna (xs, ys, válidos, evaluaciones)"""
+        xs = np.linspace(xl, xu, self.initial_points)
+        ys, valid = vectorized(xs)
+        evaluations = len(xs)
+
+        for _ in range(self.max_depth):
+            cells = self._cells_to_refine(xs, ys, valid)
+            if len(cells) == 0:
+                break
+            # Insertar el punto medio de cada celda marcada (las posiciones se mantienen ordenadas)
+            midpoints = 0.5 * (xs[cells] + xs[cells + 1])
+            new_ys, new_valid = vectorized(midpoints)
+            evaluations += len(midpoints)
+            xs = np.insert(xs, cells + 1, midpoints)
+            ys = np.insert(ys, cells + 1, new_ys)
+            valid = np.insert(valid, cells + 1, new_valid)
+        return xs, ys, valid, evaluations
+
+    @staticmethod
+    def _cells_to_refine(xs: np.ndarray, ys: np.ndarray, valid: np.ndarray) -> np.ndarray:
+        """
+        Celdas [xs[i], xs[i+1]] que se dividen en el siguiente nivel
+
+        Se marcan las celdas con cambio de signo (pueden esconder tres o más
+        raíces), las dos celdas alrededor de cada extremo local de la muestra
+        (la pendiente cambia de signo) cuya parábola por los tres puntos cruza
+        el eje x (par de raíces sin cambio de signo en la muestra) y las dos
+        celdas junto a cada muestra que es raíz exacta (el cero anula el
+        producto de signos y puede esconder raíces muy próximas a ella).
+        """
+        if len(xs) < 3:
+            return np.empty(0, dtype=np.int64)
+        x0, x1, x2 = xs[:-2], xs[1:-1], xs[2:]
+        y0, y1, y2 = ys[:-2], ys[1:-1], ys[2:]
+        with np.errstate(all='ignore'):
+            d1 = (y1 - y0) / (x1 - x0)
+            d2 = (y2 - y1) / (x2 - x1)
+            extremum = valid[:-2] & valid[1:-1] & valid[2:] & (d1 != 0) & (d1 * d2 <= 0)
+            # Parábola por los tres puntos: curvatura, pendiente en x1 y valor en el vértice
+            curvature = (d2 - d1) / (x2 - x0)
+            slope = d1 + curvature * (x1 - x0)
+            vertex = y1 - slope ** 2 / (4.0 * curvature)
+            crosses = vertex * y1 < 0
+        sign_change = (y0 * y1 < 0) | (y1 * y2 < 0)
+        centers = np.nonzero(extremum & (crosses | sign_change))[0] + 1
+        # Celdas con cambio de signo: pueden contener un número impar de raíces muy próximas
+        changes = np.nonzero(valid[:-1] & valid[1:] & (ys[:-1] * ys[1:] < 0))[0]
+        # Celdas junto a una raíz exacta cuyo otro extremo no es cero
+        zero = valid & (ys == 0)
+        beside_zero = np.nonzero((zero[:-1] | zero[1:]) & valid[:-1] & valid[1:] & (ys[:-1] + ys[1:] != 0))[0]
+        return np.unique(np.concatenate([centers - 1, centers, changes, beside_zero]))
+
+    def _solve_brackets(self, tasks: List[Tuple]) -> Tuple[List[Dict], int]:
+        """Resuelve los intervalos en un pool de procesos (o en el proceso actual si son pocos)"""
+        workers = self.max_workers or os.cpu_count() or 1
+        workers = min(workers, len(tasks))
+        if workers <= 1 or len(tasks) < self.parallel_threshold:
+            return [_solve_bracket(task) for task in tasks], 1
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunksize = max(1, len(tasks) // (4 * workers))
+                return list(pool.map(_solve_bracket, tasks, chunksize=chunksize)), workers
+        except (OSError, BrokenProcessPool):
+            # Sin soporte para procesos (entorno restringido): resolver en el proceso actual
+            return [_solve_bracket(task) for task in tasks], 1
+
+    @staticmethod
+    def _deduplicate(details: List[Dict], distance: float) -> List[Dict]:
+        """Une raíces (ya ordenadas) más cercanas que distance, conservando la de menor |f|"""
+        unique = []
+        for detail in details:
+            if unique and detail['root'] - unique[-1]['root'] <= distance:
+                if abs(detail['f_root']) < abs(unique[-1]['f_root']):
+                    unique[-1] = detail
+                continue
+            unique.append(detail)
+        return unique
+
+
+@lru_cache(maxsize=8)
+def _compiled_function(func_expression: str) -> Callable[[float], float]:
+    """Función compilada de la expresión, una vez por proceso"""
+    return BiseccionSolver().create_function_from_expression(func_expression)
+
+
+def _solve_bracket(task: Tuple) -> Dict:
+    """
+    Resuelve un intervalo con cambio de signo (se ejecuta en los procesos del pool)
+
+    La tarea lleva la expresión en texto porque las funciones compiladas no se
+    pueden enviar entre procesos.
+    """
+    func_expression, method, tolerance, max_iterations, xl, xu = task
+    try:
+        func = _compiled_function(func_expression)
+        solver = METHODS[method]()
+        solver.tolerance = tolerance
+        solver.max_iterations = max_iterations
+        result = solver.solve(func, xl, xu)
+        evaluations = result['function_evaluations']
+        last = result['history'][-1] if result['history'] else None
+        if last is not None and last['xr'] == result['solution']:
+            f_root = last['f_xr']
+        else:
+            # Sin convergencia la solución es el siguiente punto, que aún no se evaluó
+            f_root = func(result['solution'])
+            evaluations += 1
+    except ValueError as e:
+        return {'bracket': (xl, xu), 'error': str(e)}
+
+    return {
+        'root': result['solution'],
+        'f_root': f_root,
+        'converged': result['converged'],
+        'iterations': result['iterations'],
+        'function_evaluations': evaluations,
+        'final_error': result['final_error'],
+        'bracket': (xl, xu),
+    }
@@ -0,0 +1,52 @@
+"""Tests for the bisection solver"""
+
+import pytest
+from solver.biseccion import BiseccionSolver
+
+
+def counting(func):
+    """Wrap func so the number of calls is available as wrapper.calls"""
+    def wrapper(x):
+        wrapper.calls += 1
+        return func(x)
+
+    wrapper.calls = 0
+    return wrapper
+
+
+class TestBiseccionSolver:
+    """Test cases for BiseccionSolver"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.solver = BiseccionSolver()
+
+    def test_finds_root(self):
+        """Test bisection converges to the root of a cubic"""
+        func = self.solver.create_function_from_expression("x^3 - 2*x - 5")
+        result = self.solver.solve(func, 2, 3)
+
+        assert result['converged']
+        assert result['solution'] == pytest.approx(2.0945514815423265, abs=1e-7)
+
+    def test_function_evaluations_match_calls(self):
+        """Test function_evaluations counts f(xl), f(xu) and one new point per iteration"""
+        func = counting(self.solver.create_function_from_expression("x^3 - 2*x - 5"))
+        result = self.solver.solve(func, 2, 3)
+
+        assert result['function_evaluations'] == func.calls == 28
+        assert result['function_evaluations'] == result['iterations'] + 2
+
+    def test_function_evaluations_without_convergence(self):
+        """Test the count stays exact when max_iterations stops the loop"""
+        self.solver.max_iterations = 5
+        func = counting(lambda x: x * x - 2)
+        result = self.solver.solve(func, 0, 2)
+
+        assert not result['converged']
+        assert result['function_evaluations'] == func.calls == 7
+
+    def test_same_signs_raise(self):
+        """Test an interval without a sign change is rejected"""
+        with pytest.raises(ValueError, match="signos opuestos"):
+            self.solver.solve(lambda x: x * x + 1, -1, 1)
@@ -0,0 +1,160 @@
+"""Tests for the Brent, Illinois and ITP bracketing solvers"""
+
+import math
+
+import pytest
+from solver.biseccion import BiseccionSolver
+from solver.bracketing import METHODS, BrentSolver, IllinoisSolver, ITPSolver
+from tests.test_biseccion import counting
+
+
+# (expresión, xl, xu, raíz)
+SMOOTH = [
+    ("x^3 - 2*x - 5", 2.0, 3.0, 2.0945514815423265),
+    ("exp(-x) - x", 0.0, 1.0, 0.5671432904097838),
+    ("cos(x) - x", 0.0, 1.0, 0.7390851332151607),
+    ("log(x) - 1", 1.0, 4.0, math.e),
+    ("tanh(x - 0.3)", -5.0, 10.0, 0.3),
+]
+# Raíces múltiples, donde la interpolación converge lentamente
+MULTIPLE = [
+    ("(x - 1)^3", 0.0, 3.0),
+    ("x^3", -1.0, 2.0),
+    ("(x - 1)^5", -1.0, 2.0),
+]
+
+
+def solve(solver_class, expression, xl, xu):
+    """Solve with a fresh solver and its default tolerance"""
+    solver = solver_class()
+    return solver, solver.solve(solver.create_function_from_expression(expression), xl, xu)
+
+
+class TestBracketingSolvers:
+    """Test cases shared by every method in METHODS"""
+
+    @pytest.mark.parametrize("name", list(METHODS))
+    @pytest.mark.parametrize("expression, xl, xu", [case[:3] for case in SMOOTH] + MULTIPLE)
+    def test_bracket_is_preserved(self, name, expression, xl, xu):
+        """Test every trial point lies inside a bracket whose endpoints keep opposite signs"""
+        _, result = solve(METHODS[name], expression, xl, xu)
+
+        assert result['converged']
+        for row in result['history']:
+            assert row['xl'] < row['xr'] < row['xu']
+            assert row['f_xl'] * row['f_xu'] < 0
+
+    @pytest.mark.parametrize("name", list(METHODS))
+    @pytest.mark.parametrize("expression, xl, xu, root", SMOOTH)
+    def test_finds_root(self, name, expression, xl, xu, root):
+        """Test each method converges to the known root"""
+        _, result = solve(METHODS[name], expression, xl, xu)
+
+        assert result['solution'] == pytest.approx(root, rel=1e-7)
+
+    @pytest.mark.parametrize("name", ['Brent', 'Illinois', 'ITP'])
+    @pytest.mark.parametrize("expression, xl, xu, root", SMOOTH)
+    def test_fewer_evaluations_than_bisection(self, name, expression, xl, xu, root):
+        """Test the interpolating methods need fewer evaluations of f than bisection on smooth functions"""
+        func = counting(BiseccionSolver().create_function_from_expression(expression))
+        result = METHODS[name]().solve(func, xl, xu)
+        _, bisection = solve(BiseccionSolver, expression, xl, xu)
+
+        assert result['function_evaluations'] == func.calls
+        assert result['function_evaluations'] < bisection['function_evaluations'] / 2
+
+    @pytest.mark.parametrize("name", list(METHODS))
+    @pytest.mark.parametrize("xl, xu", [(-1.0, 2.0), (-1.0, 1.0)])
+    def test_undefined_trial_point_matches_bisection(self, name, xl, xu):
+        """Test a pole inside the bracket gives a non-converged result instead of an error"""
+        _, result = solve(METHODS[name], "1/x", xl, xu)
+
+        assert not result['converged']
+        assert result['iterations'] == 100
+        assert abs(result['solution']) < 1e-12
+
+
+class TestBrentSolver:
+    """Test cases for BrentSolver"""
+
+    @pytest.mark.parametrize("expression, xl, xu", MULTIPLE)
+    def test_bisection_safeguard_halves_the_bracket(self, expression, xl, xu):
+        """Test the bracket halves at least every bisection_window + 1 iterations"""
+        solver, result = solve(BrentSolver, expression, xl, xu)
+        widths = [row['xu'] - row['xl'] for row in result['history']]
+        window = solver.bisection_window + 1
+
+        assert result['converged']
+        for before, after in zip(widths, widths[window:]):
+            assert after <= 0.5 * before
+
+    def test_safeguard_on_triple_root(self):
+        """Test the safeguard keeps a triple root within a small factor of bisection"""
+        _, brent = solve(BrentSolver, "(x - 1)^3", 0.0, 3.0)
+        _, bisection = solve(BiseccionSolver, "(x - 1)^3", 0.0, 3.0)
+
+        solver = BrentSolver()
+        solver.bisection_window = 10 ** 6
+        unguarded = solver.solve(solver.create_function_from_expression("(x - 1)^3"), 0.0, 3.0)
+
+        assert brent['function_evaluations'] < unguarded['function_evaluations']
+        assert brent['function_evaluations'] <= 2 * bisection['function_evaluations']
+
+
+class TestIllinoisSolver:
+    """Test cases for IllinoisSolver"""
+
+    def test_kept_endpoint_is_halved(self):
+        """Test an endpoint kept twice in a row has its f value halved in the interpolation"""
+        solver = IllinoisSolver()
+        solver._start(0.0, 2.0, -1.0, 3.0)
+        solver._next_point(0, 0.0, 2.0, -1.0, 3.0, None)
+
+        # xl reemplazado dos veces: xu se conserva dos veces seguidas
+        solver._next_point(1, 0.5, 2.0, -0.75, 3.0, (0.5, -0.75))
+        assert solver._weighted == [-0.75, 3.0]
+        solver._next_point(2, 0.8, 2.0, -0.36, 3.0, (0.8, -0.36))
+        assert solver._weighted == [-0.36, 1.5]
+        solver._next_point(3, 0.9, 2.0, -0.19, 3.0, (0.9, -0.19))
+        assert solver._weighted == [-0.19, 0.75]
+
+        # Al reemplazar el otro extremo, el contador empieza de nuevo
+        solver._next_point(4, 0.9, 1.1, -0.19, 0.21, (1.1, 0.21))
+        assert solver._weighted == [-0.19, 0.21]
+
+    def test_avoids_regula_falsi_stagnation(self):
+        """Test both endpoints move on a convex function where plain regula falsi keeps one fixed"""
+        _, result = solve(IllinoisSolver, "x^10 - 1", 0.0, 1.3)
+
+        assert result['converged']
+        assert result['history'][-1]['xu'] < 1.3
+        assert result['function_evaluations'] < 20
+
+
+class TestITPSolver:
+    """Test cases for ITPSolver"""
+
+    @pytest.mark.parametrize("expression, xl, xu", [case[:3] for case in SMOOTH] + MULTIPLE +
+                             [("x^10 - 1", 0.0, 1.3), ("exp(x) - 1e6", 0.0, 20.0)])
+    def test_bracket_reaches_tolerance_within_n_max(self, expression, xl, xu):
+        """Test the bracket after k iterations is at most 2 * epsilon * 2^(n_max - k) wide"""
+        solver, result = solve(ITPSolver, expression, xl, xu)
+        _, bisection = solve(BiseccionSolver, expression, xl, xu)
+
+        assert result['converged']
+        for k, row in enumerate(result['history']):
+            rounding = 4 * math.ulp(max(abs(row['xl']), abs(row['xu'])))
+            assert row['xu'] - row['xl'] <= 2.0 * solver._epsilon * 2.0 ** (solver._n_max - k) + rounding
+        # Con el intervalo en 2 epsilon, el siguiente punto cumple la tolerancia relativa
+        assert result['iterations'] <= solver._n_max + 1
+        assert solver._n_max <= math.ceil(math.log2((xu - xl) / (2.0 * solver._epsilon))) + solver.n0
+        assert result['iterations'] <= bisection['iterations'] + solver.n0 + 1
+
+    def test_trial_points_stay_near_midpoint(self):
+        """Test the projection keeps each trial point within the shrinking radius of the midpoint"""
+        solver, result = solve(ITPSolver, "exp(x) - 1e6", 0.0, 20.0)
+
+        for k, row in enumerate(result['history']):
+            width = row['xu'] - row['xl']
+            radius = max(solver._epsilon * 2.0 ** (solver._n_max - k) - 0.5 * width, 0.0)
+            assert abs(row['xr'] - 0.5 * (row['xl'] + row['xu'])) <= radius + 1e-12
@@ -0,0 +1,145 @@
+"""Tests for parsing and compiling user expressions"""
+
+import numpy as np
+import pytest
+from solver.biseccion import BiseccionSolver
+from solver.expression import MATH_NAMESPACE, compile_scalar, compile_vectorized, normalize_expression, parse_expression
+from utils.validators import FunctionValidator
+
+
+class TestParseExpression:
+    """Test cases for the AST allow-list of parse_expression"""
+
+    def test_accepts_math_names(self):
+        """Test x, operators, functions and constants from MATH_NAMESPACE are accepted"""
+        parse_expression("x**3 - 2*x - 5 + sin(x) * log(x, 10) + pi - e + abs(-x)")
+
+    def test_normalizes_user_notation(self):
+        """Test ^, sen and ln are rewritten to Python syntax"""
+        assert normalize_expression("sen(x)^2 + ln(x)") == "sin(x)**2 + log(x)"
+
+    @pytest.mark.parametrize("expression", [
+        "x.real",
+        "(1).__class__",
+        "sin.__self__",
+        "().__class__.__bases__[0].__subclasses__()",
+    ])
+    def test_rejects_attribute_access(self, expression):
+        """Test any attribute access is rejected with its message"""
+        with pytest.raises(ValueError, match="No se permite acceder a atributos en la expresión"):
+            parse_expression(expression)
+
+    @pytest.mark.parametrize("expression, name", [
+        ("y + 1", "y"),
+        ("__import__('os')", "__import__"),
+        ("eval('1')", "eval"),
+        ("open('archivo')", "open"),
+        ("math + x", "math"),
+        ("__builtins__", "__builtins__"),
+    ])
+    def test_rejects_unknown_names(self, expression, name):
+        """Test names outside MATH_NAMESPACE and x are rejected, naming the offender"""
+        with pytest.raises(ValueError) as error:
+            parse_expression(expression)
+
+        assert str(error.value) == f"Nombre no permitido en la expresión: '{name}'"
+
+    @pytest.mark.parametrize("expression", ["", "   "])
+    def test_rejects_empty_expression(self, expression):
+        """Test empty expressions are rejected"""
+        with pytest.raises(ValueError, match="La expresión no puede estar vacía"):
+            parse_expression(expression)
+
+    def test_rejects_invalid_syntax(self):
+        """Test syntax errors are reported as ValueError with the expression"""
+        with pytest.raises(ValueError) as error:
+            parse_expression("x +* 2")
+
+        assert str(error.value) == "Sintaxis inválida en la expresión: 'x +* 2'"
+
+    def test_rejection_happens_before_evaluation(self):
+        """Test the solver refuses unsafe input when compiling, not on first evaluation"""
+        with pytest.raises(ValueError, match="Nombre no permitido"):
+            BiseccionSolver().create_function_from_expression("__import__('os')")
+
+    def test_compiled_function_evaluates(self):
+        """Test an accepted expression compiles against the math namespace"""
+        func = compile_scalar("sqrt(x) + pow(x, 2)")
+
+        assert func(4.0) == 18.0
+
+
+class TestVectorizedParity:
+    """Test cases comparing the scalar and NumPy targets of the same expression"""
+
+    # Una expresión por nombre de MATH_NAMESPACE, con argumentos dentro del dominio en (0, 1)
+    EXPRESSIONS = {
+        'sin': "sin(x)",
+        'cos': "cos(x)",
+        'tan': "tan(x)",
+        'log': "log(x)",
+        'log10': "log10(x)",
+        'sqrt': "sqrt(x)",
+        'exp': "exp(x)",
+        'pi': "pi * x",
+        'e': "e ** x",
+        'abs': "abs(x - 0.5)",
+        'pow': "pow(x, 2.5)",
+        'asin': "asin(x)",
+        'acos': "acos(x)",
+        'atan': "atan(x)",
+        'sinh': "sinh(x)",
+        'cosh': "cosh(x)",
+        'tanh': "tanh(x)",
+    }
+
+    def test_every_name_is_covered(self):
+        """Test the parity cases cover every name of MATH_NAMESPACE"""
+        assert set(self.EXPRESSIONS) == set(MATH_NAMESPACE)
+
+    @pytest.mark.parametrize("expression", list(EXPRESSIONS.values()) + [
+        "log(x, 2)",
+        "log(x, 10)",
+        "log(x + 1, e)",
+        "ln(x)^2 - log(x, 3)",
+    ])
+    def test_vectorized_matches_scalar(self, expression):
+        """Test func.vectorized gives the scalar values at every point, including log with a base"""
+        func = BiseccionSolver().create_function_from_expression(expression)
+        xs = np.linspace(0.05, 0.95, 19)
+
+        ys, valid = func.vectorized(xs)
+
+        assert valid.all()
+        np.testing.assert_allclose(ys, [func(x) for x in xs], rtol=1e-13, atol=1e-15)
+
+    def test_invalid_points_are_marked(self):
+        """Test points outside the domain are invalid instead of raising"""
+        ys, valid = compile_vectorized("log(x, 2)")(np.array([-1.0, 0.0, 4.0]))
+
+        assert valid.tolist() == [False, False, True]
+        assert ys[2] == 2.0
+
+    def test_array_errors_fall_back_to_scalar(self):
+        """Test expressions that cannot take a whole array are evaluated point by point"""
+        ys, valid = compile_vectorized("x if x > 0 else -1")(np.array([-1.0, 1.0, 2.0]))
+
+        assert valid.all()
+        assert ys.tolist() == [-1.0, 1.0, 2.0]
+
+        ys, valid = compile_vectorized("sqrt(x) if x > 0 else 1/0")(np.array([-1.0, 4.0]))
+        assert valid.tolist() == [False, True]
+        assert ys[1] == 2.0
+
+    def test_evaluate_at_points_with_conditional(self):
+        """Test evaluate_at_points and suggest_better_interval with a Python conditional"""
+        solver = BiseccionSolver()
+        result = solver.evaluate_at_points("x if x > 0 else -1", [-1, 1, 2])
+
+        assert [e['y'] for e in result['evaluations']] == [-1.0, 1.0, 2.0]
+        assert all(e['valid'] for e in result['evaluations'])
+
+        func = solver.create_function_from_expression("x - 1 if x > 0 else -1")
+        suggestion = FunctionValidator.suggest_better_interval(func, 0.5, 3.0)
+        assert suggestion['success']
+        assert suggestion['suggestions'][0]['xl'] <= 1.0 <= suggestion['suggestions'][0]['xu']
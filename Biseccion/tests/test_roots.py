@@ -0,0 +1,99 @@
+"""Tests for finding every root of f over a wide domain"""
+
+import math
+
+import numpy as np
+import pytest
+from solver.roots import RootFinder
+
+
+class TestRootFinder:
+    """Test cases for RootFinder"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.finder = RootFinder()
+
+    def test_every_root_of_sine(self):
+        """Test all 319 multiples of pi in [0, 1000] are found once each"""
+        result = self.finder.find_roots("sin(x)", 0, 1000)
+
+        expected = np.arange(319) * math.pi
+        assert len(result['roots']) == 319
+        np.testing.assert_allclose(result['roots'], expected, rtol=1e-8, atol=1e-12)
+        assert result['failures'] == []
+        assert result['discontinuities'] == []
+
+    def test_three_close_roots(self):
+        """Test roots 0.001 apart are separated, including one that is an exact grid sample"""
+        result = self.finder.find_roots("(x - 1)*(x - 1.001)*(x - 1.002)", 0, 3)
+
+        np.testing.assert_allclose(result['roots'], [1.0, 1.001, 1.002], rtol=1e-8)
+
+    def test_pair_of_roots_without_sign_change_in_the_grid(self):
+        """Test x^2 - 1e-4 gives both roots although the grid cell around 0 has no sign change"""
+        self.finder.initial_points = 10
+        result = self.finder.find_roots("x^2 - 1e-4", -1, 1)
+
+        np.testing.assert_allclose(result['roots'], [-0.01, 0.01], rtol=1e-8)
+
+    def test_poles_are_reported_as_discontinuities(self):
+        """Test the sign changes of tan at its poles are not reported as roots"""
+        result = self.finder.find_roots("tan(x)", -10, 10)
+
+        np.testing.assert_allclose(result['roots'], np.arange(-3, 4) * math.pi, atol=1e-8)
+        poles = [detail['root'] for detail in result['discontinuities']]
+        np.testing.assert_allclose(poles, (np.arange(-3, 3) + 0.5) * math.pi, rtol=1e-7)
+
+    def test_log_with_base(self):
+        """Test log(x, 10) is sampled with the vectorized target and its root found"""
+        result = self.finder.find_roots("log(x, 10)", 0.5, 3)
+
+        assert result['roots'] == [pytest.approx(1.0, rel=1e-10)]
+
+    def test_function_evaluations_add_up(self):
+        """Test the total counts the samples plus the evaluations of every bracket"""
+        result = self.finder.find_roots("sin(x)", 0, 100)
+
+        solved = sum(detail['function_evaluations'] for detail in result['details'])
+        assert result['sample_evaluations'] == result['samples']
+        assert result['function_evaluations'] == result['sample_evaluations'] + solved
+
+    @pytest.mark.parametrize("method", ['Bisección', 'Brent', 'Illinois', 'ITP'])
+    def test_every_bracketing_method(self, method):
+        """Test each method of solver.bracketing can solve the brackets"""
+        self.finder.method = method
+        result = self.finder.find_roots("cos(x) - 0.5", 0, 20)
+
+        expected = sorted([math.pi / 3 + 2 * math.pi * k for k in range(4)] +
+                          [-math.pi / 3 + 2 * math.pi * k for k in range(1, 4)])
+        np.testing.assert_allclose(result['roots'], expected, rtol=1e-8)
+
+    def test_one_and_several_workers_agree(self):
+        """Test solving the brackets in a process pool gives the same result as in process"""
+        self.finder.max_workers = 1
+        serial = self.finder.find_roots("sin(x) * cos(3*x)", 0, 60)
+
+        self.finder.max_workers = 4
+        self.finder.parallel_threshold = 2
+        parallel = self.finder.find_roots("sin(x) * cos(3*x)", 0, 60)
+
+        assert serial['workers'] == 1
+        assert parallel['workers'] == 4
+        assert parallel['roots'] == serial['roots']
+        assert parallel['details'] == serial['details']
+        assert parallel['function_evaluations'] == serial['function_evaluations']
+
+    def test_invalid_arguments(self):
+        """Test reversed limits, unknown methods and too few samples raise ValueError"""
+        with pytest.raises(ValueError, match="menor que el superior"):
+            self.finder.find_roots("x", 1, 0)
+
+        self.finder.method = 'Newton'
+        with pytest.raises(ValueError, match="Método desconocido"):
+            self.finder.find_roots("x", 0, 1)
+
+        self.finder.method = 'Brent'
+        self.finder.initial_points = 1
+        with pytest.raises(ValueError, match="al menos 2 puntos"):
+            self.finder.find_roots("x", 0, 1)
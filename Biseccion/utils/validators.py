@@ -1,6 +1,8 @@
 import math
 from typing import Tuple, Dict, Callable
 
+import numpy as np
+
 
 class FunctionValidator:
     #Validador para funciones matemáticas y parámetros del método de bisección
@@ -179,16 +181,24 @@ class FunctionValidator:
             
             # Evaluar función en varios puntos
             dx = (expanded_xu - expanded_xl) / (num_points - 1)
-            points = []
+            xs = expanded_xl + np.arange(num_points) * dx
             
-            for i in range(num_points):
-                x = expanded_xl + i * dx
-                try:
-                    y = func(x)
-                    if math.isfinite(y):
-                        points.append((x, y))
-                except:
-                    continue
+            vectorized = getattr(func, 'vectorized', None)
+            if vectorized is not None:
+                # Función de create_function_from_expression: todos los puntos en una llamada
+                ys, valid = vectorized(xs)
+                xs, ys = xs[valid], ys[valid]
+                points = list(zip(xs.tolist(), ys.tolist()))
+            else:
+                points = []
+                for x in xs.tolist():
+                    try:
+                        y = func(x)
+                        if math.isfinite(y):
+                            points.append((x, y))
+                    except:
+                        continue
+                ys = np.array([y for _, y in points], dtype=float)
             
             if len(points) < 2:
                 return {
@@ -197,21 +207,15 @@ class FunctionValidator:
                     'suggestions': []
                 }
             
-            # Buscar cambios de signo
-            intervals = []
-            
-            for i in range(len(points) - 1):
-                x1, y1 = points[i]
-                x2, y2 = points[i + 1]
-                
-                if y1 is not None and y2 is not None and y1 * y2 < 0:  # Cambio de signo
-                    intervals.append({
-                        'xl': x1,
-                        'xu': x2,
-                        'f_xl': y1,
-                        'f_xu': y2,
-                        'width': x2 - x1
-                    })
+            # Buscar cambios de signo entre puntos válidos consecutivos
+            changes = np.nonzero(ys[:-1] * ys[1:] < 0)[0]
+            intervals = [{
+                'xl': points[i][0],
+                'xu': points[i + 1][0],
+                'f_xl': points[i][1],
+                'f_xu': points[i + 1][1],
+                'width': points[i + 1][0] - points[i][0]
+            } for i in changes]
             
             if not intervals:
                 return {
@@ -34,7 +34,8 @@ class BiseccionSolver:
             b: Límite superior del intervalo
             
         Returns:
-            Dict con solución, iteraciones y convergencia
+            Dict con solución, iteraciones, convergencia y número de
+            evaluaciones de la función (function_evaluations)
         """
         # Limpiar historiales
         self.iteration_history = []
@@ -48,27 +49,30 @@ class BiseccionSolver:
             return {
                 'success': False,
                 'message': 'La función debe tener signos opuestos en los extremos del intervalo',
-                'iterations': 0
+                'iterations': 0,
+                'function_evaluations': 2
             }
         
+        # Punto medio inicial (también es el punto medio de la iteración 1)
+        c = (a + b) / 2
+        fc = func(c)
+        # Evaluaciones de la función: f(a), f(b) y un punto medio por intervalo
+        evaluations = 3
+        
         # Guardar valores iniciales
         self.iteration_history.append({
             'iteration': 0,
             'a': a,
             'b': b,
-            'c': (a + b) / 2,
+            'c': c,
             'fa': fa,
             'fb': fb,
-            'fc': func((a + b) / 2),
+            'fc': fc,
             'error': abs(b - a)
         })
         
-        # Proceso iterativo de bisección
+        # Proceso iterativo de bisección (fa, fb y fc se arrastran entre iteraciones)
         for i in range(1, self.max_iterations + 1):
-            # Calcular punto medio
-            c = (a + b) / 2
-            fc = func(c)
-            
             # Calcular error (ancho del intervalo)
             error = abs(b - a) / 2
             
@@ -78,8 +82,8 @@ class BiseccionSolver:
                 'a': a,
                 'b': b,
                 'c': c,
-                'fa': func(a),
-                'fb': func(b),
+                'fa': fa,
+                'fb': fb,
                 'fc': fc,
                 'error': error
             }
@@ -95,25 +99,31 @@ class BiseccionSolver:
                     'final_error': error,
                     'function_value': fc,
                     'converged': True,
-                    'history': self.iteration_history
+                    'history': self.iteration_history,
+                    'function_evaluations': evaluations
                 }
             
-            # Decidir qué mitad del intervalo mantener
-            if func(a) * fc < 0:
-                b = c  # La raíz está en [a, c]
+            # Decidir qué mitad del intervalo mantener (el punto medio conserva su valor)
+            if fa * fc < 0:
+                b, fb = c, fc  # La raíz está en [a, c]
             else:
-                a = c  # La raíz está en [c, b]
+                a, fa = c, fc  # La raíz está en [c, b]
+            
+            # Punto medio del nuevo intervalo: la única evaluación nueva por iteración
+            c = (a + b) / 2
+            fc = func(c)
+            evaluations += 1
         
         # Si llegamos aquí, no convergió en max_iterations
-        c = (a + b) / 2
         return {
             'success': True,
             'root': c,
             'iterations': self.max_iterations,
             'final_error': abs(b - a) / 2,
-            'function_value': func(c),
+            'function_value': fc,
             'converged': False,
-            'history': self.iteration_history
+            'history': self.iteration_history,
+            'function_evaluations': evaluations
         }
     
     def generate_step_by_step(self, func: Callable[[float], float], a: float, b: float,
@@ -0,0 +1,53 @@
+"""Tests for the braking-distance bisection solver"""
+
+from solver.biseccion import BiseccionSolver
+from solver.lagrange import LagrangeSolver
+
+
+def counting(func):
+    """Wrap func so the number of calls is available as wrapper.calls"""
+    def wrapper(x):
+        wrapper.calls += 1
+        return func(x)
+
+    wrapper.calls = 0
+    return wrapper
+
+
+class TestBiseccionSolver:
+    """Test cases for BiseccionSolver"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.solver = BiseccionSolver()
+
+    def test_function_evaluations_match_calls(self):
+        """Test function_evaluations counts f(a), f(b) and one midpoint per iteration"""
+        lagrange = LagrangeSolver()
+        lagrange.set_points([20, 40, 60, 80, 100], [6, 16, 32, 52, 76])
+        # velocidad maxima con la que se frena en 40 m
+        func = counting(lambda v: lagrange.interpolate(v) - 40)
+
+        result = self.solver.solve(func, 20, 100)
+
+        assert result['converged']
+        assert abs(func(result['root'])) < 0.01
+        assert result['function_evaluations'] == func.calls - 1 == 19
+        assert result['function_evaluations'] == result['iterations'] + 2
+
+    def test_function_evaluations_without_convergence(self):
+        """Test the count stays exact when max_iterations stops the loop"""
+        self.solver.max_iterations = 4
+        func = counting(lambda x: x * x - 2)
+        result = self.solver.solve(func, 0, 2)
+
+        assert not result['converged']
+        assert result['function_evaluations'] == func.calls == 7
+
+    def test_same_signs_report_two_evaluations(self):
+        """Test an interval without a sign change reports the two endpoint evaluations"""
+        func = counting(lambda x: x * x + 1)
+        result = self.solver.solve(func, -1, 1)
+
+        assert not result['success']
+        assert result['function_evaluations'] == func.calls == 2
@@ -0,0 +1,80 @@
+"""
+benchmark del barrido por bloques: sustituciones de lu_solve fila por fila en
+cada bloque (version original) contra la inversa del bloque armada una sola
+vez de BlockGaussSeidelSolver._sweep, con el barrido escalar como referencia
+
+uso (desde la carpeta Gauss-Seidel):
+    python benchmarks/benchmark_block.py
+    python benchmarks/benchmark_block.py --sizes 300 3000 --block-size 6 --sweeps 20
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from solver.block import BlockGaussSeidelSolver, lu_factor, lu_solve  # noqa: E402
+from solver.gauss_seidel import GaussSeidelSolver  # noqa: E402
+
+
+def make_system(n: int, size: int, seed: int = 0):
+    """genera un sistema con bloques de size x size fuertemente acoplados y acople debil entre bloques"""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(-0.1, 0.1, size=(n, n))
+    for start in range(0, n, size):
+        block = slice(start, min(start + size, n))
+        B = rng.uniform(-1.0, 1.0, size=(block.stop - start, block.stop - start))
+        A[block, block] = B + B.T
+    A[np.diag_indices(n)] = np.abs(A).sum(axis=1) + 1.0
+    b = rng.uniform(-10.0, 10.0, size=n)
+    return A, b
+
+
+def legacy_block_sweep(solver: BlockGaussSeidelSolver, A: np.ndarray):
+    """barrido original: lu_solve (bucles de python por fila) en cada bloque; los factores se arman fuera"""
+    plan = [(rows, off_rows, lu_factor(A[np.ix_(rows, rows)])) for rows, off_rows, _ in solver._block_plan(A)]
+
+    def sweep(A: np.ndarray, b: np.ndarray, x: np.ndarray) -> None:
+        for rows, off_rows, factors in plan:
+            x[rows] = lu_solve(factors, b[rows] - off_rows @ x)
+
+    return sweep
+
+
+def time_sweeps(sweep, A: np.ndarray, b: np.ndarray, sweeps: int):
+    """ejecuta `sweeps` barridos desde cero y retorna (segundos por barrido, x)"""
+    x = np.zeros(len(b))
+    start = time.perf_counter()
+    for _ in range(sweeps):
+        sweep(A, b, x)
+    elapsed = time.perf_counter() - start
+    return elapsed / sweeps, x
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[300, 3000])
+    parser.add_argument("--block-size", type=int, default=3)
+    parser.add_argument("--sweeps", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'n':>6} {'escalar (s/barrido)':>20} {'lu_solve (s/barrido)':>21} {'inversa (s/barrido)':>20} "
+          f"{'aceleracion':>12} {'max |dx|':>10}")
+    for n in args.sizes:
+        A, b = make_system(n, args.block_size)
+        solver = BlockGaussSeidelSolver(block_size=args.block_size)
+
+        t_scalar, _ = time_sweeps(GaussSeidelSolver._sweep, A, b, args.sweeps)
+        t_legacy, x_legacy = time_sweeps(legacy_block_sweep(solver, A), A, b, args.sweeps)
+        t_new, x_new = time_sweeps(solver._sweep, A, b, args.sweeps)
+
+        diff = np.max(np.abs(x_legacy - x_new))
+        print(f"{n:>6} {t_scalar:>20.6f} {t_legacy:>21.6f} {t_new:>20.6f} {t_legacy / t_new:>11.1f}x {diff:>10.2e}")
+
+
+if __name__ == "__main__":
+    main()
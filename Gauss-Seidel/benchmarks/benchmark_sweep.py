@@ -0,0 +1,72 @@
+"""
+benchmark del barrido de gauss-seidel: bucle original en python puro contra
+el kernel con productos punto de numpy de GaussSeidelSolver._sweep
+
+uso (desde la carpeta Gauss-Seidel):
+    python benchmarks/benchmark_sweep.py
+    python benchmarks/benchmark_sweep.py --sizes 10 50 500 --sweeps 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from solver.gauss_seidel import GaussSeidelSolver  # noqa: E402
+
+
+def legacy_sweep(A: np.ndarray, b: np.ndarray, x: np.ndarray) -> None:
+    """barrido original: dos sumas con generadores por cada fila"""
+    n = len(A)
+    x_old = x.copy()
+    for i in range(n):
+        sum1 = sum(A[i][j] * x[j] for j in range(i))
+        sum2 = sum(A[i][j] * x_old[j] for j in range(i + 1, n))
+        x[i] = (b[i] - sum1 - sum2) / A[i][i]
+
+
+def make_system(n: int, seed: int = 0):
+    """genera un sistema aleatorio diagonalmente dominante de tamano n"""
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(-1.0, 1.0, size=(n, n))
+    A[np.diag_indices(n)] = np.abs(A).sum(axis=1) + 1.0
+    b = rng.uniform(-10.0, 10.0, size=n)
+    return A, b
+
+
+def time_sweeps(sweep, A: np.ndarray, b: np.ndarray, sweeps: int):
+    """ejecuta `sweeps` barridos desde cero y retorna (segundos por barrido, x)"""
+    x = np.zeros(len(b))
+    start = time.perf_counter()
+    for _ in range(sweeps):
+        sweep(A, b, x)
+    elapsed = time.perf_counter() - start
+    return elapsed / sweeps, x
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 500, 5000])
+    parser.add_argument("--sweeps", type=int, default=5,
+                        help="barridos medidos por tamano (el bucle original usa 1 para n > 500)")
+    args = parser.parse_args()
+
+    print(f"{'n':>6} {'original (s/barrido)':>22} {'numpy (s/barrido)':>20} {'aceleracion':>12} {'max |dx|':>10}")
+    for n in args.sizes:
+        A, b = make_system(n)
+        legacy_count = args.sweeps if n <= 500 else 1
+
+        t_legacy, x_legacy = time_sweeps(legacy_sweep, A, b, legacy_count)
+        _, x_new = time_sweeps(GaussSeidelSolver._sweep, A, b, legacy_count)
+        t_new, _ = time_sweeps(GaussSeidelSolver._sweep, A, b, args.sweeps)
+
+        diff = np.max(np.abs(x_legacy - x_new))
+        print(f"{n:>6} {t_legacy:>22.6f} {t_new:>20.6f} {t_legacy / t_new:>11.1f}x {diff:>10.2e}")
+
+
+if __name__ == "__main__":
+    main()
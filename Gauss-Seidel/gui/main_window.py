@@ -30,6 +30,8 @@ class GaussSeidelApp(ctk.CTk):
         # variables de estado de la aplicacion
         self.current_size = 3  # tamano actual del sistema
         self.solver = GaussSeidelSolver()  # instancia del solver
+        # la vista paso a paso solo muestra las primeras iteraciones: no retener todas
+        self.solver.history_policy = 'ends'
         # estado: ultima solucion calculada (no se usa)
         # eliminado para simplificar
 
@@ -600,7 +602,7 @@ class GaussSeidelApp(ctk.CTk):
             self.update_idletasks()
 
             # generar pasos detallados del proceso
-            steps_data = self.solver.generate_step_by_step(A, b)
+            steps_data = self.solver.generate_step_by_step(A, b, dominance_result['dominance'])
 
             # actualizar panel de visualizacion con los resultados
             self.visualization_panel.update_visualization(steps_data)
@@ -612,6 +614,9 @@ class GaussSeidelApp(ctk.CTk):
             result = steps_data[-1]  # ultimo paso contiene el resultado final
             if result['converged']:
                 self.update_status("sistema resuelto con exito")
+            elif result.get('status') == 'diverging':
+                self.update_status(f"el metodo diverge: se detuvo tras {result['iterations']} iteraciones",
+                                   is_warning=True)
             else:
                 self.update_status("sistema resuelto (convergencia no alcanzada)", is_warning=True)
 
@@ -0,0 +1,94 @@
+import numpy as np
+from collections import deque
+from typing import Optional
+
+
+class AndersonAcceleration:
+    """
+    mezcla de anderson para la iteracion de punto fijo x -> g(x) de gauss-seidel
+
+    guarda las ultimas `window` diferencias de los residuos de punto fijo
+    f_k = g(x_k) - x_k y de las imagenes g(x_k), y propone la combinacion de las
+    imagenes que minimiza (por minimos cuadrados) el residuo combinado.
+    """
+
+    def __init__(self, window: int = 5):
+        if window < 1:
+            raise ValueError("la ventana de anderson debe ser al menos 1")
+        # numero de diferencias retenidas
+        self.window = window
+        # diferencias de residuos e imagenes entre iteraciones consecutivas
+        self._df = deque(maxlen=window)
+        self._dg = deque(maxlen=window)
+        # residuo e imagen de la iteracion anterior
+        self._f_prev = None
+        self._g_prev = None
+
+    def update(self, x: np.ndarray, gx: np.ndarray) -> Optional[np.ndarray]:
+        """recibe x_k y g(x_k); retorna la propuesta acelerada o None si aun no hay historial"""
+        f = gx - x
+        if self._f_prev is not None:
+            self._df.append(f - self._f_prev)
+            self._dg.append(gx - self._g_prev)
+        self._f_prev, self._g_prev = f, gx.copy()
+        if not self._df:
+            return None
+
+        dF = np.column_stack(self._df)
+        dG = np.column_stack(self._dg)
+        gamma = np.linalg.lstsq(dF, f, rcond=None)[0]
+        return gx - dG @ gamma
+
+    def reset(self) -> None:
+        """descarta el historial (por ejemplo, tras rechazar una propuesta)"""
+        self._df.clear()
+        self._dg.clear()
+        self._f_prev = None
+        self._g_prev = None
+
+
+class AitkenAcceleration:
+    """
+    extrapolacion delta cuadrado de aitken (version vectorial)
+
+    toma tres iteraciones consecutivas x0, x1 = g(x0), x2 = g(x1) y extrapola
+    x2 - (<d2, dd> / <dd, dd>) d2, con d2 = x2 - x1 y dd = x2 - 2 x1 + x0. si el
+    error se contrae con un factor rho por barrido, el resultado equivale a
+    sumar la serie geometrica que queda. despues de cada extrapolacion el ciclo
+    vuelve a empezar desde el punto propuesto.
+    """
+
+    def __init__(self):
+        # iteraciones consecutivas del ciclo actual
+        self._points = []
+
+    def update(self, x: np.ndarray, gx: np.ndarray) -> Optional[np.ndarray]:
+        """recibe x_k y g(x_k); retorna la extrapolacion cada tres iteraciones, si no None"""
+        if not self._points:
+            self._points = [x.copy(), gx.copy()]
+        else:
+            self._points.append(gx.copy())
+        if len(self._points) < 3:
+            return None
+
+        x0, x1, x2 = self._points
+        self._points = []
+        d2 = x2 - x1
+        dd = d2 - (x1 - x0)
+        denominator = float(dd @ dd)
+        if denominator == 0.0:
+            return None
+        return x2 - (float(d2 @ dd) / denominator) * d2
+
+    def reset(self) -> None:
+        """descarta el ciclo actual"""
+        self._points = []
+
+
+def make_accelerator(method: str, window: int = 5):
+    """crea el acelerador indicado: 'anderson' o 'aitken'"""
+    if method == 'anderson':
+        return AndersonAcceleration(window)
+    if method == 'aitken':
+        return AitkenAcceleration()
+    raise ValueError(f"metodo de aceleracion desconocido: {method}")
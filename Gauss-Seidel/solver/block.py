@@ -0,0 +1,170 @@
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .gauss_seidel import GaussSeidelSolver
+from .sparse import CSRMatrix
+
+
+class BlockGaussSeidelSolver(GaussSeidelSolver):
+    """
+    gauss-seidel por bloques: cada barrido actualiza un bloque de incognitas a la vez
+
+    para matrices con grados de libertad acoplados por nodo (bloques de 3x3,
+    6x6, ...), donde el gauss-seidel escalar converge mal. cada bloque diagonal
+    A_BB se factoriza una sola vez por resolucion (lu con pivoteo parcial) y con
+    los factores se arma su inversa; el barrido calcula x_B = A_BB^-1 (b_B - A_B,resto x_resto)
+    para cada bloque con dos productos matriz-vector, usando los valores mas
+    recientes de los bloques anteriores.
+
+    la particion se da con block_size (bloques contiguos del mismo tamano) o
+    con blocks (lista de arreglos de indices que cubre cada incognita una vez).
+    todo lo demas (convergencia, historial, omega, resultado) es igual que en
+    GaussSeidelSolver.
+    """
+
+    def __init__(self, block_size: int = 3, blocks: Optional[Sequence[Sequence[int]]] = None):
+        super().__init__()
+        # tamano de los bloques contiguos (si no se da una particion explicita)
+        self.block_size = block_size
+        # particion explicita de las incognitas en bloques (tiene prioridad sobre block_size)
+        self.blocks = blocks
+        # (matriz, plan de bloques) de la resolucion en curso; se arma de nuevo en cada resolucion
+        self._plan = None
+
+    def solve(self, A, b: np.ndarray, x0: Optional[np.ndarray] = None, record_steps: int = 0,
+              dominance: Optional[Dict] = None) -> Dict:
+        """
+        resuelve ax = b con barridos por bloques
+
+        args y resultado como en GaussSeidelSolver.solve; el resultado incluye
+        ademas 'blocks' (numero de bloques de la particion)
+        """
+        if self.ordering != 'natural':
+            raise ValueError("gauss-seidel por bloques solo admite el orden natural")
+        A = self._prepare_matrix(A)
+        if not isinstance(A, (np.ndarray, CSRMatrix)):
+            raise ValueError("gauss-seidel por bloques requiere una matriz ensamblada en memoria (densa o csr)")
+
+        self._prepare_sweeps(A)
+        result = super().solve(A, b, x0, record_steps, dominance)
+        result['blocks'] = len(self._plan[1])
+        return result
+
+    def _sweep(self, A, b: np.ndarray, x: np.ndarray, omega: float = 1.0, sums: Optional[np.ndarray] = None,
+               reverse: bool = False) -> None:
+        """
+        barrido de gauss-seidel por bloques (in situ)
+
+        por cada bloque: un producto de sus filas sin el bloque diagonal con x
+        (que ya tiene los valores nuevos de los bloques anteriores) y otro
+        con la inversa guardada del bloque diagonal. si se pasa `sums`, se registran las sumas
+        parciales escalares equivalentes para la explicacion paso a paso.
+        """
+        if self._plan is None or self._plan[0] is not A:
+            # barrido fuera de una resolucion (o sobre otra matriz, como la copia float32 de precision mixta)
+            self._prepare_sweeps(A)
+        plan = self._plan[1]
+        for rows, off_rows, inverse in (reversed(plan) if reverse else plan):
+            value = inverse @ (b[rows] - off_rows @ x)
+            if sums is not None:
+                self._record_block_sums(A, rows, value, x, sums)
+            x[rows] = value if omega == 1.0 else x[rows] + omega * (value - x[rows])
+
+    @staticmethod
+    def _record_block_sums(A, rows: np.ndarray, value: np.ndarray, x: np.ndarray, sums: np.ndarray) -> None:
+        """
+        sumas (sum1, sum2) de cada fila del bloque, como en el barrido escalar
+
+        con x_B resuelto, cada fila cumple x_i = (b_i - sum1 - sum2) / a_ii si sum1
+        usa las columnas j < i y sum2 las j > i, con los valores nuevos del bloque.
+        """
+        current = x.copy()
+        current[rows] = value
+        for i in rows:
+            cols, coeffs = GaussSeidelSolver._row_entries(A, i)
+            lower, upper = cols < i, cols > i
+            sums[i] = coeffs[lower] @ current[cols[lower]], coeffs[upper] @ current[cols[upper]]
+
+    def _partition(self, n: int) -> List[np.ndarray]:
+        """retorna la particion en bloques, validando que cubra cada incognita una vez"""
+        if self.blocks is None:
+            if self.block_size < 1:
+                raise ValueError(f"block_size debe ser al menos 1, recibido: {self.block_size}")
+            return [np.arange(start, min(start + self.block_size, n)) for start in range(0, n, self.block_size)]
+
+        blocks = [np.asarray(block, dtype=np.int64) for block in self.blocks]
+        if any(len(block) == 0 for block in blocks):
+            raise ValueError("la particion contiene bloques vacios")
+        covered = np.concatenate(blocks)
+        if len(covered) != n or not np.array_equal(np.sort(covered), np.arange(n)):
+            raise ValueError(f"la particion debe cubrir cada una de las {n} incognitas exactamente una vez")
+        return blocks
+
+    def _block_plan(self, A) -> List[Tuple[np.ndarray, object, np.ndarray]]:
+        """
+        prepara (filas, filas_sin_bloque_diagonal, inversa del bloque) por bloque
+
+        la inversa se arma una sola vez con los factores lu (resolviendo contra
+        la identidad), asi el barrido aplica cada bloque con un solo producto
+        en lugar de las sustituciones fila por fila de lu_solve.
+        """
+        plan = []
+        for rows in self._partition(len(A)):
+            if isinstance(A, CSRMatrix):
+                sub = A.select_rows(rows)
+                inside = np.isin(sub.indices, rows)
+                # bloque diagonal denso: posicion de cada columna dentro del bloque
+                local = np.full(A.shape[1], -1, dtype=np.int64)
+                local[rows] = np.arange(len(rows))
+                diagonal_block = np.zeros((len(rows), len(rows)))
+                np.add.at(diagonal_block, (sub.row_ids[inside], local[sub.indices[inside]]), sub.data[inside])
+                off_rows = CSRMatrix.from_coo(sub.row_ids[~inside], sub.indices[~inside], sub.data[~inside],
+                                              sub.shape)
+            else:
+                diagonal_block = A[np.ix_(rows, rows)].copy()
+                off_rows = A[rows].copy()
+                off_rows[:, rows] = 0.0
+            plan.append((rows, off_rows, lu_solve(lu_factor(diagonal_block), np.eye(len(rows)))))
+        return plan
+
+    def _prepare_sweeps(self, A) -> None:
+        """arma el plan de bloques de A una vez por resolucion (nunca se reutiliza entre resoluciones)"""
+        self._plan = (A, self._block_plan(A))
+
+
+def lu_factor(M: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    factorizacion lu con pivoteo parcial de una matriz cuadrada pequena
+
+    returns:
+        (lu, perm): L (diagonal unitaria, bajo la diagonal) y U guardadas en una
+        sola matriz, y la permutacion de filas tal que M[perm] = L U
+    """
+    lu = np.array(M, dtype=float)
+    n = len(lu)
+    perm = np.arange(n)
+    scale = np.max(np.abs(lu)) if lu.size else 0.0
+    for k in range(n):
+        pivot = k + int(np.argmax(np.abs(lu[k:, k])))
+        if abs(lu[pivot, k]) <= 1e-14 * max(scale, 1.0):
+            raise ValueError(f"bloque diagonal singular (columna {k + 1} sin pivote)")
+        if pivot != k:
+            lu[[k, pivot]] = lu[[pivot, k]]
+            perm[[k, pivot]] = perm[[pivot, k]]
+        lu[k + 1:, k] /= lu[k, k]
+        lu[k + 1:, k + 1:] -= np.outer(lu[k + 1:, k], lu[k, k + 1:])
+    return lu, perm
+
+
+def lu_solve(factors: Tuple[np.ndarray, np.ndarray], rhs: np.ndarray) -> np.ndarray:
+    """resuelve M y = rhs con los factores de lu_factor (rhs puede ser n x k)"""
+    lu, perm = factors
+    y = np.array(rhs, dtype=float)[perm]
+    n = len(lu)
+    # sustitucion hacia adelante con L (diagonal unitaria)
+    for i in range(1, n):
+        y[i] -= lu[i, :i] @ y[:i]
+    # sustitucion hacia atras con U
+    for i in range(n - 1, -1, -1):
+        y[i] = (y[i] - lu[i, i + 1:] @ y[i + 1:]) / lu[i, i]
+    return y
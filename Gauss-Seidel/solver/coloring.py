@@ -0,0 +1,70 @@
+import numpy as np
+from typing import List, Optional, Tuple
+
+from .sparse import CSRMatrix
+
+
+def greedy_coloring(A: CSRMatrix) -> np.ndarray:
+    """
+    colorea el grafo de adyacencia de A con el algoritmo greedy
+
+    dos incognitas i, j son vecinas si a_ij != 0 o a_ji != 0; incognitas con el
+    mismo color no dependen entre si, asi que pueden actualizarse a la vez.
+
+    returns:
+        arreglo con el color (0, 1, ...) asignado a cada incognita
+    """
+    n = A.shape[0]
+    # patron simetrico sin diagonal: A + A^T
+    off = A.off_diagonal()
+    rows = np.concatenate([off.row_ids, off.indices])
+    cols = np.concatenate([off.indices, off.row_ids])
+    order = np.argsort(rows, kind="stable")
+    neighbors = cols[order]
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+
+    colors = np.full(n, -1, dtype=np.int64)
+    for i in range(n):
+        # colores ya usados por los vecinos coloreados
+        used = colors[neighbors[indptr[i]:indptr[i + 1]]]
+        used = used[used >= 0]
+        taken = np.zeros(len(used) + 1, dtype=bool)
+        taken[used[used <= len(used)]] = True
+        # menor color libre
+        colors[i] = int(np.argmin(taken))
+    return colors
+
+
+def build_color_plan(A, min_class_size: int) -> Tuple[int, Optional[List[Tuple[np.ndarray, object, np.ndarray]]]]:
+    """
+    prepara los datos de un barrido multicolor
+
+    args:
+        A: matriz densa (np.ndarray) o CSRMatrix
+        min_class_size: tamano promedio minimo de una clase de color; si el
+            coloreo es mas fino que esto, el barrido por colores no compensa
+
+    returns:
+        tuple con (numero_de_colores, plan). plan es None si conviene el orden
+        natural; si no, es una lista de (filas, filas_sin_diagonal, diagonal)
+        por color, donde filas_sin_diagonal tiene el mismo tipo que A
+    """
+    sparse = A if isinstance(A, CSRMatrix) else CSRMatrix.from_dense(A)
+    colors = greedy_coloring(sparse)
+    n_colors = int(colors.max()) + 1 if len(colors) else 0
+
+    if n_colors == 0 or len(colors) / n_colors < min_class_size:
+        return n_colors, None
+
+    diagonal = sparse.diagonal()
+    plan = []
+    for color in range(n_colors):
+        rows = np.flatnonzero(colors == color)
+        if isinstance(A, CSRMatrix):
+            block = A.off_diagonal().select_rows(rows)
+        else:
+            block = A[rows].copy()
+            block[np.arange(len(rows)), rows] = 0.0
+        plan.append((rows, block, diagonal[rows]))
+    return n_colors, plan
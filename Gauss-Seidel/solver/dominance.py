@@ -0,0 +1,54 @@
+import numpy as np
+from typing import Dict
+
+from .operator import RowOperator
+from .out_of_core import MemmapMatrix
+from .sparse import CSRMatrix
+
+
+def analyze_dominance(A) -> Dict:
+    """
+    analiza la dominancia diagonal de A de forma vectorizada
+
+    calcula |a_ii| y la suma de |a_ij| fuera de la diagonal en una sola pasada.
+    no se guarda nada asociado a la matriz (podria modificarse in situ): para
+    no repetir el analisis, el validador lo retorna en
+    make_diagonally_dominant(...)['dominance'] y solve lo acepta como argumento.
+
+    args:
+        A: matriz cuadrada densa (np.ndarray), CSRMatrix, RowOperator o MemmapMatrix
+
+    returns:
+        dict con:
+        - diagonal: |a_ii| por fila
+        - off_diagonal_sums: suma de |a_ij| (j != i) por fila
+        - margins: |a_ii| - suma(|a_ij|) por fila (> 0 en filas estrictamente dominantes)
+        - weakest_row: fila con el menor margen
+        - weakest_margin: margen de esa fila
+        - is_strict: todas las filas cumplen |a_ii| > suma(|a_ij|)
+        - is_weak: todas las filas cumplen |a_ii| >= suma(|a_ij|)
+    """
+    if isinstance(A, (CSRMatrix, RowOperator, MemmapMatrix)):
+        diagonal = np.abs(A.diagonal())
+        off_diagonal_sums = A.abs_row_sums() - diagonal
+    else:
+        A = np.asarray(A, dtype=float)
+        diagonal = np.abs(np.diagonal(A))
+        off_diagonal_sums = np.abs(A).sum(axis=1) - diagonal
+
+    return _build_analysis(diagonal, off_diagonal_sums)
+
+
+def _build_analysis(diagonal: np.ndarray, off_diagonal_sums: np.ndarray) -> Dict:
+    """arma el dict de analisis a partir de |diag| y las sumas fuera de la diagonal"""
+    margins = diagonal - off_diagonal_sums
+    weakest_row = int(np.argmin(margins)) if len(margins) else -1
+    return {
+        'diagonal': diagonal,
+        'off_diagonal_sums': off_diagonal_sums,
+        'margins': margins,
+        'weakest_row': weakest_row,
+        'weakest_margin': float(margins[weakest_row]) if len(margins) else 0.0,
+        'is_strict': bool(np.all(diagonal > off_diagonal_sums)),
+        'is_weak': bool(np.all(diagonal >= off_diagonal_sums))
+    }
@@ -1,5 +1,14 @@
 import numpy as np
-from typing import List, Dict
+from collections.abc import Sequence
+from typing import List, Dict, Optional, Tuple
+
+from .acceleration import make_accelerator
+from .coloring import build_color_plan
+from .dominance import analyze_dominance
+from .history import IterationHistory
+from .operator import RowOperator
+from .out_of_core import DEFAULT_MEMORY_BUDGET, MemmapMatrix
+from .sparse import CSRMatrix, as_csr
 
 
 class GaussSeidelSolver:
@@ -12,99 +21,766 @@ class GaussSeidelSolver:
     """
 
     def __init__(self):
-        # historial de todas las iteraciones del proceso
+        # historial de las iteraciones retenidas del proceso
         self.iteration_history = []
+        # numero de iteracion de cada estado retenido en iteration_history
+        self.history_iterations = []
+        # sumas parciales registradas durante los primeros barridos (paso a paso)
+        self.step_records = []
         # historial de errores entre iteraciones consecutivas
         self.error_history = []
         # numero maximo de iteraciones permitidas
         self.max_iterations = 100
         # tolerancia para determinar convergencia
         self.tolerance = 0.000001
+        # factor de relajacion (sor): 1.0 es gauss-seidel clasico, 'auto' lo estima
+        self.omega = 1.0
+        # barridos minimos con omega = 1 antes de estimar el omega optimo en modo 'auto'
+        self.omega_probe_iterations = 5
+        # orden de actualizacion: 'natural' o 'multicolor' (clases de color independientes)
+        self.ordering = 'natural'
+        # tamano promedio minimo por color para que el barrido multicolor compense
+        self.min_color_class_size = 16
+        # retencion del historial: 'full', 'none', 'ends' (primeras y ultimas) o 'every'
+        self.history_policy = 'full'
+        # iteraciones retenidas al inicio y al final con la politica 'ends'
+        self.history_size = 10
+        # se retiene una de cada `history_stride` iteraciones con la politica 'every'
+        self.history_stride = 10
+        # gauss-seidel simetrico: cada iteracion es un barrido hacia adelante y otro hacia atras
+        self.symmetric = False
+        # numero de cocientes de errores consecutivos usados para estimar el radio espectral
+        self.rate_window = 5
+        # crecimiento del error (respecto al minimo observado) a partir del cual se aborta
+        self.divergence_factor = 1e4
+        # aceleracion del punto fijo: None, 'anderson' o 'aitken' (solo un lado derecho)
+        self.acceleration = None
+        # iteraciones anteriores que combina la mezcla de anderson
+        self.anderson_window = 5
+        # memoria maxima (bytes) del bloque de filas leido por barrido con matrices en disco
+        self.memory_budget = DEFAULT_MEMORY_BUDGET
+        # precision de los barridos: 'double' (float64) o 'mixed' (float32 con refinamiento en float64)
+        self.precision = 'double'
+        # en modo 'mixed', cada correccion en float32 se barre hasta reducir su cambio en este factor
+        self.mixed_inner_reduction = 1e-4
 
-    def solve(self, A: np.ndarray, b: np.ndarray) -> Dict:
+    def solve(self, A: np.ndarray, b: np.ndarray, x0: Optional[np.ndarray] = None, record_steps: int = 0,
+              dominance: Optional[Dict] = None) -> Dict:
         """
         resuelve el sistema ax = b usando gauss-seidel
 
         args:
-            a: matriz de coeficientes (n x n)
-            b: vector de terminos independientes (n x 1)
+            a: matriz de coeficientes (n x n), densa o dispersa
+               (CSRMatrix o matriz de scipy.sparse), un RowOperator sin
+               matriz ensamblada que genera cada fila bajo demanda, o una
+               matriz en disco (np.memmap / MemmapMatrix) que se barre por bloques
+            b: vector de terminos independientes (n x 1), o matriz (n x k) con
+               k lados derechos que se resuelven juntos (ver _solve_multiple)
+            x0: aproximacion inicial opcional (misma forma que b); por defecto ceros
+            record_steps: numero de barridos iniciales cuyas sumas parciales por
+               fila se guardan en self.step_records (para generate_step_by_step)
+            dominance: analisis de dominancia ya calculado para esta A (por ejemplo
+               make_diagonally_dominant(...)['dominance']); si no se da, se
+               calcula una vez aqui
 
         returns:
-            dict con solucion, iteraciones, convergencia y errores
+            dict con solucion, iteraciones, convergencia, errores y el omega usado;
+            ademas status ('converged', 'diverging' o 'max_iterations'),
+            spectral_radius_estimate (tasa de contraccion observada) y
+            predicted_remaining_iterations (barridos que faltarian, o None),
+            acceleration (pasos acelerados aceptados/rechazados, o None),
+            precision y sweeps_by_precision (barridos en float32 y en float64)
         """
+        A = self._prepare_matrix(A)
+        b = np.asarray(b, dtype=float)
+
+        # factor de relajacion inicial (en modo 'auto' se empieza con gauss-seidel)
+        auto_omega = self.omega == 'auto'
+        omega = 1.0 if auto_omega else float(self.omega)
+        if not 0 < omega < 2:
+            raise ValueError(f"omega debe estar en el intervalo (0, 2), recibido: {omega}")
+
+        # pre-paso de coloreo: con orden 'multicolor' cada color se actualiza de una vez
+        n_colors, color_plan = None, None
+        if self.ordering == 'multicolor':
+            if isinstance(A, (RowOperator, MemmapMatrix)):
+                raise ValueError("el orden multicolor requiere una matriz ensamblada en memoria (densa o csr)")
+            n_colors, color_plan = build_color_plan(A, self.min_color_class_size)
+        elif self.ordering != 'natural':
+            raise ValueError(f"orden desconocido: {self.ordering}")
+        ordering = 'natural' if color_plan is None else 'multicolor'
+
         # obtener dimension del sistema
         n = len(A)
 
         # validar si la matriz es diagonalmente dominante
-        if not self._is_diagonally_dominant(A):
+        if dominance is None:
+            dominance = analyze_dominance(A)
+        if not dominance['is_strict']:
             print("advertencia: la matriz no es diagonalmente dominante. la convergencia no esta garantizada.")
 
-        # inicializar vector solucion con vector de ceros
-        x = np.zeros(n)
+        # aproximacion inicial: la dada por el usuario (copiada) o ceros
+        x = self._initial_guess(x0, b.shape)
+
+        # precision mixta: barridos en float32 con refinamiento iterativo en float64
+        if self.precision == 'mixed':
+            return self._solve_mixed(A, b, x, omega, auto_omega, color_plan, ordering, n_colors)
+        if self.precision != 'double':
+            raise ValueError(f"precision desconocida: {self.precision}")
+
+        # varios lados derechos: barrer todas las columnas juntas
+        if b.ndim == 2:
+            if self.acceleration is not None:
+                raise ValueError("la aceleracion solo esta disponible para un lado derecho")
+            return self._solve_multiple(A, b, x, omega, auto_omega, color_plan, ordering, n_colors)
 
         # limpiar historiales de iteraciones anteriores
-        self.iteration_history = []
+        history = IterationHistory(n, self.max_iterations, self.history_policy,
+                                   self.history_size, self.history_stride)
         self.error_history = []
+        self.step_records = []
 
         # guardar estado inicial en el historial
-        self.iteration_history.append(x.copy())
+        history.record(0, x)
+        bytes_before = A.bytes_read if isinstance(A, MemmapMatrix) else 0
+
+        # aceleracion opcional; residual_norm es ||b - Ax|| del iterado actual si se conoce
+        accelerator = None
+        if self.acceleration is not None:
+            accelerator = make_accelerator(self.acceleration, self.anderson_window)
+        accepted_steps = rejected_steps = 0
+        residual_norm = None
 
         # ejecutar iteraciones de gauss-seidel
+        converged = False
+        diverging = False
+        iterations = self.max_iterations
+        error = np.inf
         for iteration in range(self.max_iterations):
             # guardar estado anterior para calcular error
             x_old = x.copy()
 
-            # actualizar cada componente del vector solucion
-            for i in range(n):
-                # suma de elementos ya actualizados (indices < i)
-                sum1 = sum(A[i][j] * x[j] for j in range(i))
-                # suma de elementos no actualizados (indices > i)
-                sum2 = sum(A[i][j] * x_old[j] for j in range(i + 1, n))
-                # calcular nuevo valor de x[i]
-                x[i] = (b[i] - sum1 - sum2) / A[i][i]
+            # en los primeros barridos, registrar las sumas parciales de cada fila
+            sums = np.empty((n, 2)) if iteration < record_steps else None
+
+            # en modo simetrico, guardar tambien el estado entre los dos medios barridos
+            forward = np.empty(n) if sums is not None and self.symmetric else None
+
+            # actualizar cada componente del vector solucion (in situ)
+            self._gauss_seidel_step(A, b, x, omega, color_plan, sums, forward)
+
+            if sums is not None:
+                self.step_records.append({
+                    'iteration': iteration + 1,
+                    'previous_solution': x_old,
+                    'forward_solution': forward,
+                    'solution': x.copy(),
+                    'sums': sums,
+                    'omega': omega
+                })
+
+            # proponer un paso acelerado con x_old y g(x_old) = x; se acepta solo si no
+            # aumenta el residual respecto al iterado anterior
+            if accelerator is not None:
+                candidate = accelerator.update(x_old, x)
+                if candidate is None:
+                    residual_norm = None
+                else:
+                    if residual_norm is None:
+                        residual_norm = np.linalg.norm(b - A @ x_old)
+                    candidate_norm = np.linalg.norm(b - A @ candidate)
+                    if candidate_norm <= residual_norm:
+                        x[:] = candidate
+                        residual_norm = candidate_norm
+                        accepted_steps += 1
+                    else:
+                        accelerator.reset()
+                        residual_norm = None
+                        rejected_steps += 1
 
             # calcular error entre iteraciones usando norma infinito
             error = np.linalg.norm(x - x_old, np.inf)
             self.error_history.append(error)
 
-            # guardar estado actual en historial
-            self.iteration_history.append(x.copy())
+            # guardar estado actual en historial (segun la politica de retencion)
+            history.record(iteration + 1, x)
 
             # verificar si se alcanzo la convergencia
             if error < self.tolerance:
-                return {
-                    'solution': x,
-                    'iterations': iteration + 1,
-                    'converged': True,
-                    'final_error': error,
-                    'history': self.iteration_history,
-                    'errors': self.error_history
-                }
+                converged = True
+                iterations = iteration + 1
+                break
+
+            # abortar si el error crece de forma sostenida (o se desborda)
+            if self._is_diverging(self.error_history):
+                diverging = True
+                iterations = iteration + 1
+                break
+
+            # en modo 'auto', cambiar al omega optimo cuando la contraccion se estabilice
+            if auto_omega and omega == 1.0 and iteration + 1 >= self.omega_probe_iterations:
+                omega = self._estimate_optimal_omega(self.error_history) or 1.0
+
+        # exponer solo los estados retenidos, como arreglo 2-D
+        self.iteration_history = history.states
+        self.history_iterations = history.iterations
+        rho = self._convergence_rate(self.error_history, self.rate_window)
 
-        # si no convergio en max_iterations, retornar resultado actual
         return {
             'solution': x,
-            'iterations': self.max_iterations,
-            'converged': False,
+            'iterations': iterations,
+            'converged': converged,
+            'status': self._status(converged, diverging),
+            'spectral_radius_estimate': rho,
+            'predicted_remaining_iterations': self._predict_remaining(error, rho, self.tolerance),
+            'acceleration': None if accelerator is None else {
+                'method': self.acceleration,
+                'accepted_steps': accepted_steps,
+                'rejected_steps': rejected_steps
+            },
             'final_error': error,
             'history': self.iteration_history,
-            'errors': self.error_history
+            'history_iterations': self.history_iterations,
+            'errors': self.error_history,
+            'omega': omega,
+            'ordering': ordering,
+            'colors': n_colors,
+            'precision': 'double',
+            'sweeps_by_precision': {'float32': 0, 'float64': len(self.error_history)},
+            'out_of_core': self._out_of_core_stats(A, bytes_before)
         }
 
-    def _is_diagonally_dominant(self, A: np.ndarray) -> bool:
-        """verifica si la matriz es diagonalmente dominante"""
-        n = len(A)
-        # verificar cada fila de la matriz
-        for i in range(n):
-            # elemento diagonal de la fila i
-            diagonal = abs(A[i][i])
-            # suma de elementos fuera de la diagonal en la fila i
-            off_diagonal_sum = sum(abs(A[i][j]) for j in range(n) if i != j)
-            # para ser diagonalmente dominante: |a_ii| > suma(|a_ij|) para j!=i
-            if diagonal <= off_diagonal_sum:
-                return False
-        return True
+    def _solve_mixed(self, A, b: np.ndarray, x: np.ndarray, omega: float, auto_omega: bool, color_plan,
+                     ordering: str, n_colors: Optional[int]) -> Dict:
+        """
+        resuelve ax = b con barridos en float32 y refinamiento iterativo en float64
+
+        en cada refinamiento se calcula el residual r = b - Ax en float64 y la
+        correccion A d = r se barre en float32 (la mitad de bytes por barrido)
+        hasta que su cambio baje de mixed_inner_reduction * |d|; luego x += d en
+        float64. converge cuando una correccion completa es menor que la
+        tolerancia, asi que la precision final es la de float64.
+
+        solo para matrices densas en memoria y un lado derecho; no registra
+        sumas para la explicacion paso a paso.
+        """
+        if not isinstance(A, np.ndarray) or b.ndim != 1:
+            raise ValueError("la precision mixta requiere una matriz densa en memoria y un lado derecho")
+        if self.acceleration is not None:
+            raise ValueError("la precision mixta no admite aceleracion")
+
+        # copias en float32 de la matriz (y del plan multicolor) para los barridos internos
+        A32 = A.astype(np.float32)
+        plan32 = None if color_plan is None else build_color_plan(A32, self.min_color_class_size)[1]
+
+        history = IterationHistory(len(b), self.max_iterations, self.history_policy,
+                                   self.history_size, self.history_stride)
+        self.error_history = []
+        self.step_records = []
+        history.record(0, x)
+
+        sweeps32 = refinements = 0
+        converged = diverging = False
+        error = np.inf
+        while sweeps32 < self.max_iterations and not (converged or diverging):
+            # residual en float64 (un recorrido de la matriz en doble precision)
+            residual = b - A @ x
+            refinements += 1
+            if not np.any(residual):
+                converged, error = True, 0.0
+                break
+
+            correction = np.zeros(len(b), dtype=np.float32)
+            residual32 = residual.astype(np.float32)
+            while sweeps32 < self.max_iterations:
+                previous = correction.copy()
+                self._gauss_seidel_step(A32, residual32, correction, omega, plan32)
+                sweeps32 += 1
+                change = float(np.linalg.norm(correction - previous, np.inf))
+                self.error_history.append(change)
+                history.record(sweeps32, x + correction)
+
+                if change < self.tolerance or change <= self.mixed_inner_reduction * np.linalg.norm(correction, np.inf):
+                    break
+                if self._is_diverging(self.error_history):
+                    diverging = True
+                    break
+                if auto_omega and omega == 1.0 and sweeps32 >= self.omega_probe_iterations:
+                    omega = self._estimate_optimal_omega(self.error_history) or 1.0
+
+            x += correction
+            error = float(np.linalg.norm(correction, np.inf))
+            converged = error < self.tolerance and not diverging
+
+        self.iteration_history = history.states
+        self.history_iterations = history.iterations
+        rho = self._convergence_rate(self.error_history, self.rate_window)
+
+        return {
+            'solution': x,
+            'iterations': sweeps32,
+            'converged': converged,
+            'status': self._status(converged, diverging),
+            'spectral_radius_estimate': rho,
+            'predicted_remaining_iterations': self._predict_remaining(error, rho, self.tolerance),
+            'acceleration': None,
+            'final_error': error,
+            'history': self.iteration_history,
+            'history_iterations': self.history_iterations,
+            'errors': self.error_history,
+            'omega': omega,
+            'ordering': ordering,
+            'colors': n_colors,
+            'precision': 'mixed',
+            'sweeps_by_precision': {'float32': sweeps32, 'float64': refinements},
+            'out_of_core': None
+        }
+
+    def _solve_multiple(self, A, B: np.ndarray, X: np.ndarray, omega: float, auto_omega: bool, color_plan,
+                        ordering: str, n_colors: Optional[int]) -> Dict:
+        """
+        resuelve A X = B para una matriz B de n x k con un solo recorrido por fila
+
+        cada fila actualiza las k columnas a la vez (producto fila-matriz). la
+        convergencia se sigue por columna: las columnas que convergen se congelan
+        y dejan de barrerse.
+        """
+        n, k = B.shape
+
+        history = IterationHistory((n, k), self.max_iterations, self.history_policy,
+                                   self.history_size, self.history_stride)
+        # error_history guarda el mayor error entre las columnas activas
+        self.error_history = []
+        self.step_records = []
+        history.record(0, X)
+        bytes_before = A.bytes_read if isinstance(A, MemmapMatrix) else 0
+
+        column_iterations = np.zeros(k, dtype=np.int64)
+        column_errors = np.full(k, np.inf)
+        active = np.arange(k)
+        iterations = self.max_iterations
+        diverging = False
+
+        for iteration in range(self.max_iterations):
+            # trabajar solo con las columnas que no han convergido
+            X_active = X[:, active]
+            X_old = X_active.copy()
+
+            self._gauss_seidel_step(A, B[:, active], X_active, omega, color_plan)
+
+            # error por columna usando norma infinito
+            errors = np.max(np.abs(X_active - X_old), axis=0)
+            X[:, active] = X_active
+            column_errors[active] = errors
+            column_iterations[active] = iteration + 1
+            self.error_history.append(float(errors.max()))
+
+            history.record(iteration + 1, X)
+
+            # congelar las columnas que ya convergieron
+            active = active[errors >= self.tolerance]
+            if len(active) == 0:
+                iterations = iteration + 1
+                break
+
+            # abortar si el error de las columnas activas crece de forma sostenida
+            if self._is_diverging(self.error_history):
+                diverging = True
+                iterations = iteration + 1
+                break
+
+            # en modo 'auto', estimar omega con la columna de convergencia mas lenta
+            if auto_omega and omega == 1.0 and iteration + 1 >= self.omega_probe_iterations:
+                omega = self._estimate_optimal_omega(self.error_history) or 1.0
+
+        self.iteration_history = history.states
+        self.history_iterations = history.iterations
+        column_converged = column_errors < self.tolerance
+        converged = bool(column_converged.all())
+        final_error = float(column_errors.max())
+        rho = self._convergence_rate(self.error_history, self.rate_window)
+
+        return {
+            'solution': X,
+            'iterations': iterations,
+            'converged': converged,
+            'status': self._status(converged, diverging),
+            'spectral_radius_estimate': rho,
+            'predicted_remaining_iterations': self._predict_remaining(final_error, rho, self.tolerance),
+            'final_error': final_error,
+            'column_iterations': column_iterations,
+            'column_converged': column_converged,
+            'column_errors': column_errors,
+            'history': self.iteration_history,
+            'history_iterations': self.history_iterations,
+            'errors': self.error_history,
+            'omega': omega,
+            'ordering': ordering,
+            'colors': n_colors,
+            'precision': 'double',
+            'sweeps_by_precision': {'float32': 0, 'float64': len(self.error_history)},
+            'out_of_core': self._out_of_core_stats(A, bytes_before)
+        }
+
+    def solve_batch(self, A: np.ndarray, b: np.ndarray, chunk_size: int = 10000) -> Dict:
+        """
+        resuelve m sistemas pequenos independientes A[s] x[s] = b[s] a la vez
+
+        cada actualizacion de fila se hace para todos los sistemas del bloque con
+        operaciones vectorizadas de numpy, asi que el costo en python depende de
+        n y del numero de barridos, no de m. los sistemas se procesan en bloques
+        de `chunk_size` para acotar la memoria, y los que convergen se congelan.
 
+        args:
+            A: arreglo (m, n, n) con las matrices de coeficientes
+            b: arreglo (m, n) con los terminos independientes
+            chunk_size: numero maximo de sistemas procesados a la vez
+
+        returns:
+            dict con solucion (m, n), mascara de convergencia, iteraciones y error
+            final por sistema, y la mascara de dominancia diagonal
+        """
+        A = np.asarray(A, dtype=float)
+        b = np.asarray(b, dtype=float)
+        if A.ndim != 3 or A.shape[1] != A.shape[2] or b.shape != A.shape[:2]:
+            raise ValueError(f"se esperaba A de (m, n, n) y b de (m, n), recibido {A.shape} y {b.shape}")
+        if chunk_size < 1:
+            raise ValueError("chunk_size debe ser al menos 1")
+        if self.omega == 'auto':
+            raise ValueError("omega 'auto' no esta disponible para sistemas en lote")
+        omega = float(self.omega)
+        if not 0 < omega < 2:
+            raise ValueError(f"omega debe estar en el intervalo (0, 2), recibido: {omega}")
+
+        m, n = b.shape
+        solution = np.zeros((m, n))
+        iterations = np.zeros(m, dtype=np.int64)
+        final_errors = np.full(m, np.inf)
+
+        # dominancia diagonal por sistema (sin imprimir una advertencia por cada uno)
+        diagonal = np.abs(np.diagonal(A, axis1=1, axis2=2))
+        dominant = np.all(diagonal > np.abs(A).sum(axis=2) - diagonal, axis=1)
+
+        for start in range(0, m, chunk_size):
+            stop = min(start + chunk_size, m)
+            chunk_A = A[start:stop]
+            chunk_b = b[start:stop]
+            x = np.zeros((stop - start, n))
+            # indices (dentro del bloque) de los sistemas que no han convergido
+            active = np.arange(stop - start)
+
+            for iteration in range(self.max_iterations):
+                A_active, b_active = chunk_A[active], chunk_b[active]
+                x_active = x[active]
+                x_old = x_active.copy()
+
+                for i in range(n):
+                    # sumas de la fila i para todos los sistemas activos
+                    sum1 = np.einsum('sj,sj->s', A_active[:, i, :i], x_active[:, :i])
+                    sum2 = np.einsum('sj,sj->s', A_active[:, i, i + 1:], x_active[:, i + 1:])
+                    value = (b_active[:, i] - sum1 - sum2) / A_active[:, i, i]
+                    x_active[:, i] = value if omega == 1.0 else x_active[:, i] + omega * (value - x_active[:, i])
+
+                errors = np.max(np.abs(x_active - x_old), axis=1)
+                x[active] = x_active
+                final_errors[start + active] = errors
+                iterations[start + active] = iteration + 1
+
+                # congelar los sistemas que ya convergieron
+                active = active[errors >= self.tolerance]
+                if len(active) == 0:
+                    break
+
+            solution[start:stop] = x
+
+        converged = final_errors < self.tolerance
+        return {
+            'solution': solution,
+            'converged': converged,
+            'all_converged': bool(converged.all()),
+            'iterations': iterations,
+            'final_error': final_errors,
+            'diagonally_dominant': dominant,
+            'omega': omega
+        }
+
+    @staticmethod
+    def _estimate_optimal_omega(errors: List[float]) -> Optional[float]:
+        """
+        estima el omega optimo de sor a partir de la tasa de contraccion observada
+
+        el cociente entre errores consecutivos de gauss-seidel aproxima el radio
+        espectral rho de su matriz de iteracion; para matrices consistentemente
+        ordenadas el omega optimo es 2 / (1 + sqrt(1 - rho)).
+
+        retorna None mientras el cociente no se haya estabilizado: desde x = 0 el
+        cociente se acerca a rho por arriba, y una sobreestimacion llevaria omega
+        casi a 2. se compara el cociente actual con el de la mitad del historial.
+        """
+        k = len(errors)
+        if k < 4:
+            return None
+        recent = np.asarray([errors[k // 2 - 1], errors[k // 2], errors[-2], errors[-1]], dtype=float)
+        if np.any(recent <= 0) or not np.all(np.isfinite(recent)):
+            return None
+        earlier_ratio = recent[1] / recent[0]
+        rho = recent[3] / recent[2]
+
+        # si el error no se contrae, sor no ayuda: mantener gauss-seidel clasico
+        if rho >= 1:
+            return None
+        # omega depende de 1 - rho, asi que la estimacion debe ser estable en esa escala
+        if abs(rho - earlier_ratio) > 0.1 * (1.0 - rho):
+            return None
+        return float(2.0 / (1.0 + np.sqrt(1.0 - rho)))
+
+    @staticmethod
+    def _convergence_rate(errors: List[float], window: int) -> Optional[float]:
+        """
+        estima el radio espectral de la matriz de iteracion con los ultimos errores
+
+        usa la media geometrica de los ultimos `window` cocientes e_k / e_(k-1),
+        es decir (e_k / e_(k-window)) ** (1 / window). retorna None si todavia no
+        hay dos errores o si alguno de ellos es cero o no es finito.
+        """
+        span = min(window, len(errors) - 1)
+        if span < 1:
+            return None
+        first, last = errors[-1 - span], errors[-1]
+        if not (np.isfinite(first) and np.isfinite(last)) or first <= 0 or last <= 0:
+            return None
+        return float((last / first) ** (1.0 / span))
+
+    def _is_diverging(self, errors: List[float]) -> bool:
+        """
+        decide si la iteracion diverge de forma evidente
+
+        diverge si el error dejo de ser finito, o si la tasa estimada es mayor que
+        1 y el error ya crecio `divergence_factor` veces respecto al minimo
+        observado (asi un aumento transitorio, por ejemplo al cambiar omega, no
+        aborta la resolucion).
+        """
+        if not np.isfinite(errors[-1]):
+            return True
+        rho = self._convergence_rate(errors, self.rate_window)
+        return rho is not None and rho > 1.0 and errors[-1] > self.divergence_factor * min(errors)
+
+    @staticmethod
+    def _predict_remaining(error: float, rho: Optional[float], tolerance: float) -> Optional[int]:
+        """
+        predice los barridos que faltan para que el error baje de la tolerancia
+
+        con e_(k+m) ~ e_k * rho^m se necesita m > log(tol / e_k) / log(rho).
+        retorna 0 si ya convergio y None si la tasa no permite predecirlo (rho >= 1).
+        """
+        if error < tolerance:
+            return 0
+        if rho is None or not 0 < rho < 1 or not np.isfinite(error):
+            return None
+        return int(np.floor(np.log(tolerance / error) / np.log(rho))) + 1
+
+    def _out_of_core_stats(self, A, bytes_before: int) -> Optional[Dict]:
+        """bytes leidos del disco durante las iteraciones (None si A esta en memoria)"""
+        if not isinstance(A, MemmapMatrix):
+            return None
+        return {
+            'block_rows': A.block_rows,
+            # en modo simetrico cada iteracion recorre la matriz dos veces
+            'bytes_read_per_sweep': A.sweep_bytes * (2 if self.symmetric else 1),
+            'bytes_read': A.bytes_read - bytes_before
+        }
+
+    @staticmethod
+    def _status(converged: bool, diverging: bool) -> str:
+        """estado final de la resolucion: 'converged', 'diverging' o 'max_iterations'"""
+        if converged:
+            return 'converged'
+        return 'diverging' if diverging else 'max_iterations'
+
+    @staticmethod
+    def _initial_guess(x0: Optional[np.ndarray], shape: Tuple[int, ...]) -> np.ndarray:
+        """retorna una copia float de x0 (o ceros), validando su forma"""
+        if x0 is None:
+            return np.zeros(shape)
+        x = np.array(x0, dtype=float)
+        if x.shape != shape:
+            raise ValueError(f"x0 debe tener forma {shape}, recibido: {x.shape}")
+        return x
+
+    def _prepare_matrix(self, A):
+        """
+        normaliza la matriz de coeficientes: las entradas dispersas se convierten
+        a CSRMatrix y las densas a un arreglo float contiguo para los productos punto;
+        los operadores sin matriz (RowOperator) se usan tal cual y las matrices en
+        disco (np.memmap) se envuelven en MemmapMatrix para leerlas por bloques
+        """
+        if isinstance(A, (RowOperator, MemmapMatrix)):
+            return A
+        if isinstance(A, np.memmap):
+            return MemmapMatrix(A, self.memory_budget)
+        sparse = as_csr(A)
+        if sparse is not None:
+            return sparse
+        return np.ascontiguousarray(A, dtype=float)
+
+    def _prepare_sweeps(self, A) -> None:
+        """
+        prepara lo que los barridos reutilizan durante una resolucion con A
+
+        el barrido escalar no necesita nada; las subclases (por ejemplo el
+        gauss-seidel por bloques) lo arman de nuevo en cada resolucion, asi
+        que una A modificada en su lugar entre resoluciones nunca usa datos viejos.
+        """
+
+    @staticmethod
+    def _row_entries(A, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """retorna (columnas, coeficientes) de la fila i, densa, dispersa, de un operador o en disco"""
+        if isinstance(A, (CSRMatrix, RowOperator, MemmapMatrix)):
+            return A.row(i)
+        return np.arange(len(A[i])), np.asarray(A[i])
+
+    def _gauss_seidel_step(self, A, b: np.ndarray, x: np.ndarray, omega: float, color_plan,
+                           sums: Optional[np.ndarray] = None, forward: Optional[np.ndarray] = None) -> None:
+        """
+        una iteracion: un barrido hacia adelante y, en modo simetrico, otro hacia atras
+
+        en modo simetrico las sumas registradas son las del barrido hacia atras,
+        que es el que deja los valores finales de la iteracion; si se pasa
+        `forward`, se copia ahi x al terminar el barrido hacia adelante (los
+        valores respecto a los que se relaja el barrido hacia atras).
+        """
+        if color_plan is None:
+            self._sweep(A, b, x, omega, sums)
+        else:
+            self._colored_sweep(color_plan, b, x, omega, sums)
+        if not self.symmetric:
+            return
+        if forward is not None:
+            forward[:] = x
+        if color_plan is None:
+            self._sweep(A, b, x, omega, sums, reverse=True)
+        else:
+            self._colored_sweep(color_plan, b, x, omega, sums, reverse=True)
+
+    @staticmethod
+    def _sweep(A, b: np.ndarray, x: np.ndarray, omega: float = 1.0, sums: Optional[np.ndarray] = None,
+               reverse: bool = False) -> None:
+        """
+        realiza un barrido de gauss-seidel (o sor si omega != 1) sobre x (in situ)
+
+        cada fila se actualiza con dos productos punto sobre rebanadas contiguas:
+        como x se modifica en su lugar, x[:i] ya contiene los valores nuevos y
+        x[i + 1:] todavia los de la iteracion anterior (al reves si reverse=True,
+        que recorre las filas de la ultima a la primera).
+
+        si se pasa `sums` (arreglo n x 2), se guardan ahi las sumas parciales
+        (sum1, sum2) de cada fila para la explicacion paso a paso.
+        """
+        if isinstance(A, CSRMatrix):
+            GaussSeidelSolver._sparse_sweep(A, b, x, omega, sums, reverse)
+            return
+        if isinstance(A, RowOperator):
+            GaussSeidelSolver._operator_sweep(A, b, x, omega, sums, reverse)
+            return
+        if isinstance(A, MemmapMatrix):
+            # barrido fuera de memoria: los bloques de filas se leen del disco en orden
+            for start, block in A.blocks(reverse):
+                GaussSeidelSolver._dense_rows(block, start, b, x, omega, sums, reverse)
+            return
+
+        GaussSeidelSolver._dense_rows(A, 0, b, x, omega, sums, reverse)
+
+    @staticmethod
+    def _dense_rows(rows: np.ndarray, start: int, b: np.ndarray, x: np.ndarray, omega: float = 1.0,
+                    sums: Optional[np.ndarray] = None, reverse: bool = False) -> None:
+        """actualiza las filas start .. start + len(rows) - 1 de x a partir del bloque denso `rows`"""
+        for local in (range(len(rows) - 1, -1, -1) if reverse else range(len(rows))):
+            i = start + local
+            row = rows[local]
+            # suma de elementos ya actualizados (indices < i)
+            sum1 = row[:i] @ x[:i]
+            # suma de elementos no actualizados (indices > i)
+            sum2 = row[i + 1:] @ x[i + 1:]
+            if sums is not None:
+                sums[i] = sum1, sum2
+            # calcular nuevo valor de x[i]
+            value = (b[i] - sum1 - sum2) / row[i]
+            # relajar el paso de gauss-seidel: x_i + omega * (valor_gs - x_i)
+            x[i] = value if omega == 1.0 else x[i] + omega * (value - x[i])
+
+    @staticmethod
+    def _sparse_sweep(A: CSRMatrix, b: np.ndarray, x: np.ndarray, omega: float = 1.0,
+                      sums: Optional[np.ndarray] = None, reverse: bool = False) -> None:
+        """
+        barrido de gauss-seidel (o sor) sobre una matriz csr (in situ)
+
+        solo recorre los elementos almacenados fuera de la diagonal; igual que en
+        el caso denso, x[cols] mezcla valores nuevos (cols < i) y anteriores (cols > i).
+        """
+        off = A.off_diagonal()
+        indptr, indices, data = off.indptr, off.indices, off.data
+        diagonal = A.diagonal()
+        for i in (range(len(b) - 1, -1, -1) if reverse else range(len(b))):
+            start, end = indptr[i], indptr[i + 1]
+            cols, coeffs = indices[start:end], data[start:end]
+            if sums is None:
+                total = coeffs @ x[cols]
+            else:
+                # separar la suma en columnas ya actualizadas y no actualizadas
+                lower = cols < i
+                sums[i] = coeffs[lower] @ x[cols[lower]], coeffs[~lower] @ x[cols[~lower]]
+                total = sums[i, 0] + sums[i, 1]
+            value = (b[i] - total) / diagonal[i]
+            x[i] = value if omega == 1.0 else x[i] + omega * (value - x[i])
+
+    @staticmethod
+    def _operator_sweep(A: RowOperator, b: np.ndarray, x: np.ndarray, omega: float = 1.0,
+                        sums: Optional[np.ndarray] = None, reverse: bool = False) -> None:
+        """
+        barrido de gauss-seidel (o sor) sobre un operador sin matriz (in situ)
+
+        cada fila se genera bajo demanda con A.row(i) y se descarta al terminar,
+        asi que nunca se reserva memoria para la matriz completa.
+        """
+        diagonal = A.diagonal()
+        for i in (range(len(b) - 1, -1, -1) if reverse else range(len(b))):
+            cols, coeffs = A.row(i)
+            off = cols != i
+            cols, coeffs = cols[off], coeffs[off]
+            if sums is None:
+                total = coeffs @ x[cols]
+            else:
+                lower = cols < i
+                sums[i] = coeffs[lower] @ x[cols[lower]], coeffs[~lower] @ x[cols[~lower]]
+                total = sums[i, 0] + sums[i, 1]
+            value = (b[i] - total) / diagonal[i]
+            x[i] = value if omega == 1.0 else x[i] + omega * (value - x[i])
+
+    @staticmethod
+    def _colored_sweep(plan: List[Tuple[np.ndarray, object, np.ndarray]], b: np.ndarray, x: np.ndarray,
+                       omega: float = 1.0, sums: Optional[np.ndarray] = None, reverse: bool = False) -> None:
+        """
+        barrido de gauss-seidel multicolor (in situ)
+
+        las incognitas de un mismo color no se acoplan entre si, asi que todo el
+        color se actualiza con un solo producto matriz-vector; los colores
+        siguientes ya ven los valores nuevos de los anteriores.
+        """
+        updated = np.zeros(len(x), dtype=bool) if sums is not None else None
+        for rows, off_rows, diagonal in (reversed(plan) if reverse else plan):
+            total = off_rows @ x
+            if sums is not None:
+                # sum1: aporte de los colores ya actualizados en este barrido
+                sums[rows, 0] = off_rows @ np.where(updated, x, 0.0)
+                sums[rows, 1] = total - sums[rows, 0]
+                updated[rows] = True
+            # con varios lados derechos, la diagonal divide fila por fila
+            value = (b[rows] - total) / (diagonal if x.ndim == 1 else diagonal[:, None])
+            x[rows] = value if omega == 1.0 else x[rows] + omega * (value - x[rows])
+
+    def _is_diagonally_dominant(self, A) -> bool:
+        """verifica si la matriz es diagonalmente dominante"""
+        return analyze_dominance(A)['is_strict']
 
     def _format_equation_term(self, coeff: float, var_index: int, is_first: bool) -> str:
         """Formatea un término de la ecuación"""
@@ -154,41 +830,37 @@ class GaussSeidelSolver:
                 else:
                     return f" - {abs(coeff):.3f}({value:.6f})"
 
-    def _create_equation_string(self, A_row: np.ndarray) -> str:
+    def _create_equation_string(self, cols: np.ndarray, coeffs: np.ndarray) -> str:
         """Crea la representación string de una ecuación"""
-        n = len(A_row)
         equation_parts = []
 
-        for j in range(n):
-            term = self._format_equation_term(A_row[j], j, j == 0)
+        for j, coeff in zip(cols, coeffs):
+            term = self._format_equation_term(coeff, j, j == 0)
             if term:
                 equation_parts.append(term)
 
         return "".join(equation_parts)
 
-    def _create_substitution_string(self, A_row: np.ndarray, x: np.ndarray) -> str:
+    def _create_substitution_string(self, cols: np.ndarray, coeffs: np.ndarray, x: np.ndarray) -> str:
         """Crea la representación string de una sustitución"""
-        n = len(A_row)
         substitution_parts = []
 
-        for j in range(n):
-            term = self._format_substitution_term(A_row[j], x[j], j, j == 0)
+        for j, coeff in zip(cols, coeffs):
+            term = self._format_substitution_term(coeff, x[j], j, j == 0)
             if term:
                 substitution_parts.append(term)
 
         return "".join(substitution_parts)
 
-    def _verify_equation(self, A_row: np.ndarray, b_value: float, x: np.ndarray, eq_number: int) -> Dict:
-        """Verifica una ecuación individual"""
-        # calcular A[i] * x (producto punto de la fila i con el vector solucion)
-        ax_value = sum(A_row[j] * x[j] for j in range(len(A_row)))
-
+    def _verify_equation(self, cols: np.ndarray, coeffs: np.ndarray, b_value: float, x: np.ndarray,
+                         eq_number: int, ax_value: float) -> Dict:
+        """Formatea la verificación de una ecuación a partir de su valor A[i]·x ya calculado"""
         # calcular residual para esta ecuación: |A*x - b|
         residual = abs(ax_value - b_value)
 
         # crear strings de ecuación y sustitución
-        equation_str = self._create_equation_string(A_row)
-        substitution_str = self._create_substitution_string(A_row, x)
+        equation_str = self._create_equation_string(cols, coeffs)
+        substitution_str = self._create_substitution_string(cols, coeffs, x)
 
         return {
             'equation_number': eq_number,
@@ -200,40 +872,55 @@ class GaussSeidelSolver:
             'is_accurate': residual < 1e-10  # muy pequeño indica alta precision
         }
 
-    def _verify_solution(self, A: np.ndarray, b: np.ndarray, x: np.ndarray) -> Dict:
+    def verify_solution(self, A, b: np.ndarray, x: np.ndarray) -> Dict:
         """
-        verifica la solucion sustituyendo en el sistema original
-        retorna informacion detallada de la verificacion
+        verificacion numerica rapida: un solo producto A @ x, sin formatear texto
+
+        returns:
+            dict con ax_values, b_values, residual_vector (A*x - b), residuals
+            (|A*x - b| por ecuacion), total_residual (norma 2) y max_residual
         """
-        n = len(A)
-        verification_data = {
-            'equations': [],
-            'ax_values': [],  # valores de A*x para cada ecuación
+        A = self._prepare_matrix(A)
+        b = np.asarray(b, dtype=float)
+        ax_values = A @ np.asarray(x, dtype=float)
+        residual_vector = ax_values - b
+        residuals = np.abs(residual_vector)
+
+        return {
+            'ax_values': ax_values,  # valores de A*x para cada ecuación
             'b_values': b.copy(),
-            'residuals': [],  # diferencias |A*x - b| para cada ecuación
-            'total_residual': 0.0
+            'residual_vector': residual_vector,
+            'residuals': residuals,  # diferencias |A*x - b| para cada ecuación
+            'total_residual': float(np.linalg.norm(residual_vector)),
+            'max_residual': float(residuals.max()) if len(residuals) else 0.0
         }
 
-        # verificar cada ecuación del sistema
-        for i in range(n):
-            eq_data = self._verify_equation(A[i], b[i], x, i + 1)
-            verification_data['equations'].append(eq_data)
-            verification_data['ax_values'].append(eq_data['calculated_value'])
-            verification_data['residuals'].append(eq_data['residual'])
-
-        # calcular residual total del sistema
-        verification_data['total_residual'] = np.linalg.norm(verification_data['residuals'])
+    def _verify_solution(self, A, b: np.ndarray, x: np.ndarray) -> Dict:
+        """
+        verifica la solucion sustituyendo en el sistema original
+        retorna informacion detallada de la verificacion
 
+        los numeros salen de verify_solution; el texto de cada ecuacion se
+        genera de forma perezosa solo para las filas que se consultan.
+        """
+        A = self._prepare_matrix(A)
+        verification_data = self.verify_solution(A, b, x)
+        verification_data['equations'] = _EquationRows(self, A, verification_data['b_values'],
+                                                       np.asarray(x, dtype=float), verification_data['ax_values'])
         return verification_data
 
-    def generate_step_by_step(self, A: np.ndarray, b: np.ndarray) -> List[Dict]:
+    def generate_step_by_step(self, A: np.ndarray, b: np.ndarray, dominance: Optional[Dict] = None) -> List[Dict]:
         """
-        genera explicacion paso a paso del metodo
+        genera explicacion paso a paso del metodo (dominance como en solve)
         """
-        # resolver el sistema para obtener el historial completo
-        result = self.solve(A, b)
+        # resolver el sistema una sola vez, registrando las sumas parciales de
+        # los barridos que se van a mostrar (maximo 10 para evitar sobrecarga)
+        A = self._prepare_matrix(A)
+        b = np.asarray(b, dtype=float)
+        result = self.solve(A, b, record_steps=10, dominance=dominance)
         steps = []
         n = len(A)
+        diagonal = A.diagonal() if isinstance(A, (CSRMatrix, RowOperator, MemmapMatrix)) else np.diag(A)
 
         # paso inicial: mostrar sistema original
         steps.append({
@@ -251,30 +938,29 @@ class GaussSeidelSolver:
             'content': 'formula iterativa: x_i^(k+1) = (b_i - suma(a_ij * x_j^(k+1)) - suma(a_ij * x_j^(k))) / a_ii'
         })
 
-        # generar pasos para las iteraciones (maximo 10 para evitar sobrecarga)
-        for i in range(min(len(self.iteration_history) - 1, 10)):
+        # generar pasos a partir de lo registrado durante el barrido real
+        for record in self.step_records:
+            k = record['iteration']
+            x_old = record['previous_solution']  # valores anteriores
+            x_new = record['solution']  # valores actualizados
+            omega = record['omega']
+            # valores respecto a los que se relaja cada variable (en modo simetrico,
+            # los del barrido hacia adelante, ya que las sumas son las del barrido hacia atras)
+            x_relaxed = x_old if record.get('forward_solution') is None else record['forward_solution']
+
             step_data = {
                 'type': 'iteration',
-                'title': f'iteracion {i + 1}',
-                'iteration': i + 1,
-                'solution': self.iteration_history[i + 1],
-                'previous_solution': self.iteration_history[i] if i > 0 else np.zeros(n),
-                'error': self.error_history[i] if i < len(self.error_history) else 0,
+                'title': f'iteracion {k}',
+                'iteration': k,
+                'solution': x_new,
+                'previous_solution': x_old,
+                'error': self.error_history[k - 1],
                 'calculations': []
             }
 
-            # generar calculos detallados para cada variable
-            x_old = self.iteration_history[i].copy()  # valores anteriores
-            x_new = self.iteration_history[i + 1].copy()  # valores actualizados
-
-            # calcular cada componente del vector solucion
+            # crear informacion del calculo para cada variable
             for j in range(n):
-                # suma de elementos ya actualizados
-                sum1 = sum(A[j][k] * x_new[k] for k in range(j))
-                # suma de elementos no actualizados
-                sum2 = sum(A[j][k] * x_old[k] for k in range(j + 1, n))
-
-                # crear informacion del calculo para esta variable
+                sum1, sum2 = record['sums'][j]
                 calculation = {
                     'variable': j,
                     'formula': f'x{j+1} = ({b[j]:.3f}',
@@ -288,7 +974,12 @@ class GaussSeidelSolver:
                     calculation['formula'] += f' - {sum1:.3f}'
                 if sum2 != 0:
                     calculation['formula'] += f' - {sum2:.3f}'
-                calculation['formula'] += f') / {A[j][j]:.3f} = {x_new[j]:.6f}'
+                value = (b[j] - sum1 - sum2) / diagonal[j]
+                calculation['formula'] += f') / {diagonal[j]:.3f} = {value:.6f}'
+                # con sor el valor de gauss-seidel se relaja respecto al anterior
+                if omega != 1.0:
+                    calculation['formula'] += (f'; sor (w = {omega:.3f}): {x_relaxed[j]:.6f} + w * '
+                                               f'({value:.6f} - {x_relaxed[j]:.6f}) = {x_new[j]:.6f}')
 
                 step_data['calculations'].append(calculation)
 
@@ -302,6 +993,7 @@ class GaussSeidelSolver:
             'type': 'result',
             'title': 'resultado final',
             'converged': result['converged'],
+            'status': result['status'],
             'solution': result['solution'],
             'iterations': result['iterations'],
             'final_error': result['final_error'],
@@ -311,3 +1003,36 @@ class GaussSeidelSolver:
         })
 
         return steps
+
+
+class _EquationRows(Sequence):
+    """
+    secuencia perezosa con la verificacion en texto de cada ecuacion
+
+    cada fila se formatea (y se guarda) la primera vez que se accede a ella,
+    asi que solo se paga el costo de las ecuaciones que la interfaz muestra.
+    """
+
+    def __init__(self, solver: GaussSeidelSolver, A, b: np.ndarray, x: np.ndarray, ax_values: np.ndarray):
+        self._solver = solver
+        self._A = A
+        self._b = b
+        self._x = x
+        self._ax_values = ax_values
+        self._cache = {}
+
+    def __len__(self) -> int:
+        return len(self._b)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("indice de ecuacion fuera de rango")
+        if index not in self._cache:
+            cols, coeffs = self._solver._row_entries(self._A, index)
+            self._cache[index] = self._solver._verify_equation(cols, coeffs, self._b[index], self._x, index + 1,
+                                                               float(self._ax_values[index]))
+        return self._cache[index]
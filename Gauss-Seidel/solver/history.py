@@ -0,0 +1,114 @@
+import numpy as np
+
+
+class IterationHistory:
+    """
+    historial de iteraciones con retencion configurable
+
+    guarda los estados x (de forma `shape`: n, o n x k con varios lados
+    derechos) en un unico buffer de numpy, en lugar de una lista con una copia
+    de x por barrido. el buffer empieza con pocas filas y duplica su tamano al
+    llenarse, asi que la memoria sigue a las iteraciones hechas y no a
+    max_iterations. politicas:
+    - 'full': todas las iteraciones
+    - 'none': ninguna
+    - 'ends': las primeras `size` y las ultimas `size` (buffer circular)
+    - 'every': una de cada `stride` iteraciones, mas la ultima
+    """
+
+    POLICIES = ('full', 'none', 'ends', 'every')
+    # filas reservadas al crear el historial (antes de crecer)
+    INITIAL_CAPACITY = 16
+
+    def __init__(self, shape, max_iterations: int, policy: str = 'full', size: int = 10, stride: int = 10):
+        if policy not in self.POLICIES:
+            raise ValueError(f"politica de historial desconocida: {policy}")
+        if size < 1 or stride < 1:
+            raise ValueError("history_size y history_stride deben ser al menos 1")
+
+        self.policy = policy
+        self.size = size
+        self.stride = stride
+
+        # numero maximo de filas que la politica puede llegar a usar (incluye el estado inicial)
+        if policy == 'full':
+            self._capacity = max_iterations + 1
+        elif policy == 'none':
+            self._capacity = 0
+        elif policy == 'ends':
+            self._capacity = 2 * size
+        else:
+            self._capacity = max_iterations // stride + 1
+
+        # buffer de estados; crece al doble en record hasta llegar a _capacity
+        rows = min(self._capacity, self.INITIAL_CAPACITY)
+        self._shape = tuple(np.atleast_1d(shape))
+        self._states = np.empty((rows,) + self._shape)
+        self._iterations = np.full(rows, -1, dtype=np.int64)
+        # estado mas reciente con la politica 'every' cuando no cae en una fila regular
+        self._latest = None
+        self._latest_iteration = -1
+        self._last = -1
+
+    def record(self, iteration: int, x: np.ndarray) -> None:
+        """guarda el estado x de la iteracion indicada si la politica lo retiene"""
+        if self.policy == 'none':
+            return
+        if self.policy == 'full':
+            slot = iteration
+        elif self.policy == 'ends':
+            # primeras `size` fijas, el resto rota en un buffer circular
+            slot = iteration if iteration < self.size else self.size + (iteration - self.size) % self.size
+        elif iteration % self.stride != 0:
+            # el estado mas reciente va a un arreglo aparte que se reutiliza
+            if self._latest is None:
+                self._latest = np.empty(self._shape)
+            self._latest[...] = x
+            self._latest_iteration = iteration
+            self._last = iteration
+            return
+        else:
+            slot = iteration // self.stride
+
+        if slot >= len(self._states):
+            self._grow(slot + 1)
+        self._states[slot] = x
+        self._iterations[slot] = iteration
+        self._last = iteration
+
+    def _grow(self, rows: int) -> None:
+        """amplia el buffer a por lo menos `rows` filas, duplicando su tamano sin pasar de _capacity"""
+        rows = min(max(rows, 2 * len(self._states)), self._capacity)
+        states = np.empty((rows,) + self._shape)
+        states[:len(self._states)] = self._states
+        iterations = np.full(rows, -1, dtype=np.int64)
+        iterations[:len(self._iterations)] = self._iterations
+        self._states, self._iterations = states, iterations
+
+    @property
+    def iterations(self) -> np.ndarray:
+        """numeros de iteracion retenidos, en orden creciente"""
+        iterations = self._iterations[self._order()]
+        if self._has_latest():
+            iterations = np.append(iterations, self._latest_iteration)
+        return iterations
+
+    @property
+    def states(self) -> np.ndarray:
+        """estados retenidos apilados en un arreglo (una fila por iteracion retenida)"""
+        states = self._states[self._order()]
+        if self._has_latest():
+            states = np.concatenate([states, self._latest[np.newaxis]])
+        return states
+
+    def _order(self) -> np.ndarray:
+        """indices de las filas validas ordenados por iteracion"""
+        valid = np.flatnonzero(self._iterations >= 0)
+        return valid[np.argsort(self._iterations[valid], kind='stable')]
+
+    def _has_latest(self) -> bool:
+        """si el estado mas reciente de 'every' sigue vigente (no lo reemplazo una fila regular)"""
+        return self._latest is not None and self._latest_iteration == self._last
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._iterations >= 0)) + int(self._has_latest())
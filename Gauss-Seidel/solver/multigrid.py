@@ -0,0 +1,237 @@
+import numpy as np
+from typing import Dict, List, Optional
+
+from .gauss_seidel import GaussSeidelSolver
+from .sparse import CSRMatrix, as_csr
+
+
+class MultigridSolver:
+    """
+    multigrid algebraico por agregacion con gauss-seidel como suavizador
+
+    gauss-seidel elimina rapido las componentes de alta frecuencia del error,
+    pero las de baja frecuencia se contraen cada vez mas lento al crecer n. el
+    multigrid las corrige en mallas mas gruesas: el residual se restringe, se
+    resuelve el problema grueso (recursivamente, con un ciclo v o w) y la
+    correccion se interpola de vuelta.
+
+    las mallas gruesas se construyen solo a partir de la matriz (agregacion
+    suavizada), asi que sirve para matrices dispersas arbitrarias:
+    - agregacion greedy de cada nodo con sus vecinos fuertes
+    - interpolacion constante por agregado, suavizada con un paso de jacobi
+    - operador grueso de galerkin: A_c = R A P con R = P^T
+    - solucion directa en el nivel mas grueso
+    """
+
+    def __init__(self):
+        # tipo de ciclo: 'V' (una visita al nivel grueso) o 'W' (dos visitas)
+        self.cycle = 'V'
+        # barridos de gauss-seidel antes y despues de la correccion gruesa
+        self.pre_sweeps = 1
+        self.post_sweeps = 1
+        # factor de relajacion del suavizador
+        self.smoother_omega = 1.0
+        # numero maximo de niveles de la jerarquia
+        self.max_levels = 10
+        # tamano a partir del cual el nivel se resuelve de forma directa
+        self.coarse_size = 50
+        # umbral de acoplamiento fuerte: |a_ij| >= theta * sqrt(|a_ii a_jj|)
+        self.strength_threshold = 0.08
+        # suavizar la interpolacion con un paso de jacobi (agregacion suavizada)
+        self.smooth_prolongation = True
+        # numero maximo de ciclos permitidos
+        self.max_iterations = 100
+        # tolerancia para determinar convergencia (misma norma que GaussSeidelSolver)
+        self.tolerance = 0.000001
+        # jerarquia de niveles de la ultima matriz preparada (y la matriz, para reuse_setup)
+        self.levels = []
+        self._matrix = None
+        # historial de errores entre ciclos consecutivos
+        self.error_history = []
+
+    def setup(self, A) -> List[Dict]:
+        """
+        construye la jerarquia de niveles para A
+
+        cada nivel guarda su matriz A y, salvo el ultimo, la interpolacion P y la
+        restriccion R hacia el nivel siguiente. el ultimo nivel guarda la inversa
+        (pseudo-inversa) densa para la solucion directa.
+        """
+        matrix = self._as_matrix(A)
+        levels = []
+        current = matrix
+        while len(levels) + 1 < self.max_levels and current.shape[0] > self.coarse_size:
+            aggregates = self._aggregate(current)
+            n_coarse = int(aggregates.max()) + 1
+            # si la agregacion ya no reduce el problema, detenerse en este nivel
+            if n_coarse >= current.shape[0]:
+                break
+            P = self._prolongation(current, aggregates, n_coarse)
+            R = P.transpose()
+            levels.append({'A': current, 'P': P, 'R': R})
+            current = R.matmat(current.matmat(P))
+
+        levels.append({'A': current, 'coarse_inverse': np.linalg.pinv(current.toarray())})
+        self.levels = levels
+        self._matrix = A
+        return levels
+
+    def solve(self, A, b: np.ndarray, x0: Optional[np.ndarray] = None, reuse_setup: bool = False) -> Dict:
+        """
+        resuelve ax = b con ciclos de multigrid
+
+        la jerarquia se construye de nuevo en cada llamada, asi que una A
+        modificada en su lugar nunca usa niveles viejos.
+
+        args:
+            A: matriz de coeficientes (densa, CSRMatrix o scipy.sparse)
+            b: vector de terminos independientes
+            x0: aproximacion inicial opcional; por defecto ceros
+            reuse_setup: reutilizar la jerarquia de la ultima llamada a setup (o
+               solve) con esta misma A; quien lo pide garantiza que A no cambio
+               (para resolver varios lados derechos con la misma matriz)
+
+        returns:
+            dict con solucion, ciclos (iterations), convergencia, errores,
+            residuales por ciclo, tamanos de los niveles y complejidad de operador
+        """
+        if self.cycle not in ('V', 'W'):
+            raise ValueError(f"tipo de ciclo desconocido: {self.cycle}")
+        if not (reuse_setup and self.levels and A is self._matrix):
+            self.setup(A)
+
+        b = np.asarray(b, dtype=float)
+        if b.shape != (self.levels[0]['A'].shape[0],):
+            raise ValueError(f"b debe tener forma ({self.levels[0]['A'].shape[0]},), recibido: {b.shape}")
+        x = GaussSeidelSolver._initial_guess(x0, b.shape)
+        fine = self.levels[0]['A']
+
+        self.error_history = []
+        residuals = []
+        converged = False
+        iterations = self.max_iterations
+        error = np.inf
+        for iteration in range(self.max_iterations):
+            x_old = x.copy()
+            self._cycle(0, b, x)
+
+            # mismo criterio que gauss-seidel: cambio entre ciclos en norma infinito
+            error = np.linalg.norm(x - x_old, np.inf)
+            self.error_history.append(error)
+            residuals.append(float(np.linalg.norm(b - fine @ x)))
+
+            if error < self.tolerance:
+                converged = True
+                iterations = iteration + 1
+                break
+
+        return {
+            'solution': x,
+            'iterations': iterations,
+            'converged': converged,
+            'final_error': error,
+            'errors': self.error_history,
+            'residuals': residuals,
+            'cycle': self.cycle,
+            'levels': [level['A'].shape[0] for level in self.levels],
+            'operator_complexity': sum(level['A'].nnz for level in self.levels) / max(fine.nnz, 1)
+        }
+
+    def _cycle(self, index: int, b: np.ndarray, x: np.ndarray) -> None:
+        """aplica un ciclo v o w desde el nivel `index` (actualiza x in situ)"""
+        level = self.levels[index]
+        if index == len(self.levels) - 1:
+            x[:] = level['coarse_inverse'] @ b
+            return
+
+        A = level['A']
+        for _ in range(self.pre_sweeps):
+            GaussSeidelSolver._sweep(A, b, x, self.smoother_omega)
+
+        # correccion en el nivel grueso a partir del residual restringido
+        coarse_b = level['R'] @ (b - A @ x)
+        coarse_x = np.zeros_like(coarse_b)
+        visits = 2 if self.cycle == 'W' and index + 1 < len(self.levels) - 1 else 1
+        for _ in range(visits):
+            self._cycle(index + 1, coarse_b, coarse_x)
+        x += level['P'] @ coarse_x
+
+        for _ in range(self.post_sweeps):
+            GaussSeidelSolver._sweep(A, b, x, self.smoother_omega)
+
+    def _aggregate(self, A: CSRMatrix) -> np.ndarray:
+        """
+        agrupa los nodos en agregados segun los acoplamientos fuertes
+
+        1. cada nodo cuyos vecinos fuertes estan todos libres forma un agregado con ellos
+        2. los nodos restantes se unen al agregado de algun vecino fuerte
+        3. los que aun quedan libres forman agregados con sus vecinos fuertes libres
+
+        returns:
+            arreglo con el agregado de cada nodo
+        """
+        off = A.off_diagonal()
+        diagonal = np.abs(A.diagonal())
+        scale = np.sqrt(diagonal[off.row_ids] * diagonal[off.indices])
+        strong = np.abs(off.data) >= self.strength_threshold * scale
+        strong_graph = CSRMatrix.from_coo(off.row_ids[strong], off.indices[strong],
+                                          np.ones(int(strong.sum())), A.shape)
+        indptr, indices = strong_graph.indptr, strong_graph.indices
+
+        n = A.shape[0]
+        aggregates = np.full(n, -1, dtype=np.int64)
+        count = 0
+        for i in range(n):
+            neighbors = indices[indptr[i]:indptr[i + 1]]
+            if aggregates[i] == -1 and np.all(aggregates[neighbors] == -1):
+                aggregates[i] = count
+                aggregates[neighbors] = count
+                count += 1
+
+        first_pass = aggregates.copy()
+        for i in np.flatnonzero(first_pass == -1):
+            neighbors = indices[indptr[i]:indptr[i + 1]]
+            assigned = first_pass[neighbors]
+            assigned = assigned[assigned >= 0]
+            if len(assigned):
+                aggregates[i] = assigned[0]
+
+        for i in np.flatnonzero(aggregates == -1):
+            neighbors = indices[indptr[i]:indptr[i + 1]]
+            aggregates[i] = count
+            aggregates[neighbors[aggregates[neighbors] == -1]] = count
+            count += 1
+
+        return aggregates
+
+    def _prolongation(self, A: CSRMatrix, aggregates: np.ndarray, n_coarse: int) -> CSRMatrix:
+        """
+        interpolacion del nivel grueso al fino
+
+        P0 es constante por agregado (P0[i, agregado(i)] = 1). con agregacion
+        suavizada se usa P = (I - w D^-1 A) P0, con w = (4/3) / rho(D^-1 A) y rho
+        acotado por gershgorin.
+        """
+        n = A.shape[0]
+        P0 = CSRMatrix(np.arange(n + 1), aggregates, np.ones(n), shape=(n, n_coarse))
+        if not self.smooth_prolongation:
+            return P0
+
+        diagonal = A.diagonal()
+        rho = float(np.max(A.abs_row_sums() / np.abs(diagonal)))
+        weight = (4.0 / 3.0) / rho
+
+        AP0 = A.matmat(P0)
+        scaled = weight * AP0.data / diagonal[AP0.row_ids]
+        return CSRMatrix.from_coo(np.concatenate([P0.row_ids, AP0.row_ids]),
+                                  np.concatenate([P0.indices, AP0.indices]),
+                                  np.concatenate([P0.data, -scaled]),
+                                  (n, n_coarse))
+
+    @staticmethod
+    def _as_matrix(A) -> CSRMatrix:
+        """convierte A a CSRMatrix (las matrices densas tambien)"""
+        sparse = as_csr(A)
+        if sparse is not None:
+            return sparse
+        return CSRMatrix.from_dense(np.asarray(A, dtype=float))
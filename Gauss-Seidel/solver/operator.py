@@ -0,0 +1,64 @@
+import numpy as np
+from typing import Callable, Optional, Tuple
+
+
+class RowOperator:
+    """
+    operador lineal sin matriz ensamblada (matrix-free), definido fila por fila
+
+    para stencils y otros operadores que nunca se ensamblan: solo hace falta una
+    funcion row_function(i) -> (columnas, valores) con los elementos distintos de
+    cero de la fila i (incluida la diagonal). es el mismo protocolo de filas que
+    CSRMatrix.row, asi que el barrido, la dominancia y la verificacion funcionan
+    igual, con memoria O(n) en lugar de O(n^2).
+    """
+
+    def __init__(self, n: int, row_function: Callable[[int], Tuple[np.ndarray, np.ndarray]],
+                 diagonal: Optional[np.ndarray] = None):
+        if n < 1:
+            raise ValueError(f"el operador debe tener al menos una fila, recibido: {n}")
+        # dimension del sistema (el operador es cuadrado)
+        self.shape = (int(n), int(n))
+        # funcion que genera los elementos de cada fila
+        self.row_function = row_function
+        # diagonal principal (si no se da, se extrae de las filas la primera vez)
+        self._diagonal = None if diagonal is None else np.asarray(diagonal, dtype=float)
+        if self._diagonal is not None and self._diagonal.shape != (self.shape[0],):
+            raise ValueError(f"la diagonal debe tener {self.shape[0]} elementos")
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def row(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """retorna (columnas, valores) de los elementos distintos de cero de la fila i"""
+        cols, values = self.row_function(i)
+        return np.asarray(cols, dtype=np.int64), np.asarray(values, dtype=float)
+
+    def diagonal(self) -> np.ndarray:
+        """retorna la diagonal principal"""
+        if self._diagonal is None:
+            diagonal = np.zeros(self.shape[0])
+            for i in range(self.shape[0]):
+                cols, values = self.row(i)
+                diagonal[i] = values[cols == i].sum()
+            self._diagonal = diagonal
+        return self._diagonal
+
+    def abs_row_sums(self) -> np.ndarray:
+        """suma de |a_ij| por fila, generando cada fila una vez"""
+        return np.array([np.abs(self.row(i)[1]).sum() for i in range(self.shape[0])])
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """calcula A @ x fila por fila (x puede ser n x k)"""
+        result = np.empty((self.shape[0],) + x.shape[1:])
+        for i in range(self.shape[0]):
+            cols, values = self.row(i)
+            result[i] = values @ x[cols]
+        return result
+
+    def __matmul__(self, x: np.ndarray) -> np.ndarray:
+        return self.matvec(np.asarray(x, dtype=float))
+
+    def copy(self) -> "RowOperator":
+        """el operador no guarda coeficientes propios: la copia comparte la funcion de filas"""
+        return RowOperator(self.shape[0], self.row_function, self._diagonal)
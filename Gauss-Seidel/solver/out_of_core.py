@@ -0,0 +1,85 @@
+import numpy as np
+from typing import Iterator, Tuple
+
+
+# memoria por defecto para el bloque de filas leido del disco (256 mb)
+DEFAULT_MEMORY_BUDGET = 256 * 2 ** 20
+
+
+class MemmapMatrix:
+    """
+    matriz densa en disco (np.memmap o .npy abierto con mmap_mode) leida por bloques
+
+    para sistemas densos mas grandes que la ram: el barrido recorre las filas en
+    orden, leyendo del disco bloques contiguos de `block_rows` filas cuyo tamano
+    no supera `memory_budget` bytes. cada bloque se lee una vez por barrido y
+    se descarta, asi que la memoria usada es O(bloque + n) en lugar de O(n^2).
+
+    bytes_read acumula los bytes leidos de la matriz (barridos, productos y
+    analisis), para dimensionar la entrada/salida.
+    """
+
+    def __init__(self, data: np.ndarray, memory_budget: int = DEFAULT_MEMORY_BUDGET):
+        if data.ndim != 2 or data.shape[0] != data.shape[1]:
+            raise ValueError(f"la matriz en disco debe ser cuadrada, recibido: {data.shape}")
+        if memory_budget < 1:
+            raise ValueError("memory_budget debe ser positivo")
+        # arreglo mapeado en memoria (no se carga completo)
+        self.data = data
+        self.shape = data.shape
+        # filas por bloque segun el presupuesto de memoria (al menos una)
+        row_bytes = data.shape[1] * np.dtype(float).itemsize
+        self.block_rows = int(max(1, min(data.shape[0], memory_budget // row_bytes)))
+        # bytes leidos de la matriz desde que se creo el objeto
+        self.bytes_read = 0
+        # diagonal principal (se lee del disco una sola vez)
+        self._diagonal = None
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    @property
+    def sweep_bytes(self) -> int:
+        """bytes que lee un barrido completo (toda la matriz una vez)"""
+        return self.shape[0] * self.shape[1] * self.data.dtype.itemsize
+
+    def blocks(self, reverse: bool = False) -> Iterator[Tuple[int, np.ndarray]]:
+        """recorre la matriz en orden (o del ultimo bloque al primero), retornando (fila inicial, bloque)"""
+        starts = range(0, self.shape[0], self.block_rows)
+        for start in (reversed(starts) if reverse else starts):
+            block = np.array(self.data[start:start + self.block_rows], dtype=float)
+            self.bytes_read += block.shape[0] * self.shape[1] * self.data.dtype.itemsize
+            yield start, block
+
+    def row(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        """retorna (columnas, valores) de la fila i"""
+        self.bytes_read += self.shape[1] * self.data.dtype.itemsize
+        return np.arange(self.shape[1]), np.array(self.data[i], dtype=float)
+
+    def diagonal(self) -> np.ndarray:
+        """retorna la diagonal principal (una lectura por fila)"""
+        if self._diagonal is None:
+            self._diagonal = np.array(np.diagonal(self.data), dtype=float)
+            self.bytes_read += self.shape[0] * self.data.dtype.itemsize
+        return self._diagonal
+
+    def abs_row_sums(self) -> np.ndarray:
+        """suma de |a_ij| por fila, en una pasada por bloques"""
+        sums = np.empty(self.shape[0])
+        for start, block in self.blocks():
+            sums[start:start + len(block)] = np.abs(block).sum(axis=1)
+        return sums
+
+    def matvec(self, x: np.ndarray) -> np.ndarray:
+        """calcula A @ x en una pasada por bloques (x puede ser n x k)"""
+        result = np.empty((self.shape[0],) + x.shape[1:])
+        for start, block in self.blocks():
+            result[start:start + len(block)] = block @ x
+        return result
+
+    def __matmul__(self, x: np.ndarray) -> np.ndarray:
+        return self.matvec(np.asarray(x, dtype=float))
+
+    def copy(self) -> "MemmapMatrix":
+        """la matriz en disco no se duplica: la copia comparte el mismo mapeo"""
+        return MemmapMatrix(self.data, self.block_rows * self.shape[1] * np.dtype(float).itemsize)
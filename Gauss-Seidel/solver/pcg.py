@@ -0,0 +1,217 @@
+import numpy as np
+from typing import Dict, List, Optional
+
+from .gauss_seidel import GaussSeidelSolver
+from .history import IterationHistory
+
+
+class ConjugateGradientSolver:
+    """
+    gradiente conjugado precondicionado con gauss-seidel simetrico
+
+    para sistemas simetricos definidos positivos converge mucho mas rapido que
+    gauss-seidel solo. el precondicionador aplica un barrido hacia adelante y
+    otro hacia atras (ssor si el omega del suavizador es distinto de 1) sobre
+    A z = r desde z = 0, lo que equivale a z = M^-1 r con M simetrica.
+
+    tiene la misma interfaz que GaussSeidelSolver (solve, generate_step_by_step,
+    max_iterations, tolerance, historial) y el mismo formato de resultado, asi
+    que se puede usar en su lugar sin cambiar el codigo que lo llama.
+    """
+
+    PRECONDITIONERS = ('sgs', None)
+
+    def __init__(self, smoother: Optional[GaussSeidelSolver] = None):
+        # solver de gauss-seidel cuyo barrido (y omega) se usa como precondicionador
+        self.smoother = smoother if smoother is not None else GaussSeidelSolver()
+        # precondicionador: 'sgs' (gauss-seidel simetrico) o None (gradiente conjugado simple)
+        self.preconditioner = 'sgs'
+        # historial de las iteraciones retenidas del proceso
+        self.iteration_history = []
+        # numero de iteracion de cada estado retenido en iteration_history
+        self.history_iterations = []
+        # datos de las primeras iteraciones (paso a paso)
+        self.step_records = []
+        # historial de errores entre iteraciones consecutivas
+        self.error_history = []
+        # norma 2 del residual despues de cada iteracion
+        self.residual_history = []
+        # numero maximo de iteraciones permitidas
+        self.max_iterations = 100
+        # tolerancia para determinar convergencia (misma norma que GaussSeidelSolver)
+        self.tolerance = 0.000001
+        # retencion del historial (ver GaussSeidelSolver)
+        self.history_policy = 'full'
+        self.history_size = 10
+        self.history_stride = 10
+
+    def solve(self, A, b: np.ndarray, x0: Optional[np.ndarray] = None, record_steps: int = 0) -> Dict:
+        """
+        resuelve ax = b (A simetrica definida positiva) con gradiente conjugado precondicionado
+
+        args:
+            A: matriz de coeficientes en cualquiera de los formatos de GaussSeidelSolver
+            b: vector de terminos independientes
+            x0: aproximacion inicial opcional; por defecto ceros
+            record_steps: numero de iteraciones iniciales que se guardan en
+               self.step_records (para generate_step_by_step)
+
+        returns:
+            dict con solucion, iteraciones, convergencia, errores, historial y
+            residuales; status es 'converged', 'max_iterations' o 'breakdown'
+            (p^T A p <= 0: la matriz no es definida positiva)
+        """
+        if self.preconditioner not in self.PRECONDITIONERS:
+            raise ValueError(f"precondicionador desconocido: {self.preconditioner}")
+        omega = self.smoother.omega
+        if self.preconditioner is not None and (omega == 'auto' or not 0 < float(omega) < 2):
+            raise ValueError(f"el precondicionador necesita un omega fijo en (0, 2), recibido: {omega}")
+        A = self.smoother._prepare_matrix(A)
+        b = np.asarray(b, dtype=float)
+        if b.ndim != 1:
+            raise ValueError("el gradiente conjugado resuelve un lado derecho a la vez")
+        if self.preconditioner is not None:
+            self.smoother._prepare_sweeps(A)
+
+        x = GaussSeidelSolver._initial_guess(x0, b.shape)
+        history = IterationHistory(len(b), self.max_iterations, self.history_policy,
+                                   self.history_size, self.history_stride)
+        self.error_history = []
+        self.residual_history = []
+        self.step_records = []
+        history.record(0, x)
+
+        r = b - A @ x
+        z = self._precondition(A, r)
+        p = z.copy()
+        rz = r @ z
+
+        converged = not np.any(r)
+        breakdown = False
+        iterations = 0 if converged else self.max_iterations
+        error = 0.0 if converged else np.inf
+        for iteration in range(0 if converged else self.max_iterations):
+            Ap = A @ p
+            curvature = p @ Ap
+            if curvature <= 0:
+                breakdown = True
+                iterations = iteration
+                break
+
+            alpha = rz / curvature
+            step = alpha * p
+            x_old = x.copy() if iteration < record_steps else None
+            x += step
+            r -= alpha * Ap
+
+            # mismo criterio que gauss-seidel: cambio entre iteraciones en norma infinito
+            error = np.linalg.norm(step, np.inf)
+            self.error_history.append(error)
+            self.residual_history.append(float(np.linalg.norm(r)))
+            history.record(iteration + 1, x)
+
+            if x_old is not None:
+                self.step_records.append({
+                    'iteration': iteration + 1,
+                    'previous_solution': x_old,
+                    'solution': x.copy(),
+                    'alpha': alpha,
+                    'direction': p.copy()
+                })
+
+            if error < self.tolerance:
+                converged = True
+                iterations = iteration + 1
+                break
+
+            # nueva direccion conjugada respecto al residual precondicionado
+            z = self._precondition(A, r)
+            rz_new = r @ z
+            p = z + (rz_new / rz) * p
+            rz = rz_new
+
+        self.iteration_history = history.states
+        self.history_iterations = history.iterations
+
+        if converged:
+            status = 'converged'
+        else:
+            status = 'breakdown' if breakdown else 'max_iterations'
+        return {
+            'solution': x,
+            'iterations': iterations,
+            'converged': converged,
+            'status': status,
+            'final_error': error,
+            'history': self.iteration_history,
+            'history_iterations': self.history_iterations,
+            'errors': self.error_history,
+            'residuals': self.residual_history,
+            'preconditioner': self.preconditioner,
+            'omega': float(omega) if self.preconditioner is not None else None
+        }
+
+    def _precondition(self, A, r: np.ndarray) -> np.ndarray:
+        """aplica z = M^-1 r: un barrido de gauss-seidel simetrico sobre A z = r desde z = 0"""
+        if self.preconditioner is None:
+            return r.copy()
+        omega = float(self.smoother.omega)
+        z = np.zeros_like(r)
+        self.smoother._sweep(A, r, z, omega)
+        self.smoother._sweep(A, r, z, omega, reverse=True)
+        return z
+
+    def generate_step_by_step(self, A, b: np.ndarray, dominance: Optional[Dict] = None) -> List[Dict]:
+        """
+        genera explicacion paso a paso del metodo, con el mismo formato de pasos
+        que GaussSeidelSolver.generate_step_by_step (dominance se acepta por
+        compatibilidad; el gradiente conjugado no depende de la dominancia)
+        """
+        A = self.smoother._prepare_matrix(A)
+        b = np.asarray(b, dtype=float)
+        result = self.solve(A, b, record_steps=10)
+        n = len(A)
+        steps = [{
+            'type': 'system',
+            'title': 'sistema original',
+            'content': f'resolver el sistema de {n} ecuaciones con {n} incognitas',
+            'matrix_A': A.copy(),
+            'vector_b': b.copy()
+        }, {
+            'type': 'method',
+            'title': 'gradiente conjugado precondicionado',
+            'content': ('x^(k+1) = x^(k) + alpha_k * p_k, con alpha_k = (r_k . z_k) / (p_k . A p_k), '
+                        'z_k = M^-1 r_k (gauss-seidel simetrico) y p_(k+1) = z_(k+1) + beta_k * p_k')
+        }]
+
+        for record in self.step_records:
+            k = record['iteration']
+            x_old, x_new = record['previous_solution'], record['solution']
+            alpha, direction = record['alpha'], record['direction']
+            steps.append({
+                'type': 'iteration',
+                'title': f'iteracion {k}',
+                'iteration': k,
+                'solution': x_new,
+                'previous_solution': x_old,
+                'error': self.error_history[k - 1],
+                'calculations': [{
+                    'variable': j,
+                    'formula': f'x{j+1} = {x_old[j]:.6f} + {alpha:.6f} * {direction[j]:.6f} = {x_new[j]:.6f}',
+                    'result': x_new[j]
+                } for j in range(n)]
+            })
+
+        steps.append({
+            'type': 'result',
+            'title': 'resultado final',
+            'converged': result['converged'],
+            'status': result['status'],
+            'solution': result['solution'],
+            'iterations': result['iterations'],
+            'final_error': result['final_error'],
+            'verification': self.smoother._verify_solution(A, b, result['solution']),
+            'original_matrix': A.copy(),
+            'original_vector': b.copy()
+        })
+        return steps
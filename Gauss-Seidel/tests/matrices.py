@@ -0,0 +1,21 @@
+"""Model Poisson matrices shared by the solver tests"""
+
+import numpy as np
+from solver.sparse import CSRMatrix
+
+
+def poisson_1d(n, diagonal=2.0):
+    """Tridiagonal [-1, diagonal, -1] matrix (dense); 2 is the 1-D Poisson matrix"""
+    return diagonal * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+
+
+def poisson_2d(m, shift=0.0):
+    """5-point Poisson matrix on an m x m grid plus shift * I, as a CSRMatrix (use .toarray() for dense)"""
+    grid = np.arange(m * m).reshape(m, m)
+    rows, cols = [np.arange(m * m)], [np.arange(m * m)]
+    values = [np.full(m * m, 4.0 + shift)]
+    for left, right in ((grid[:, :-1], grid[:, 1:]), (grid[:-1, :], grid[1:, :])):
+        rows += [left.ravel(), right.ravel()]
+        cols += [right.ravel(), left.ravel()]
+        values += [np.full(2 * left.size, -1.0)]
+    return CSRMatrix.from_coo(np.concatenate(rows), np.concatenate(cols), np.concatenate(values), (m * m, m * m))
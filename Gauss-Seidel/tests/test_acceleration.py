@@ -0,0 +1,100 @@
+"""Tests for the Anderson / Aitken acceleration of the Gauss-Seidel iteration"""
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+from solver.acceleration import AitkenAcceleration, AndersonAcceleration, make_accelerator
+from solver.gauss_seidel import GaussSeidelSolver
+from tests.matrices import poisson_1d
+
+
+class TestAccelerators:
+    """Test cases for the accelerators on their own"""
+
+    def test_aitken_sums_geometric_error(self):
+        """Test Aitken recovers the limit of a geometrically converging sequence"""
+        limit = np.array([1.0, -2.0])
+        direction = np.array([3.0, 1.0])
+        points = [limit + 0.9 ** k * direction for k in range(3)]
+        aitken = AitkenAcceleration()
+
+        assert aitken.update(points[0], points[1]) is None
+        extrapolated = aitken.update(points[1], points[2])
+
+        np.testing.assert_allclose(extrapolated, limit)
+
+    def test_anderson_solves_linear_map(self):
+        """Test Anderson reaches the fixed point of a linear map within n + 1 steps"""
+        M = np.array([[0.5, 0.2], [0.1, 0.7]])
+        c = np.array([1.0, 1.0])
+        fixed_point = np.linalg.solve(np.eye(2) - M, c)
+        anderson = AndersonAcceleration(window=2)
+
+        x = np.zeros(2)
+        for _ in range(3):
+            proposal = anderson.update(x, M @ x + c)
+            x = M @ x + c if proposal is None else proposal
+
+        np.testing.assert_allclose(x, fixed_point)
+
+    def test_unknown_method(self):
+        """Test an unknown acceleration method raises an error"""
+        with pytest.raises(ValueError):
+            make_accelerator('richardson')
+
+
+class TestAcceleratedSolver:
+    """Test cases for GaussSeidelSolver with acceleration enabled"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.solver = GaussSeidelSolver()
+        self.solver.max_iterations = 5000
+        self.A = poisson_1d(30)
+        self.b = np.ones(30)
+
+    @pytest.mark.parametrize('method', ['anderson', 'aitken'])
+    def test_acceleration_reduces_iterations(self, method):
+        """Test both accelerators converge to the solution in fewer sweeps"""
+        plain = self.solver.solve(self.A, self.b)
+        self.solver.acceleration = method
+        accelerated = self.solver.solve(self.A, self.b)
+
+        assert accelerated['converged']
+        assert accelerated['iterations'] < plain['iterations'] / 5
+        np.testing.assert_allclose(accelerated['solution'], np.linalg.solve(self.A, self.b), atol=1e-4)
+        assert accelerated['acceleration']['method'] == method
+        assert accelerated['acceleration']['accepted_steps'] > 0
+        assert plain['acceleration'] is None
+
+    def test_safeguard_rejects_worse_steps(self):
+        """Test proposals that increase the residual fall back to the plain sweep"""
+
+        class BadAccelerator:
+            resets = 0
+
+            def update(self, x, gx):
+                return gx + 100.0
+
+            def reset(self):
+                BadAccelerator.resets += 1
+
+        self.solver.acceleration = 'anderson'
+        plain_solver = GaussSeidelSolver()
+        plain_solver.max_iterations = 5000
+        plain = plain_solver.solve(self.A, self.b)
+
+        with patch('solver.gauss_seidel.make_accelerator', return_value=BadAccelerator()):
+            result = self.solver.solve(self.A, self.b)
+
+        assert result['iterations'] == plain['iterations']
+        np.testing.assert_allclose(result['solution'], plain['solution'])
+        assert result['acceleration']['accepted_steps'] == 0
+        assert result['acceleration']['rejected_steps'] == result['iterations']
+        assert BadAccelerator.resets == result['iterations']
+
+    def test_multiple_right_hand_sides_not_supported(self):
+        """Test acceleration with several right-hand sides raises an error"""
+        self.solver.acceleration = 'aitken'
+        with pytest.raises(ValueError):
+            self.solver.solve(self.A, np.ones((30, 2)))
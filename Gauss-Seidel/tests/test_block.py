@@ -0,0 +1,155 @@
+"""Tests for block Gauss-Seidel with cached LU block factorizations"""
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+from solver import block
+from solver.block import BlockGaussSeidelSolver, lu_factor, lu_solve
+from solver.gauss_seidel import GaussSeidelSolver
+from solver.sparse import CSRMatrix
+
+
+def coupled_blocks(nodes, size=3, seed=1):
+    """SPD matrix with strongly coupled size x size node blocks and weak node coupling"""
+    rng = np.random.default_rng(seed)
+    n = nodes * size
+    A = np.zeros((n, n))
+    for k in range(nodes):
+        B = rng.random((size, size))
+        A[k * size:(k + 1) * size, k * size:(k + 1) * size] = B + B.T + 2.5 * np.eye(size)
+    for k in range(nodes - 1):
+        coupling = -0.3 * np.eye(size)
+        A[k * size:(k + 1) * size, (k + 1) * size:(k + 2) * size] = coupling
+        A[(k + 1) * size:(k + 2) * size, k * size:(k + 1) * size] = coupling
+    return A
+
+
+class TestLU:
+    """Test cases for the block LU helpers"""
+
+    def test_factor_and_solve(self):
+        """Test LU with partial pivoting solves vectors and matrices"""
+        M = np.array([[0.0, 2.0, 1.0], [1.0, 1.0, 0.0], [3.0, 0.0, 1.0]])
+        factors = lu_factor(M)
+
+        np.testing.assert_allclose(lu_solve(factors, np.ones(3)), np.linalg.solve(M, np.ones(3)))
+        rhs = np.arange(6.0).reshape(3, 2)
+        np.testing.assert_allclose(lu_solve(factors, rhs), np.linalg.solve(M, rhs))
+
+    def test_singular_block(self):
+        """Test singular blocks raise an error"""
+        with pytest.raises(ValueError):
+            lu_factor(np.array([[1.0, 2.0], [2.0, 4.0]]))
+
+
+class TestBlockGaussSeidelSolver:
+    """Test cases for BlockGaussSeidelSolver"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.solver = BlockGaussSeidelSolver(block_size=3)
+        self.solver.max_iterations = 1000
+        self.A = coupled_blocks(20)
+        self.b = np.ones(60)
+
+    def test_fewer_sweeps_than_scalar(self):
+        """Test block sweeps converge to the solution in fewer iterations"""
+        scalar = GaussSeidelSolver()
+        scalar.max_iterations = 1000
+
+        plain = scalar.solve(self.A, self.b)
+        result = self.solver.solve(self.A, self.b)
+
+        assert result['converged']
+        assert result['iterations'] < plain['iterations']
+        assert result['blocks'] == 20
+        np.testing.assert_allclose(result['solution'], np.linalg.solve(self.A, self.b), atol=1e-5)
+
+    def test_sparse_matches_dense(self):
+        """Test CSR input takes the same block iterates as dense input"""
+        dense = self.solver.solve(self.A, self.b)
+        sparse = self.solver.solve(CSRMatrix.from_dense(self.A), self.b)
+
+        assert sparse['iterations'] == dense['iterations']
+        np.testing.assert_allclose(sparse['solution'], dense['solution'])
+
+    def test_block_size_one_is_scalar(self):
+        """Test 1x1 blocks reproduce scalar Gauss-Seidel"""
+        scalar = GaussSeidelSolver()
+        scalar.max_iterations = 1000
+        self.solver.block_size = 1
+
+        np.testing.assert_allclose(self.solver.solve(self.A, self.b)['solution'],
+                                   scalar.solve(self.A, self.b)['solution'])
+
+    def test_explicit_partition(self):
+        """Test a non-contiguous partition and its validation"""
+        self.solver.blocks = [np.arange(0, 60, 2), np.arange(1, 60, 2)]
+        result = self.solver.solve(self.A, self.b)
+        assert result['converged']
+        assert result['blocks'] == 2
+
+        self.solver.blocks = [np.arange(0, 30), np.arange(29, 60)]
+        with pytest.raises(ValueError):
+            self.solver.solve(self.A, self.b)
+
+    def test_blocks_are_factored_once_per_solve(self):
+        """Test each diagonal block is factored once per solve, not once per sweep"""
+        with patch.object(block, 'lu_factor', wraps=lu_factor) as spy:
+            result = self.solver.solve(self.A, self.b)
+            self.solver.solve(self.A, 2 * self.b)
+
+        assert result['iterations'] > 1
+        assert spy.call_count == 2 * 20
+
+    def test_sweeps_apply_stored_inverses(self):
+        """Test sweeps multiply by the block inverses instead of re-running lu_solve"""
+        with patch.object(block, 'lu_solve', wraps=lu_solve) as spy:
+            result = self.solver.solve(self.A, self.b)
+
+        assert result['iterations'] > 1
+        assert spy.call_count == 20
+        for rows, _, inverse in self.solver._block_plan(self.A):
+            np.testing.assert_allclose(inverse @ self.A[np.ix_(rows, rows)], np.eye(len(rows)), atol=1e-12)
+
+    def test_in_place_edit_is_seen(self):
+        """Test editing A in place between solves rebuilds the block inverses"""
+        A = coupled_blocks(4)
+        b = np.ones(12)
+        self.solver.solve(A, b)
+
+        A[0, 0] += 3.0
+        A[0, 1] -= 0.5
+        A[1, 1] += 2.0
+        result = self.solver.solve(A, b)
+
+        assert result['converged']
+        np.testing.assert_allclose(A @ result['solution'], b, atol=1e-5)
+
+    def test_multiple_right_hand_sides_and_sor(self):
+        """Test block sweeps with an (n, k) right-hand side and relaxation"""
+        B = np.column_stack([self.b, np.arange(60.0)])
+        self.solver.omega = 1.1
+
+        result = self.solver.solve(self.A, B)
+
+        assert result['converged']
+        np.testing.assert_allclose(result['solution'], np.linalg.solve(self.A, B), atol=1e-5)
+
+    def test_step_by_step_sums_match_block_values(self):
+        """Test the recorded sums reproduce each block update in the step-by-step view"""
+        A = coupled_blocks(2)
+        steps = self.solver.generate_step_by_step(A, np.ones(6))
+        iteration = next(step for step in steps if step['type'] == 'iteration')
+        record = self.solver.step_records[0]
+
+        diagonal = np.diag(A)
+        values = (1.0 - record['sums'][:, 0] - record['sums'][:, 1]) / diagonal
+        np.testing.assert_allclose(values, record['solution'])
+        assert len(iteration['calculations']) == 6
+
+    def test_requires_natural_ordering(self):
+        """Test the multicolor ordering is rejected"""
+        self.solver.ordering = 'multicolor'
+        with pytest.raises(ValueError):
+            self.solver.solve(self.A, self.b)
@@ -0,0 +1,60 @@
+"""Tests for the multicolor ordering"""
+
+import numpy as np
+from solver.coloring import build_color_plan, greedy_coloring
+from solver.gauss_seidel import GaussSeidelSolver
+from solver.sparse import CSRMatrix
+from tests.matrices import poisson_2d
+
+
+class TestColoring:
+    """Test cases for the greedy coloring pre-pass"""
+
+    def test_grid_is_red_black(self):
+        """Test a 5-point grid needs exactly two colors"""
+        A = poisson_2d(6, shift=0.5)
+        colors = greedy_coloring(A)
+
+        assert colors.max() + 1 == 2
+        # no two neighbours share a color
+        off = A.off_diagonal()
+        assert np.all(colors[off.row_ids] != colors[off.indices])
+
+    def test_dense_matrix_falls_back(self):
+        """Test a full matrix gives n colors and no plan"""
+        n_colors, plan = build_color_plan(np.ones((5, 5)) + 5 * np.eye(5), min_class_size=2)
+
+        assert n_colors == 5
+        assert plan is None
+
+
+class TestMulticolorSolve:
+    """Test cases for multicolor sweeps in the solver"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.solver = GaussSeidelSolver()
+        self.solver.ordering = 'multicolor'
+        self.solver.min_color_class_size = 4
+
+    def test_multicolor_dense_and_sparse(self):
+        """Test red-black sweeps converge to the direct solution"""
+        A = poisson_2d(8, shift=0.5).toarray()
+        b = np.linspace(0, 1, 64)
+        expected = np.linalg.solve(A, b)
+
+        for matrix in (A, CSRMatrix.from_dense(A)):
+            result = self.solver.solve(matrix, b)
+            assert result['converged']
+            assert result['ordering'] == 'multicolor'
+            assert result['colors'] == 2
+            np.testing.assert_allclose(result['solution'], expected, atol=1e-5)
+
+    def test_fallback_to_natural(self):
+        """Test the solver falls back to natural order for fine colorings"""
+        A = np.array([[4, 1], [1, 3]], dtype=float)
+        result = self.solver.solve(A, np.array([1, 2], dtype=float))
+
+        assert result['converged']
+        assert result['ordering'] == 'natural'
+        assert result['colors'] == 2
@@ -0,0 +1,72 @@
+"""Tests for the shared diagonal dominance analysis"""
+
+import numpy as np
+from unittest.mock import patch
+from solver import dominance
+from solver.dominance import analyze_dominance
+from solver.gauss_seidel import GaussSeidelSolver
+from solver.sparse import CSRMatrix
+from utils.validators import EquationValidator
+
+
+class TestDominanceAnalysis:
+    """Test cases for analyze_dominance"""
+
+    def test_margins_and_flags(self):
+        """Test per-row margins, weakest row and strict/weak flags"""
+        A = np.array([[4, 1, 1], [1, 2, 1], [0, -1, 3]], dtype=float)
+
+        analysis = analyze_dominance(A)
+
+        np.testing.assert_array_equal(analysis['margins'], [2, 0, 2])
+        assert analysis['weakest_row'] == 1
+        assert analysis['weakest_margin'] == 0
+        assert not analysis['is_strict']
+        assert analysis['is_weak']
+
+    def test_sparse_matches_dense(self):
+        """Test CSR input gives the same analysis as dense"""
+        A = np.array([[4, -1, 0], [-1, 4, -1], [0, -5, 4]], dtype=float)
+
+        dense = analyze_dominance(A)
+        sparse = analyze_dominance(CSRMatrix.from_dense(A))
+
+        np.testing.assert_array_equal(dense['margins'], sparse['margins'])
+        assert dense['weakest_row'] == sparse['weakest_row'] == 2
+        assert not sparse['is_weak']
+
+    def test_in_place_edit_is_seen(self, capsys):
+        """Test an in-place edit after solving changes the analysis and the warning"""
+        solver = GaussSeidelSolver()
+        A = np.array([[4, 1], [1, 3]], dtype=float)
+        b = np.array([1, 2], dtype=float)
+
+        solver.solve(A, b)
+        assert "advertencia" not in capsys.readouterr().out
+
+        A[0, 0] = 0.1
+        assert not analyze_dominance(A)['is_strict']
+        solver.solve(A, b)
+        assert "advertencia" in capsys.readouterr().out
+
+    def test_validator_result_carries_analysis(self):
+        """Test make_diagonally_dominant returns the analysis of the matrix it returns"""
+        A = np.array([[1, 5, 1], [6, 1, 1], [1, 1, 4]], dtype=float)
+        b = np.array([1, 2, 3], dtype=float)
+
+        result = EquationValidator.make_diagonally_dominant(A, b)
+
+        assert result['success']
+        np.testing.assert_array_equal(result['dominance']['margins'],
+                                      analyze_dominance(result['matrix'])['margins'])
+
+    def test_validator_and_solver_share_analysis(self):
+        """Test validate + solve analyzes the matrix only once when the analysis is passed on"""
+        A = np.array([[10, -1, 2], [-1, 11, -1], [2, -1, 10]], dtype=float)
+        b = np.array([6, 25, -11], dtype=float)
+
+        with patch.object(dominance, '_build_analysis', wraps=dominance._build_analysis) as spy:
+            result = EquationValidator.make_diagonally_dominant(A, b)
+            GaussSeidelSolver().generate_step_by_step(result['matrix'], result['vector'], result['dominance'])
+
+        assert spy.call_count == 1
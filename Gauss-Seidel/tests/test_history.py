@@ -0,0 +1,110 @@
+"""Tests for the bounded iteration history"""
+
+import numpy as np
+import pytest
+from solver.gauss_seidel import GaussSeidelSolver
+from solver.history import IterationHistory
+
+
+def record_all(history, count, n=2):
+    """Record states x = [k, k, ...] for k = 0..count"""
+    for k in range(count + 1):
+        history.record(k, np.full(n, float(k)))
+
+
+class TestIterationHistory:
+    """Test cases for IterationHistory retention policies"""
+
+    def test_full(self):
+        """Test every iteration is retained"""
+        history = IterationHistory(2, 20, 'full')
+        record_all(history, 7)
+
+        np.testing.assert_array_equal(history.iterations, np.arange(8))
+        assert history.states.shape == (8, 2)
+
+    def test_none(self):
+        """Test nothing is retained"""
+        history = IterationHistory(2, 20, 'none')
+        record_all(history, 7)
+
+        assert len(history) == 0
+        assert history.states.shape == (0, 2)
+
+    def test_ends(self):
+        """Test first K and last K iterations are retained"""
+        history = IterationHistory(2, 100, 'ends', size=3)
+        record_all(history, 20)
+
+        np.testing.assert_array_equal(history.iterations, [0, 1, 2, 18, 19, 20])
+        np.testing.assert_array_equal(history.states[:, 0], [0, 1, 2, 18, 19, 20])
+
+    def test_every(self):
+        """Test every Nth iteration plus the last one are retained"""
+        history = IterationHistory(2, 100, 'every', stride=5)
+        record_all(history, 12)
+
+        np.testing.assert_array_equal(history.iterations, [0, 5, 10, 12])
+
+        history.record(15, np.full(2, 15.0))
+        np.testing.assert_array_equal(history.iterations, [0, 5, 10, 15])
+        np.testing.assert_array_equal(history.states[:, 0], [0, 5, 10, 15])
+
+    @pytest.mark.parametrize('policy', ['full', 'every'])
+    def test_buffer_grows_with_recorded_iterations(self, policy):
+        """Test memory tracks the recorded sweeps, not max_iterations"""
+        history = IterationHistory((90000, 3), 100000, policy, stride=2)
+        assert history._states.nbytes <= IterationHistory.INITIAL_CAPACITY * 90000 * 3 * 8
+
+        record_all(history, 100, n=(90000, 3))
+
+        expected = np.arange(101) if policy == 'full' else np.arange(0, 101, 2)
+        np.testing.assert_array_equal(history.iterations, expected)
+        np.testing.assert_array_equal(history.states[:, 0, 0], expected)
+        assert len(history._states) < 2 * len(expected)
+
+    def test_unknown_policy(self):
+        """Test invalid policies are rejected"""
+        with pytest.raises(ValueError):
+            IterationHistory(2, 10, 'sometimes')
+
+
+class TestSolverHistory:
+    """Test cases for history retention in the solver"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.solver = GaussSeidelSolver()
+        n = 30
+        self.A = 2.5 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+        self.b = np.ones(n)
+
+    def test_ends_policy_bounds_memory(self):
+        """Test 'ends' keeps 2K states regardless of the sweep count"""
+        self.solver.history_policy = 'ends'
+        self.solver.history_size = 4
+        result = self.solver.solve(self.A, self.b)
+
+        assert result['iterations'] > 8
+        assert result['history'].shape == (8, 30)
+        assert result['history_iterations'][-1] == result['iterations']
+        np.testing.assert_array_equal(result['history'][-1], result['solution'])
+
+    def test_step_view_independent_of_retention(self):
+        """Test step-by-step details the first sweeps even with sparse retention"""
+        self.solver.history_policy = 'every'
+        self.solver.history_stride = 3
+        steps = self.solver.generate_step_by_step(self.A, self.b)
+        iterations = [s for s in steps if s['type'] == 'iteration']
+
+        assert [s['iteration'] for s in iterations] == list(range(1, 11))
+        assert all(len(s['calculations']) == 30 for s in iterations)
+        assert steps[-1]['converged']
+
+    def test_step_view_full_policy(self):
+        """Test step-by-step shows detailed calculations with full history"""
+        steps = self.solver.generate_step_by_step(self.A, self.b)
+        iterations = [s for s in steps if s['type'] == 'iteration']
+
+        assert [s['iteration'] for s in iterations] == list(range(1, 11))
+        assert len(iterations[0]['calculations']) == 30
@@ -0,0 +1,99 @@
+"""Tests for the aggregation multigrid solver with Gauss-Seidel smoothing"""
+
+import numpy as np
+import pytest
+from solver.gauss_seidel import GaussSeidelSolver
+from solver.multigrid import MultigridSolver
+from tests.matrices import poisson_1d, poisson_2d
+
+
+class TestMultigridSolver:
+    """Test cases for MultigridSolver"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.solver = MultigridSolver()
+
+    def test_solves_poisson(self):
+        """Test a V-cycle solve matches the direct solution"""
+        A = poisson_2d(16)
+        b = np.ones(256)
+
+        result = self.solver.solve(A, b)
+
+        assert result['converged']
+        np.testing.assert_allclose(result['solution'], np.linalg.solve(A.toarray(), b), atol=1e-5)
+        assert len(result['levels']) > 1
+        assert result['levels'][0] == 256
+
+    @pytest.mark.parametrize('cycle', ['V', 'W'])
+    def test_cycles_nearly_independent_of_size(self, cycle):
+        """Test the cycle count barely grows from a 16x16 to a 48x48 grid"""
+        self.solver.cycle = cycle
+        small = self.solver.solve(poisson_2d(16), np.ones(256))
+        large = self.solver.solve(poisson_2d(48), np.ones(48 * 48))
+
+        assert small['converged'] and large['converged']
+        assert large['iterations'] <= 2 * small['iterations']
+        assert large['iterations'] < 25
+
+    def test_fewer_iterations_than_gauss_seidel(self):
+        """Test multigrid needs far fewer cycles than plain Gauss-Seidel sweeps"""
+        A = poisson_2d(16)
+        b = np.ones(256)
+        gauss_seidel = GaussSeidelSolver()
+        gauss_seidel.max_iterations = 5000
+
+        plain = gauss_seidel.solve(A, b)
+        result = self.solver.solve(A, b)
+
+        assert result['iterations'] * 10 < plain['iterations']
+
+    def test_aggregation_covers_every_node(self):
+        """Test every fine node belongs to an aggregate and aggregates are coarser"""
+        A = poisson_2d(12)
+        aggregates = self.solver._aggregate(A)
+
+        assert np.all(aggregates >= 0)
+        assert aggregates.max() + 1 < 144
+        np.testing.assert_array_equal(np.unique(aggregates), np.arange(aggregates.max() + 1))
+
+    def test_galerkin_coarse_operator(self):
+        """Test the coarse operator equals P^T A P"""
+        A = poisson_2d(12)
+        levels = self.solver.setup(A)
+        P = levels[0]['P'].toarray()
+
+        np.testing.assert_allclose(levels[1]['A'].toarray(), P.T @ A.toarray() @ P, atol=1e-12)
+
+    def test_dense_input_and_hierarchy_reuse(self):
+        """Test dense matrices are accepted and the hierarchy is reused only when asked to"""
+        A = poisson_2d(10).toarray()
+        self.solver.coarse_size = 20
+
+        levels = self.solver.setup(A)
+        result = self.solver.solve(A, np.arange(100.0), reuse_setup=True)
+
+        assert self.solver.levels is levels
+        np.testing.assert_allclose(result['solution'], np.linalg.solve(A, np.arange(100.0)), atol=1e-5)
+
+        self.solver.solve(A, np.ones(100))
+        assert self.solver.levels is not levels
+
+    def test_in_place_edit_is_seen(self):
+        """Test editing A in place between solves rebuilds the hierarchy"""
+        T = poisson_1d(200)
+        b = np.ones(200)
+        self.solver.solve(T, b)
+
+        T *= 2.0
+        result = self.solver.solve(T, b)
+
+        assert result['converged']
+        assert np.linalg.norm(b - T @ result['solution']) < 1e-4
+
+    def test_invalid_cycle(self):
+        """Test an unknown cycle type raises an error"""
+        self.solver.cycle = 'F'
+        with pytest.raises(ValueError):
+            self.solver.solve(poisson_2d(4), np.ones(16))
@@ -0,0 +1,109 @@
+"""Tests for matrix-free row operators"""
+
+import numpy as np
+import pytest
+from solver.dominance import analyze_dominance
+from solver.gauss_seidel import GaussSeidelSolver
+from solver.operator import RowOperator
+from solver.session import GaussSeidelSession
+
+
+def stencil_row(n, center=3.0):
+    """Row generator for the tridiagonal stencil [-1, center, -1]"""
+    def row(i):
+        cols = np.arange(max(i - 1, 0), min(i + 2, n))
+        values = np.where(cols == i, center, -1.0)
+        return cols, values
+    return row
+
+
+def stencil_dense(n, center=3.0):
+    """Assembled matrix of the same stencil"""
+    return center * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+
+
+class TestRowOperator:
+    """Test cases for RowOperator"""
+
+    def test_rows_diagonal_and_matvec(self):
+        """Test the operator reproduces the assembled matrix"""
+        n = 7
+        operator = RowOperator(n, stencil_row(n))
+        dense = stencil_dense(n)
+        x = np.arange(n, dtype=float)
+
+        np.testing.assert_allclose(operator.diagonal(), np.diag(dense))
+        np.testing.assert_allclose(operator @ x, dense @ x)
+        np.testing.assert_allclose(operator.abs_row_sums(), np.abs(dense).sum(axis=1))
+        assert len(operator) == n
+
+    def test_invalid_arguments(self):
+        """Test invalid sizes and diagonals raise errors"""
+        with pytest.raises(ValueError):
+            RowOperator(0, stencil_row(1))
+        with pytest.raises(ValueError):
+            RowOperator(3, stencil_row(3), diagonal=np.ones(2))
+
+    def test_dominance_analysis(self):
+        """Test the dominance analysis accepts operators"""
+        analysis = analyze_dominance(RowOperator(5, stencil_row(5)))
+        assert analysis['is_strict']
+        assert not analyze_dominance(RowOperator(5, stencil_row(5, center=1.5)))['is_weak']
+
+
+class TestMatrixFreeSolve:
+    """Test cases for solving with a RowOperator"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.solver = GaussSeidelSolver()
+
+    def test_matches_dense_solve(self):
+        """Test the operator path reports the same iterates as the dense path"""
+        n = 20
+        b = np.linspace(1, 2, n)
+        dense = self.solver.solve(stencil_dense(n), b)
+        dense_history = dense['history']
+        operator = self.solver.solve(RowOperator(n, stencil_row(n)), b)
+
+        assert operator['converged']
+        assert operator['iterations'] == dense['iterations']
+        np.testing.assert_allclose(operator['solution'], dense['solution'])
+        np.testing.assert_allclose(operator['history'], dense_history)
+
+    def test_multiple_right_hand_sides(self):
+        """Test an (n, k) right-hand side with an operator"""
+        n = 12
+        B = np.column_stack([np.ones(n), np.arange(n, dtype=float)])
+        result = self.solver.solve(RowOperator(n, stencil_row(n)), B)
+
+        assert result['converged']
+        np.testing.assert_allclose(result['solution'], np.linalg.solve(stencil_dense(n), B), atol=1e-5)
+
+    def test_step_by_step_and_verification(self):
+        """Test the step-by-step output works without an assembled matrix"""
+        n = 4
+        steps = self.solver.generate_step_by_step(RowOperator(n, stencil_row(n)), np.ones(n))
+        result = steps[-1]
+
+        assert result['converged']
+        assert result['verification']['total_residual'] < 1e-5
+        assert result['verification']['equations'][0]['original_equation'] == "3.000x1 - x2 = 1.000"
+
+    def test_multicolor_requires_assembled_matrix(self):
+        """Test the multicolor ordering rejects operators"""
+        self.solver.ordering = 'multicolor'
+        with pytest.raises(ValueError):
+            self.solver.solve(RowOperator(4, stencil_row(4)), np.ones(4))
+
+    def test_session_warm_start(self):
+        """Test sessions warm-start operators by identity"""
+        n = 10
+        operator = RowOperator(n, stencil_row(n))
+        session = GaussSeidelSession()
+
+        session.solve(operator, np.ones(n))
+        result = session.solve(operator, np.ones(n))
+
+        assert result['warm_start']
+        assert result['sweeps_saved'] > 0
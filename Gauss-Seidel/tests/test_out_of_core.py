@@ -0,0 +1,107 @@
+"""Tests for the out-of-core Gauss-Seidel sweep over memory-mapped matrices"""
+
+import numpy as np
+import pytest
+from solver.dominance import analyze_dominance
+from solver.gauss_seidel import GaussSeidelSolver
+from solver.out_of_core import MemmapMatrix
+from solver.session import GaussSeidelSession
+
+
+def dominant_matrix(n, seed=0):
+    """Random strictly diagonally dominant matrix"""
+    rng = np.random.default_rng(seed)
+    A = rng.random((n, n))
+    return A + np.diag(A.sum(axis=1) + 1)
+
+
+@pytest.fixture
+def mapped(tmp_path):
+    """A 60x60 dominant matrix saved to disk and reopened with mmap_mode"""
+    A = dominant_matrix(60)
+    path = tmp_path / 'A.npy'
+    np.save(path, A)
+    return A, np.load(path, mmap_mode='r')
+
+
+class TestMemmapMatrix:
+    """Test cases for MemmapMatrix"""
+
+    def test_blocks_follow_memory_budget(self, mapped):
+        """Test the block size respects the memory budget and covers every row once"""
+        A, data = mapped
+        matrix = MemmapMatrix(data, memory_budget=7 * 60 * 8)
+
+        blocks = list(matrix.blocks())
+        assert matrix.block_rows == 7
+        assert all(len(block) <= 7 for _, block in blocks)
+        np.testing.assert_array_equal(np.vstack([block for _, block in blocks]), A)
+        assert matrix.bytes_read == A.nbytes
+
+    def test_products_and_dominance(self, mapped):
+        """Test matvec, diagonal and dominance match the in-memory matrix"""
+        A, data = mapped
+        matrix = MemmapMatrix(data, memory_budget=1000)
+        x = np.arange(60, dtype=float)
+
+        np.testing.assert_allclose(matrix @ x, A @ x)
+        np.testing.assert_allclose(matrix.diagonal(), np.diag(A))
+        assert analyze_dominance(matrix)['is_strict']
+
+    def test_invalid_arguments(self, mapped):
+        """Test non-square matrices and empty budgets raise errors"""
+        _, data = mapped
+        with pytest.raises(ValueError):
+            MemmapMatrix(data[:10])
+        with pytest.raises(ValueError):
+            MemmapMatrix(data, memory_budget=0)
+
+
+class TestOutOfCoreSolve:
+    """Test cases for solving with a memory-mapped matrix"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.solver = GaussSeidelSolver()
+
+    def test_matches_in_memory_solve(self, mapped):
+        """Test the blocked sweep gives the same iterates and reports bytes read"""
+        A, data = mapped
+        b = np.linspace(1, 2, 60)
+        self.solver.memory_budget = 16 * 60 * 8
+
+        out_of_core = self.solver.solve(data, b)
+        in_memory = self.solver.solve(A, b)
+
+        assert out_of_core['converged']
+        assert out_of_core['iterations'] == in_memory['iterations']
+        np.testing.assert_allclose(out_of_core['solution'], in_memory['solution'])
+        stats = out_of_core['out_of_core']
+        assert stats['block_rows'] == 16
+        assert stats['bytes_read_per_sweep'] == A.nbytes
+        assert stats['bytes_read'] == A.nbytes * out_of_core['iterations']
+        assert in_memory['out_of_core'] is None
+
+    def test_multiple_right_hand_sides(self, mapped):
+        """Test an (n, k) right-hand side with a memory-mapped matrix"""
+        A, data = mapped
+        B = np.column_stack([np.ones(60), np.arange(60.0)])
+
+        result = self.solver.solve(data, B)
+
+        assert result['converged']
+        np.testing.assert_allclose(result['solution'], np.linalg.solve(A, B), atol=1e-5)
+
+    def test_multicolor_requires_in_memory_matrix(self, mapped):
+        """Test the multicolor ordering rejects memory-mapped matrices"""
+        _, data = mapped
+        self.solver.ordering = 'multicolor'
+        with pytest.raises(ValueError):
+            self.solver.solve(data, np.ones(60))
+
+    def test_session_key_does_not_read_matrix(self, mapped):
+        """Test sessions identify mapped matrices by file instead of content"""
+        _, data = mapped
+        key = GaussSeidelSession.matrix_key(data)
+
+        assert key == GaussSeidelSession.matrix_key(MemmapMatrix(data))
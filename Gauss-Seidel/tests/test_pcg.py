@@ -0,0 +1,107 @@
+"""Tests for the conjugate gradient solver preconditioned with symmetric Gauss-Seidel"""
+
+import numpy as np
+import pytest
+from solver.block import BlockGaussSeidelSolver
+from solver.gauss_seidel import GaussSeidelSolver
+from solver.pcg import ConjugateGradientSolver
+from solver.sparse import CSRMatrix
+from tests.matrices import poisson_2d
+
+
+class TestConjugateGradientSolver:
+    """Test cases for ConjugateGradientSolver"""
+
+    def setup_method(self):
+        """Setup for each test"""
+        self.solver = ConjugateGradientSolver()
+        self.A = poisson_2d(12).toarray()
+        self.b = np.ones(144)
+
+    def test_matches_direct_solution(self):
+        """Test PCG solves an SPD system, dense and sparse"""
+        expected = np.linalg.solve(self.A, self.b)
+        for matrix in (self.A, CSRMatrix.from_dense(self.A)):
+            result = self.solver.solve(matrix, self.b)
+
+            assert result['converged']
+            assert result['status'] == 'converged'
+            np.testing.assert_allclose(result['solution'], expected, atol=1e-5)
+
+    def test_result_shape_matches_gauss_seidel(self):
+        """Test the result dict has the keys callers use from GaussSeidelSolver"""
+        result = self.solver.solve(self.A, self.b)
+        gauss_seidel = GaussSeidelSolver().solve(self.A, self.b)
+
+        for key in ('solution', 'iterations', 'converged', 'status', 'final_error', 'history',
+                    'history_iterations', 'errors'):
+            assert key in result and key in gauss_seidel
+        assert len(result['errors']) == result['iterations']
+        assert result['history'].shape == (result['iterations'] + 1, 144)
+
+    def test_preconditioner_reduces_iterations(self):
+        """Test symmetric Gauss-Seidel preconditioning beats plain CG and Gauss-Seidel"""
+        preconditioned = self.solver.solve(self.A, self.b)
+        self.solver.preconditioner = None
+        plain = self.solver.solve(self.A, self.b)
+        gauss_seidel = GaussSeidelSolver()
+        gauss_seidel.max_iterations = 5000
+        standalone = gauss_seidel.solve(self.A, self.b)
+
+        assert preconditioned['iterations'] < plain['iterations']
+        assert preconditioned['iterations'] * 10 < standalone['iterations']
+
+    def test_block_smoother(self):
+        """Test a block Gauss-Seidel smoother can serve as the preconditioner"""
+        solver = ConjugateGradientSolver(BlockGaussSeidelSolver(block_size=4))
+        result = solver.solve(self.A, self.b)
+
+        assert result['converged']
+        np.testing.assert_allclose(result['solution'], np.linalg.solve(self.A, self.b), atol=1e-5)
+
+    def test_breakdown_on_indefinite_matrix(self):
+        """Test an indefinite matrix stops with the 'breakdown' status"""
+        self.solver.preconditioner = None
+        result = self.solver.solve(np.array([[1.0, 2.0], [2.0, 1.0]]), np.array([1.0, -1.0]))
+
+        assert result['status'] == 'breakdown'
+        assert not result['converged']
+
+    def test_exact_initial_guess(self):
+        """Test an exact initial guess converges without iterating"""
+        x = np.linalg.solve(self.A, self.b)
+        result = self.solver.solve(self.A, self.A @ x, x0=x)
+
+        assert result['converged']
+        assert result['iterations'] == 0
+
+    def test_invalid_configuration(self):
+        """Test unknown preconditioners, automatic omega and several right-hand sides raise errors"""
+        self.solver.preconditioner = 'jacobi'
+        with pytest.raises(ValueError):
+            self.solver.solve(self.A, self.b)
+
+        self.solver.preconditioner = 'sgs'
+        self.solver.smoother.omega = 'auto'
+        with pytest.raises(ValueError):
+            self.solver.solve(self.A, self.b)
+
+        self.solver.smoother.omega = 1.0
+        with pytest.raises(ValueError):
+            self.solver.solve(self.A, np.ones((144, 2)))
+
+    def test_step_by_step_format(self):
+        """Test generate_step_by_step returns the same step types as Gauss-Seidel"""
+        A = np.array([[4, 1], [1, 3]], dtype=float)
+        b = np.array([1, 2], dtype=float)
+
+        steps = self.solver.generate_step_by_step(A, b)
+
+        assert [step['type'] for step in steps[:2]] == ['system', 'method']
+        assert steps[-1]['type'] == 'result'
+        assert steps[-1]['converged']
+        assert steps[-1]['verification']['total_residual'] < 1e-5
+        iteration = steps[2]
+        assert iteration['type'] == 'iteration'
+        assert len(iteration['calculations']) == 2
+        assert iteration['calculations'][0]['result'] == iteration['solution'][0]
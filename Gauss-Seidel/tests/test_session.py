@@ -0,0 +1,81 @@
+"""Tests for warm-start solving"""
+
+import numpy as np
+import pytest
+from solver.gauss_seidel import GaussSeidelSolver
+from solver.session import GaussSeidelSession
+from solver.sparse import CSRMatrix
+
+
+def system(n=25):
+    """Diagonally dominant tridiagonal system"""
+    A = 2.2 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    return A, np.sin(np.linspace(0, 3, n))
+
+
+class TestInitialGuess:
+    """Test cases for the x0 argument of solve"""
+
+    def test_exact_guess_converges_immediately(self):
+        """Test starting from the solution needs a single sweep"""
+        A, b = system()
+        solver = GaussSeidelSolver()
+        x0 = np.linalg.solve(A, b)
+
+        result = solver.solve(A, b, x0=x0)
+
+        assert result['iterations'] == 1
+        np.testing.assert_array_equal(result['history'][0], x0)
+
+    def test_guess_is_not_modified(self):
+        """Test the caller's x0 array is copied"""
+        A, b = system()
+        x0 = np.ones(len(b))
+        GaussSeidelSolver().solve(A, b, x0=x0)
+
+        np.testing.assert_array_equal(x0, np.ones(len(b)))
+
+    def test_wrong_shape(self):
+        """Test x0 with the wrong shape is rejected"""
+        A, b = system()
+        with pytest.raises(ValueError):
+            GaussSeidelSolver().solve(A, b, x0=np.zeros(3))
+
+
+class TestSession:
+    """Test cases for GaussSeidelSession"""
+
+    def test_warm_start_saves_sweeps(self):
+        """Test nearby right-hand sides reuse the last solution"""
+        A, b = system()
+        session = GaussSeidelSession()
+
+        cold = session.solve(A, b)
+        warm = session.solve(A, b + 1e-4)
+
+        assert not cold['warm_start']
+        assert cold['sweeps_saved'] == 0
+        assert warm['warm_start']
+        assert warm['cold_iterations'] == cold['iterations']
+        assert warm['sweeps_saved'] == cold['iterations'] - warm['iterations'] > 0
+        assert session.total_sweeps_saved == warm['sweeps_saved']
+        np.testing.assert_allclose(warm['solution'], np.linalg.solve(A, b + 1e-4), atol=1e-5)
+
+    def test_matrix_identity(self):
+        """Test equal matrices share state and different ones do not"""
+        A, b = system()
+        session = GaussSeidelSession()
+        session.solve(A, b)
+
+        assert session.solve(A.copy(), b)['warm_start']
+        assert session.solve(CSRMatrix.from_dense(A), b)['warm_start'] is False
+        assert session.solve(2 * A, b)['warm_start'] is False
+
+    def test_explicit_key_and_reset(self):
+        """Test user keys and reset"""
+        A, b = system()
+        session = GaussSeidelSession()
+        session.solve(A, b, key='step')
+        session.reset('step')
+
+        assert not session.solve(A, b, key='step')['warm_start']
@@ -2,7 +2,9 @@
 
 import numpy as np
 import pytest
+from unittest.mock import patch
 from solver.gauss_seidel import GaussSeidelSolver
+from solver.sparse import CSRMatrix
 
 
 class TestGaussSeidelSolver:
@@ -51,3 +53,310 @@ class TestGaussSeidelSolver:
         assert len(steps) > 0
         assert any(step['type'] == 'system' for step in steps)
         assert any(step['type'] == 'result' for step in steps)
+
+    def test_sweep_matches_reference_loop(self):
+        """Test vectorized sweep gives the same iterate as the scalar loop"""
+        rng = np.random.default_rng(1)
+        n = 12
+        A = rng.uniform(-1, 1, size=(n, n))
+        A[np.diag_indices(n)] = np.abs(A).sum(axis=1) + 1
+        b = rng.uniform(-5, 5, size=n)
+
+        x_ref = np.zeros(n)
+        for i in range(n):
+            sum1 = sum(A[i][j] * x_ref[j] for j in range(i))
+            sum2 = sum(A[i][j] * x_ref[j] for j in range(i + 1, n))
+            x_ref[i] = (b[i] - sum1 - sum2) / A[i][i]
+
+        x = np.zeros(n)
+        GaussSeidelSolver._sweep(A, b, x)
+
+        np.testing.assert_allclose(x, x_ref, rtol=1e-12, atol=1e-14)
+
+    def test_matches_direct_solution_3x3(self):
+        """Test the README 3x3 example converges to the direct solution"""
+        A = np.array([[10, -1, 2], [-1, 11, -1], [2, -1, 10]], dtype=float)
+        b = np.array([6, 25, -11], dtype=float)
+
+        result = self.solver.solve(A, b)
+
+        assert result['converged']
+        np.testing.assert_allclose(result['solution'], np.linalg.solve(A, b), atol=1e-5)
+
+    def test_sor_reduces_iterations(self):
+        """Test over-relaxation converges faster on a 1-D Poisson system"""
+        n = 30
+        A = 2 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+        b = np.ones(n)
+        self.solver.max_iterations = 5000
+
+        plain = self.solver.solve(A, b)
+        self.solver.omega = 1.8
+        relaxed = self.solver.solve(A, b)
+
+        assert plain['omega'] == 1.0
+        assert relaxed['converged']
+        assert relaxed['omega'] == 1.8
+        assert relaxed['iterations'] < plain['iterations']
+
+    def test_sor_auto_omega(self):
+        """Test automatic omega is estimated from the contraction rate"""
+        n = 30
+        A = 2 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+        b = np.ones(n)
+        self.solver.max_iterations = 5000
+
+        plain = self.solver.solve(A, b)
+        self.solver.omega = 'auto'
+        result = self.solver.solve(A, b)
+
+        assert result['converged']
+        assert 1.0 < result['omega'] < 2.0
+        assert result['iterations'] < plain['iterations']
+        np.testing.assert_allclose(result['solution'], np.linalg.solve(A, b), atol=1e-3)
+
+    def test_invalid_omega(self):
+        """Test omega outside (0, 2) is rejected"""
+        self.solver.omega = 2.5
+        with pytest.raises(ValueError):
+            self.solver.solve(np.eye(2), np.ones(2))
+
+    def test_step_by_step_solves_once(self):
+        """Test step-by-step reuses the sums recorded during the real sweep"""
+        A = np.array([[10, -1, 2], [-1, 11, -1], [2, -1, 10]], dtype=float)
+        b = np.array([6, 25, -11], dtype=float)
+
+        with patch.object(self.solver, 'solve', wraps=self.solver.solve) as spy:
+            steps = self.solver.generate_step_by_step(A, b)
+        assert spy.call_count == 1
+
+        iterations = [s for s in steps if s['type'] == 'iteration']
+        for step in iterations:
+            x_old, x_new = step['previous_solution'], step['solution']
+            for calc in step['calculations']:
+                j = calc['variable']
+                assert calc['sum1'] == pytest.approx(A[j, :j] @ x_new[:j])
+                assert calc['sum2'] == pytest.approx(A[j, j + 1:] @ x_old[j + 1:])
+                assert calc['formula'].endswith(f'{x_new[j]:.6f}')
+
+    def test_multiple_right_hand_sides(self):
+        """Test an (n, k) B is solved column by column in one run"""
+        n = 20
+        A = 3 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+        # the zero column converges in the first sweep and is frozen
+        B = np.column_stack([np.ones(n), np.zeros(n), np.linspace(-5, 5, n)])
+
+        result = self.solver.solve(A, B)
+
+        assert result['converged']
+        assert result['solution'].shape == (n, 3)
+        np.testing.assert_allclose(result['solution'], np.linalg.solve(A, B), atol=1e-5)
+        assert result['column_iterations'][1] == 1
+        assert result['column_iterations'].max() == result['iterations']
+        assert np.all(result['column_errors'] < self.solver.tolerance)
+
+        # each column matches an independent single solve
+        single = self.solver.solve(A, B[:, 2])
+        assert result['column_iterations'][2] == single['iterations']
+        np.testing.assert_allclose(result['solution'][:, 2], single['solution'], atol=1e-12)
+
+    def test_solve_batch(self):
+        """Test many small systems are solved together, in chunks"""
+        rng = np.random.default_rng(3)
+        m, n = 50, 4
+        A = rng.uniform(-1, 1, size=(m, n, n))
+        A[:, np.arange(n), np.arange(n)] = np.abs(A).sum(axis=2) + 1
+        b = rng.uniform(-1, 1, size=(m, n))
+        # a non-convergent system should not block the others
+        A[7] = np.array([[1, 3, 0, 0], [3, 1, 0, 0], [0, 0, 1, 3], [0, 0, 3, 1]], dtype=float)
+
+        result = self.solver.solve_batch(A, b, chunk_size=16)
+
+        expected = np.linalg.solve(A, b[..., None])[..., 0]
+        mask = np.ones(m, dtype=bool)
+        mask[7] = False
+        assert result['converged'][mask].all()
+        assert not result['converged'][7]
+        assert not result['diagonally_dominant'][7]
+        assert result['iterations'][7] == self.solver.max_iterations
+        np.testing.assert_allclose(result['solution'][mask], expected[mask], atol=1e-5)
+
+        # same iterates as an individual solve
+        single = self.solver.solve(A[3], b[3])
+        assert result['iterations'][3] == single['iterations']
+        np.testing.assert_allclose(result['solution'][3], single['solution'], atol=1e-12)
+
+    def test_solve_batch_invalid_shapes(self):
+        """Test mismatched batch shapes are rejected"""
+        with pytest.raises(ValueError):
+            self.solver.solve_batch(np.zeros((2, 3, 3)), np.zeros((2, 4)))
+
+    def test_verify_solution_numeric(self):
+        """Test fast verification returns residual vector and norms"""
+        A = np.array([[4, 1], [1, 3]], dtype=float)
+        b = np.array([1, 2], dtype=float)
+        x = np.array([0.1, 0.6])
+
+        data = self.solver.verify_solution(A, b, x)
+
+        np.testing.assert_allclose(data['ax_values'], A @ x)
+        np.testing.assert_allclose(data['residual_vector'], A @ x - b)
+        assert data['total_residual'] == pytest.approx(np.linalg.norm(A @ x - b))
+        assert data['max_residual'] == pytest.approx(np.max(np.abs(A @ x - b)))
+        assert 'equations' not in data
+
+    def test_verification_text_is_lazy(self):
+        """Test equation strings are only built for the rows accessed"""
+        n = 200
+        A = 3 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+        b = np.ones(n)
+        x = np.linalg.solve(A, b)
+
+        with patch.object(self.solver, '_verify_equation', wraps=self.solver._verify_equation) as spy:
+            data = self.solver._verify_solution(A, b, x)
+            assert spy.call_count == 0
+            equations = data['equations']
+            first = equations[0]
+            assert len(equations) == n
+            assert spy.call_count == 1
+
+        assert first['equation_number'] == 1
+        assert first['original_equation'] == "3.000x1 - x2 = 1.000"
+        assert first['is_accurate']
+        assert equations[-1]['equation_number'] == n
+
+    def test_divergence_aborts_early(self):
+        """Test a diverging iteration stops with the 'diverging' status"""
+        A = np.array([[1, 4], [4, 1]], dtype=float)
+        b = np.array([1, 2], dtype=float)
+        self.solver.max_iterations = 1000
+
+        result = self.solver.solve(A, b)
+
+        assert result['status'] == 'diverging'
+        assert not result['converged']
+        assert result['iterations'] < 20
+        assert result['spectral_radius_estimate'] > 1
+        assert result['predicted_remaining_iterations'] is None
+
+    def test_predicted_remaining_iterations(self):
+        """Test the spectral radius estimate predicts the sweeps left to converge"""
+        n = 30
+        A = 2 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+        b = np.ones(n)
+        self.solver.max_iterations = 200
+
+        partial = self.solver.solve(A, b)
+        assert partial['status'] == 'max_iterations'
+        assert 0 < partial['spectral_radius_estimate'] < 1
+
+        self.solver.max_iterations = 5000
+        full = self.solver.solve(A, b)
+        assert full['status'] == 'converged'
+        assert full['predicted_remaining_iterations'] == 0
+
+        predicted = 200 + partial['predicted_remaining_iterations']
+        assert abs(predicted - full['iterations']) <= 0.05 * full['iterations']
+
+    def test_symmetric_sweep(self):
+        """Test symmetric mode runs a forward then a backward sweep per iteration"""
+        n = 12
+        A = 3 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1) + 0.5 * np.eye(n, k=3) + 0.5 * np.eye(n, k=-3)
+        b = np.arange(1, n + 1, dtype=float)
+        self.solver.symmetric = True
+        self.solver.max_iterations = 1
+
+        x = np.zeros(n)
+        for i in list(range(n)) + list(range(n - 1, -1, -1)):
+            x[i] = (b[i] - A[i] @ x + A[i, i] * x[i]) / A[i, i]
+
+        for matrix in (A, CSRMatrix.from_dense(A)):
+            result = self.solver.solve(matrix, b)
+            np.testing.assert_allclose(result['solution'], x)
+
+    def test_symmetric_step_by_step_is_consistent(self):
+        """Test the step-by-step sums reproduce the values of a symmetric iteration"""
+        A = np.array([[4, 1, 1], [1, 5, 2], [1, 2, 6]], dtype=float)
+        b = np.array([1, 2, 3], dtype=float)
+        self.solver.symmetric = True
+
+        self.solver.generate_step_by_step(A, b)
+        for record in self.solver.step_records:
+            values = (b - record['sums'][:, 0] - record['sums'][:, 1]) / np.diag(A)
+            np.testing.assert_allclose(values, record['solution'])
+
+    @pytest.mark.parametrize("omega", [0.7, 1.3])
+    def test_symmetric_sor_step_by_step_is_consistent(self, omega):
+        """Test symmetric SOR steps relax the backward sweep against the forward-sweep values"""
+        A = np.array([[4, 1, 1], [1, 5, 2], [1, 2, 6]], dtype=float)
+        b = np.array([1, 2, 3], dtype=float)
+        self.solver.symmetric = True
+        self.solver.omega = omega
+
+        steps = self.solver.generate_step_by_step(A, b)
+        iterations = [step for step in steps if step['type'] == 'iteration']
+        assert len(iterations) == len(self.solver.step_records) > 0
+        for step, record in zip(iterations, self.solver.step_records):
+            values = (b - record['sums'][:, 0] - record['sums'][:, 1]) / np.diag(A)
+            base = record['forward_solution']
+            np.testing.assert_allclose(base + omega * (values - base), record['solution'])
+            for j, calculation in enumerate(step['calculations']):
+                assert (f'{base[j]:.6f} + w * ({values[j]:.6f} - {base[j]:.6f}) = {record["solution"][j]:.6f}'
+                        in calculation['formula'])
+
+    def test_symmetric_converges_faster(self):
+        """Test symmetric iterations reach the tolerance in fewer iterations on an SPD system"""
+        n = 20
+        A = 2 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+        b = np.ones(n)
+        self.solver.max_iterations = 5000
+
+        forward = self.solver.solve(A, b)
+        self.solver.symmetric = True
+        symmetric = self.solver.solve(A, b)
+
+        assert symmetric['converged']
+        assert symmetric['iterations'] < forward['iterations']
+
+    def test_mixed_precision_reaches_double_accuracy(self):
+        """Test float32 sweeps with float64 refinement reach the float64 tolerance"""
+        rng = np.random.default_rng(0)
+        n = 80
+        A = rng.random((n, n))
+        A += np.diag(A.sum(axis=1) * 0.6 + 1)
+        b = rng.random(n)
+        self.solver.precision = 'mixed'
+        self.solver.tolerance = 1e-10
+
+        result = self.solver.solve(A, b)
+
+        assert result['converged']
+        assert result['precision'] == 'mixed'
+        assert result['solution'].dtype == np.float64
+        np.testing.assert_allclose(result['solution'], np.linalg.solve(A, b), atol=1e-9)
+        sweeps = result['sweeps_by_precision']
+        assert sweeps['float32'] == result['iterations'] == len(result['errors'])
+        assert 1 < sweeps['float64'] < sweeps['float32']
+
+    def test_double_precision_reports_sweeps(self):
+        """Test the default path reports all of its sweeps as float64"""
+        A = np.array([[4, 1], [1, 3]], dtype=float)
+        result = self.solver.solve(A, np.array([1, 2], dtype=float))
+
+        assert result['precision'] == 'double'
+        assert result['sweeps_by_precision'] == {'float32': 0, 'float64': result['iterations']}
+
+    def test_mixed_precision_invalid_inputs(self):
+        """Test unsupported precisions and inputs raise errors"""
+        A = np.array([[4, 1], [1, 3]], dtype=float)
+        b = np.array([1, 2], dtype=float)
+
+        self.solver.precision = 'half'
+        with pytest.raises(ValueError):
+            self.solver.solve(A, b)
+
+        self.solver.precision = 'mixed'
+        with pytest.raises(ValueError):
+            self.solver.solve(CSRMatrix.from_dense(A), b)
+        with pytest.raises(ValueError):
+            self.solver.solve(A, np.ones((2, 2)))
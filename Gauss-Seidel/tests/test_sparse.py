@@ -0,0 +1,106 @@
+"""Tests for the CSR sparse path of the Gauss-Seidel solver"""
+
+import numpy as np
+import pytest
+from solver.gauss_seidel import GaussSeidelSolver
+from solver.sparse import CSRMatrix, as_csr
+from tests.matrices import poisson_1d
+
+
+class TestCSRMatrix:
+    """Test cases for CSRMatrix"""
+
+    def test_from_dense_roundtrip(self):
+        """Test dense -> CSR -> dense keeps the matrix"""
+        A = poisson_1d(6, diagonal=4.0)
+        csr = CSRMatrix.from_dense(A)
+
+        assert csr.nnz == 16
+        np.testing.assert_array_equal(csr.toarray(), A)
+        np.testing.assert_array_equal(csr.diagonal(), np.diag(A))
+
+    def test_matvec_and_row_sums(self):
+        """Test matvec and |A| row sums only over stored entries"""
+        A = poisson_1d(5, diagonal=4.0)
+        csr = CSRMatrix.from_dense(A)
+        x = np.arange(5, dtype=float)
+
+        np.testing.assert_allclose(csr @ x, A @ x)
+        np.testing.assert_allclose(csr.abs_row_sums(), np.abs(A).sum(axis=1))
+
+    def test_invalid_arrays(self):
+        """Test inconsistent CSR arrays are rejected"""
+        with pytest.raises(ValueError):
+            CSRMatrix([0, 1, 3], [0, 1], [1.0, 2.0])
+
+    def test_from_coo_sums_duplicates(self):
+        """Test repeated (row, col) triplets are summed"""
+        matrix = CSRMatrix.from_coo([1, 0, 1, 1], [2, 0, 2, 0], [1.0, 2.0, 3.0, 4.0], (2, 3))
+
+        np.testing.assert_array_equal(matrix.toarray(), [[2, 0, 0], [4, 0, 4]])
+
+    def test_transpose_and_matmat(self):
+        """Test the sparse transpose and product against dense NumPy"""
+        rng = np.random.default_rng(0)
+        dense_a = rng.random((6, 4)) * (rng.random((6, 4)) < 0.5)
+        dense_b = rng.random((4, 5)) * (rng.random((4, 5)) < 0.5)
+        a, b = CSRMatrix.from_dense(dense_a), CSRMatrix.from_dense(dense_b)
+
+        np.testing.assert_allclose(a.transpose().toarray(), dense_a.T)
+        np.testing.assert_allclose(a.matmat(b).toarray(), dense_a @ dense_b)
+        with pytest.raises(ValueError):
+            a.matmat(a)
+
+    def test_as_csr_dense_returns_none(self):
+        """Test dense input is not converted"""
+        assert as_csr(np.eye(3)) is None
+
+
+class TestSparseSolve:
+    """Test cases for solving with CSR input"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.solver = GaussSeidelSolver()
+
+    def test_sparse_matches_dense(self):
+        """Test CSR and dense inputs produce the same iterates"""
+        A = poisson_1d(20, diagonal=4.0)
+        b = np.linspace(-1, 1, 20)
+
+        dense = self.solver.solve(A, b)
+        sparse = self.solver.solve(CSRMatrix.from_dense(A), b)
+
+        assert sparse['converged']
+        assert sparse['iterations'] == dense['iterations']
+        np.testing.assert_allclose(sparse['solution'], dense['solution'], atol=1e-12)
+
+    def test_sparse_dominance_check(self):
+        """Test diagonal dominance on CSR input"""
+        assert self.solver._is_diagonally_dominant(CSRMatrix.from_dense(poisson_1d(4, diagonal=4.0)))
+        assert not self.solver._is_diagonally_dominant(CSRMatrix.from_dense(np.array([[1.0, 4.0], [4.0, 1.0]])))
+
+    def test_sparse_step_by_step(self):
+        """Test step-by-step generation and verification with CSR input"""
+        A = poisson_1d(4, diagonal=4.0)
+        b = np.ones(4)
+
+        steps = self.solver.generate_step_by_step(CSRMatrix.from_dense(A), b)
+        result = steps[-1]
+
+        assert result['converged']
+        assert result['verification']['total_residual'] < 1e-5
+        assert len(result['verification']['equations']) == 4
+
+    def test_sparse_multiple_right_hand_sides(self):
+        """Test CSR input with an (n, k) B, natural and multicolor order"""
+        A = poisson_1d(16, diagonal=4.0)
+        B = np.column_stack([np.ones(16), np.arange(16.0)])
+
+        for ordering in ('natural', 'multicolor'):
+            self.solver.ordering = ordering
+            self.solver.min_color_class_size = 2
+            result = self.solver.solve(CSRMatrix.from_dense(A), B)
+
+            assert result['converged']
+            np.testing.assert_allclose(result['solution'], np.linalg.solve(A, B), atol=1e-5)
@@ -67,3 +67,47 @@ class TestEquationValidator:
         assert 'vector' in result
         assert 'swaps_made' in result
         assert 'message' in result
+
+    def test_make_diagonally_dominant_finds_reordering(self):
+        """Test a dominant row ordering is found where a greedy swap search fails"""
+        A = np.array([[-2, -5, 8], [1, 7, -5], [1, 0, 0]], dtype=float)
+        b = np.array([1, 2, 3], dtype=float)
+
+        result = EquationValidator.make_diagonally_dominant(A, b)
+
+        assert result['success']
+        np.testing.assert_array_equal(result['matrix'], A[[2, 1, 0]])
+        np.testing.assert_array_equal(result['vector'], b[[2, 1, 0]])
+
+        # replaying the reported swaps reproduces the returned system
+        A_work, b_work = A.copy(), b.copy()
+        for i, j in result['swaps_made']:
+            A_work[[i, j]] = A_work[[j, i]]
+            b_work[[i, j]] = b_work[[j, i]]
+        np.testing.assert_array_equal(A_work, result['matrix'])
+        np.testing.assert_array_equal(b_work, result['vector'])
+
+    def test_make_diagonally_dominant_impossible(self):
+        """Test matrices without a dominant ordering are returned unchanged"""
+        A = np.array([[1, 1, 1], [1, 1, 1], [3, 1, 1]], dtype=float)
+        b = np.array([1, 2, 3], dtype=float)
+
+        result = EquationValidator.make_diagonally_dominant(A, b)
+
+        assert not result['success']
+        assert result['swaps_made'] == []
+        assert result['matrix'] is A
+
+    def test_make_diagonally_dominant_large(self):
+        """Test a shuffled 50x50 dominant system is restored"""
+        rng = np.random.default_rng(0)
+        n = 50
+        A = rng.uniform(-1, 1, size=(n, n))
+        A[np.diag_indices(n)] = np.abs(A).sum(axis=1) + 1
+        shuffle = rng.permutation(n)
+
+        result = EquationValidator.make_diagonally_dominant(A[shuffle], np.arange(n, dtype=float)[shuffle])
+
+        assert result['success']
+        np.testing.assert_array_equal(result['matrix'], A)
+        np.testing.assert_array_equal(result['vector'], np.arange(n, dtype=float))
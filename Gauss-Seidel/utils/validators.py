@@ -1,6 +1,8 @@
 import numpy as np
 from typing import List, Tuple, Optional, Dict
 
+from solver.dominance import analyze_dominance
+
 
 class EquationValidator:
     """
@@ -139,111 +141,62 @@ class EquationValidator:
             - vector: np.ndarray - vector reordenado (o original si no se pudo)
             - swaps_made: list[tuple] - lista de intercambios realizados
             - message: str - mensaje explicativo
+            - dominance: dict - analisis de dominancia de la matriz retornada
+              (ver solver.dominance.analyze_dominance), para pasarlo a
+              GaussSeidelSolver.solve y no volver a recorrer la matriz
         """
-        n = len(A)
-        # hacer copias para no modificar los originales
-        A_work = A.copy()
-        b_work = b.copy()
-        swaps_made = []
-
         # verificar si ya es diagonalmente dominante
-        if EquationValidator._is_diagonally_dominant_static(A_work):
+        analysis = analyze_dominance(A)
+        if analysis['is_strict']:
             return {
                 'success': True,
-                'matrix': A_work,
-                'vector': b_work,
+                'matrix': A.copy(),
+                'vector': b.copy(),
                 'swaps_made': [],
-                'message': 'la matriz ya es diagonalmente dominante'
+                'message': 'la matriz ya es diagonalmente dominante',
+                'dominance': analysis
             }
 
-        # intentar hacer diagonalmente dominante intercambiando filas
-        for i in range(n):
-            # verificar si la fila actual es diagonalmente dominante
-            diagonal_element = abs(A_work[i, i])
-            off_diagonal_sum = sum(abs(A_work[i, j]) for j in range(n) if j != i)
-
-            # si no es dominante, buscar una mejor fila
-            if diagonal_element <= off_diagonal_sum:
-                # buscar una fila que pueda mejorar la dominancia diagonal
-                best_row = -1
-                best_ratio = 0
-
-                # examinar filas restantes
-                for k in range(i + 1, n):
-                    # verificar si intercambiar con la fila k mejoraria la dominancia
-                    element_ki = abs(A_work[k, i])
-                    off_diag_k = sum(abs(A_work[k, j]) for j in range(n) if j != i)
-
-                    # calcular ratio de dominancia potencial
-                    if element_ki > 0 and off_diag_k > 0:
-                        ratio = element_ki / off_diag_k
-                        if ratio > best_ratio:
-                            best_ratio = ratio
-                            best_row = k
-
-                # si encontramos una fila mejor, intercambiar
-                if best_row != -1 and best_ratio > diagonal_element / off_diagonal_sum:
-                    # intercambiar filas en matriz y vector
-                    A_work[[i, best_row]] = A_work[[best_row, i]]
-                    b_work[[i, best_row]] = b_work[[best_row, i]]
-                    swaps_made.append((i, best_row))
-
-        # verificar si ahora es diagonalmente dominante
-        is_dominant = EquationValidator._is_diagonally_dominant_static(A_work)
-
-        if is_dominant:
+        # buscar la permutacion optima de filas como un problema de asignacion
+        best_A, best_b, best_swaps = EquationValidator._find_best_permutation(A, b)
+
+        best_analysis = analyze_dominance(best_A)
+        if best_analysis['is_strict']:
             return {
                 'success': True,
-                'matrix': A_work,
-                'vector': b_work,
-                'swaps_made': swaps_made,
-                'message': f'matriz hecha diagonalmente dominante intercambiando {len(swaps_made)} fila(s)'
+                'matrix': best_A,
+                'vector': best_b,
+                'swaps_made': best_swaps,
+                'message': f'matriz hecha diagonalmente dominante intercambiando {len(best_swaps)} fila(s)',
+                'dominance': best_analysis
             }
-        else:
-            # intentar estrategia mas agresiva: buscar la mejor permutacion posible
-            best_A, best_b, best_swaps = EquationValidator._find_best_permutation(A, b)
-
-            if EquationValidator._is_diagonally_dominant_static(best_A):
-                return {
-                    'success': True,
-                    'matrix': best_A,
-                    'vector': best_b,
-                    'swaps_made': best_swaps,
-                    'message': f'matriz optimizada para dominancia diagonal con {len(best_swaps)} intercambio(s)'
-                }
-            else:
-                # no se pudo optimizar, devolver originales
-                return {
-                    'success': False,
-                    'matrix': A,  # devolver matriz original
-                    'vector': b,  # devolver vector original
-                    'swaps_made': [],
-                    'message': 'no es posible hacer la matriz diagonalmente dominante intercambiando filas'
-                }
+
+        # no se pudo optimizar, devolver originales
+        return {
+            'success': False,
+            'matrix': A,  # devolver matriz original
+            'vector': b,  # devolver vector original
+            'swaps_made': [],
+            'message': 'no es posible hacer la matriz diagonalmente dominante intercambiando filas',
+            'dominance': analysis
+        }
 
     @staticmethod
     def _is_diagonally_dominant_static(A: np.ndarray) -> bool:
         """verifica si la matriz es diagonalmente dominante (version estatica)"""
-        n = len(A)
-        # verificar cada fila de la matriz
-        for i in range(n):
-            # elemento diagonal
-            diagonal = abs(A[i, i])
-            # suma de elementos fuera de la diagonal
-            off_diagonal_sum = sum(abs(A[i, j]) for j in range(n) if i != j)
-            # verificar condicion de dominancia: |a_ii| > suma(|a_ij|)
-            if diagonal <= off_diagonal_sum:
-                return False
-        return True
+        return analyze_dominance(A)['is_strict']
 
     @staticmethod
     def _find_best_permutation(A: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray, List[Tuple]]:
         """
         encuentra la mejor permutacion de filas para maximizar la dominancia diagonal
-        usa un enfoque greedy optimizado
 
-        este metodo intenta todas las combinaciones posibles de intercambio de filas
-        para encontrar la configuracion que maximice la dominancia diagonal
+        se plantea como un problema de asignacion (fila k -> posicion i) sobre la
+        matriz de puntajes s_ki = |a_ki| / suma_j |a_kj|, calculada una sola vez con
+        numpy. la fila k es dominante en la posicion i si 2|a_ki| > suma_j |a_kj|.
+        el costo de asignacion prioriza primero el numero de filas dominantes y
+        despues el producto de los puntajes, asi que si existe un orden dominante
+        el metodo hungaro lo encuentra en tiempo O(n^3).
 
         args:
             A: matriz original
@@ -253,48 +206,93 @@ class EquationValidator:
             tuple con (matriz_optimizada, vector_optimizado, lista_intercambios)
         """
         n = len(A)
-        # hacer copias para trabajar
-        A_best = A.copy()
-        b_best = b.copy()
-        used_rows = set()
+        abs_A = np.abs(A)
+        row_sums = abs_A.sum(axis=1, keepdims=True)
+
+        # puntajes y mascara de dominancia estricta para cada (fila, posicion)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = np.where(row_sums > 0, abs_A / row_sums, 0.0)
+        dominant = 2 * abs_A > row_sums
+
+        # costo: penalizar posiciones no dominantes por encima de cualquier suma de logaritmos
+        log_cost = -np.log(np.maximum(scores, 1e-12))
+        penalty = (n + 1) * -np.log(1e-12)
+        cost = log_cost + penalty * ~dominant
+
+        # assignment[k] = posicion asignada a la fila k
+        assignment = _linear_sum_assignment(cost)
+        order = np.empty(n, dtype=int)
+        order[assignment] = np.arange(n)
+
+        # convertir la permutacion en la lista de intercambios equivalentes
+        current = list(range(n))
+        position = list(range(n))
         swaps_made = []
-
-        # para cada posicion diagonal, encontrar la mejor fila
         for i in range(n):
-            # saltar si ya procesamos esta fila
-            if i in used_rows:
-                continue
-
-            # empezar con la fila actual como la mejor
-            best_row = i
-            # calcular score de dominancia actual (evitar division por cero)
-            best_score = abs(A_best[i, i]) / (sum(abs(A_best[i, j]) for j in range(n) if j != i) + 1e-10)
-
-            # buscar en filas no usadas
-            for k in range(i + 1, n):
-                if k in used_rows:
-                    continue
-
-                # calcular score si ponemos la fila k en la posicion i
-                diagonal_val = abs(A[k, i])
-                off_diagonal_sum = sum(abs(A[k, j]) for j in range(n) if j != i)
-
-                # calcular ratio de dominancia
-                if off_diagonal_sum > 0:
-                    score = diagonal_val / off_diagonal_sum
-                    # si es mejor que el actual, actualizar
-                    if score > best_score:
-                        best_score = score
-                        best_row = k
-
-            # si encontramos una mejor fila, intercambiar
-            if best_row != i:
-                A_best[[i, best_row]] = A_best[[best_row, i]]
-                b_best[[i, best_row]] = b_best[[best_row, i]]
-                swaps_made.append((i, best_row))
-                used_rows.add(best_row)
-
-            # marcar fila actual como usada
-            used_rows.add(i)
-
-        return A_best, b_best, swaps_made
+            if current[i] != order[i]:
+                j = position[order[i]]
+                current[i], current[j] = current[j], current[i]
+                position[current[i]], position[current[j]] = i, j
+                swaps_made.append((i, j))
+
+        return A[order].copy(), b[order].copy(), swaps_made
+
+
+def _linear_sum_assignment(cost: np.ndarray) -> np.ndarray:
+    """
+    resuelve el problema de asignacion de costo minimo (metodo hungaro)
+
+    implementacion O(n^3) con caminos de aumento mas cortos y potenciales; el
+    ciclo interno sobre columnas esta vectorizado con numpy.
+
+    args:
+        cost: matriz cuadrada de costos finitos (filas x columnas)
+
+    returns:
+        arreglo con la columna asignada a cada fila
+    """
+    n = cost.shape[0]
+    # potenciales de filas (u) y columnas (v); la columna 0 es ficticia
+    u = np.zeros(n + 1)
+    v = np.zeros(n + 1)
+    # match[j] = fila (1..n) asignada a la columna j, 0 si esta libre
+    match = np.zeros(n + 1, dtype=int)
+    way = np.zeros(n + 1, dtype=int)
+
+    for row in range(1, n + 1):
+        match[0] = row
+        j0 = 0
+        min_v = np.full(n + 1, np.inf)
+        used = np.zeros(n + 1, dtype=bool)
+
+        # buscar un camino de aumento desde la fila nueva
+        while True:
+            used[j0] = True
+            i0 = match[j0]
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            free = ~used[1:]
+            improve = free & (reduced < min_v[1:])
+            min_v[1:][improve] = reduced[improve]
+            way[1:][improve] = j0
+
+            candidates = np.where(free, min_v[1:], np.inf)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+
+            u[match[used]] += delta
+            v[used] -= delta
+            min_v[~used] -= delta
+
+            j0 = j1
+            if match[j0] == 0:
+                break
+
+        # invertir el camino de aumento
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+
+    assignment = np.empty(n, dtype=int)
+    assignment[match[1:] - 1] = np.arange(n)
+    return assignment
@@ -0,0 +1,58 @@
+"""
+Configuración de pytest para correr desde la raíz las pruebas de todos los proyectos
+
+Cada carpeta (Biseccion, Frenado, Gauss-Seidel, ...) es una aplicación
+independiente que se ejecuta desde su propia carpeta, así que todas definen
+paquetes de nivel superior con el mismo nombre (solver, utils, tests, gui).
+Antes de recolectar o ejecutar las pruebas de un proyecto se activa su
+carpeta: queda como la única carpeta de proyecto en sys.path y en
+sys.modules solo quedan sus propios paquetes (los del proyecto anterior se
+guardan aparte y se restauran al volver a él).
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# Paquetes de nivel superior que cada proyecto define por su cuenta
+PROJECT_PACKAGES = {'solver', 'utils', 'tests', 'gui'}
+
+# Módulos de cada proyecto inactivo, por carpeta del proyecto
+_saved_modules = {}
+# Carpeta del proyecto activo (None: ninguno)
+_active = None
+
+
+def _project_of(path) -> str:
+    """Carpeta del proyecto que contiene path, o None si path no está dentro de un proyecto"""
+    first = os.path.relpath(os.path.abspath(str(path)), ROOT).split(os.sep)[0]
+    project = os.path.join(ROOT, first)
+    if first in (os.curdir, os.pardir) or not os.path.isdir(project):
+        return None
+    return project
+
+
+def _activate(project: str) -> None:
+    """Deja project primero en sys.path, sin las demás carpetas de proyecto, y con sus propios módulos"""
+    global _active
+    if project is None or project == _active:
+        return
+    if _active is not None:
+        _saved_modules[_active] = {name: sys.modules.pop(name) for name in list(sys.modules)
+                                   if name.split('.')[0] in PROJECT_PACKAGES}
+    sys.modules.update(_saved_modules.pop(project, {}))
+    # Un paquete regular de otro proyecto en sys.path taparía a un paquete de espacio de nombres de este
+    sys.path[:] = [entry for entry in sys.path if os.path.abspath(entry) != _project_of(entry)]
+    sys.path.insert(0, project)
+    _active = project
+
+
+def pytest_collectstart(collector):
+    _activate(_project_of(collector.path))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    _activate(_project_of(item.path))